@@ -195,6 +195,18 @@ class AnalyticsService:
         
         return self.track_event('game_end', event_data)
     
+    def track_latency(self, summary):
+        """
+        Track aggregated input latency for a screen.
+        
+        Args:
+            summary (dict): Latency percentiles from the latency monitor
+            
+        Returns:
+            bool: True if the event was tracked, False otherwise
+        """
+        return self.track_event('input_latency', dict(summary))
+    
     def track_level_start(self, game_id, level_id):
         """
         Track a level start event.
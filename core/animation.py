@@ -0,0 +1,269 @@
+"""
+SoulCoreLegacy Arcade - Animation Scheduler
+-------------------------------------------
+This module runs UI tweens from one shared frame clock. Elements start a
+tween on one of their attributes and the scheduler advances every running
+tween once per frame, so the clock is read once per frame and elements
+that are not animating cost nothing.
+"""
+
+import time
+
+def ease_linear(progress):
+    """
+    Linear easing.
+    
+    Args:
+        progress (float): Progress between 0 and 1
+    
+    Returns:
+        float: The eased progress
+    """
+    return progress
+
+def ease_out_quad(progress):
+    """
+    Quadratic ease-out: fast start, smooth stop.
+    
+    Args:
+        progress (float): Progress between 0 and 1
+    
+    Returns:
+        float: The eased progress
+    """
+    return progress * (2 - progress)
+
+class FrameClock:
+    """
+    Animation time source.
+    
+    The clock follows real time scaled by a factor and stands still while
+    paused. Tests can pause it and step it by hand with advance().
+    """
+    
+    def __init__(self, time_source=time.perf_counter):
+        """
+        Initialize the frame clock.
+        
+        Args:
+            time_source (callable): Function returning real time in seconds
+        """
+        self.time_source = time_source
+        self.last_real_time = time_source()
+        self.now = 0.0
+        self.scale = 1.0
+        self.paused = False
+    
+    def tick(self):
+        """
+        Move the clock to the current frame.
+        
+        Returns:
+            float: The animation time of this frame in seconds
+        """
+        real_time = self.time_source()
+        if not self.paused:
+            self.now += (real_time - self.last_real_time) * self.scale
+        self.last_real_time = real_time
+        return self.now
+    
+    def advance(self, seconds):
+        """
+        Step the clock forward by hand, whether or not it is paused.
+        
+        Args:
+            seconds (float): Animation time to add
+        """
+        self.now += seconds
+    
+    def pause(self):
+        """Stop animation time from following real time."""
+        self.paused = True
+    
+    def resume(self):
+        """Let animation time follow real time again, without a jump."""
+        self.paused = False
+        self.last_real_time = self.time_source()
+    
+    def set_scale(self, scale):
+        """
+        Set how fast animation time runs relative to real time.
+        
+        Args:
+            scale (float): Time scale; 1.0 is real time
+        """
+        self.scale = scale
+
+class AnimationScheduler:
+    """
+    Advances all running tweens from one frame timestamp.
+    
+    Running tweens are stored in parallel lists and removed by swapping the
+    last entry into the freed slot, so the lists only ever hold tweens that
+    are running. Starting a tween on an attribute that is already animating
+    retargets it from its current value.
+    """
+    
+    def __init__(self, clock=None):
+        """
+        Initialize the animation scheduler.
+        
+        Args:
+            clock (FrameClock): Time source; a real-time clock by default
+        """
+        self.clock = clock or FrameClock()
+        self.now = self.clock.now
+        
+        # Running tweens, one entry per list each
+        self.targets = []
+        self.attributes = []
+        self.start_values = []
+        self.end_values = []
+        self.deltas = []
+        self.start_times = []
+        self.durations = []
+        self.easings = []
+        self.callbacks = []
+        self.tween_lists = (
+            self.targets, self.attributes, self.start_values, self.end_values, self.deltas,
+            self.start_times, self.durations, self.easings, self.callbacks
+        )
+        
+        # Slot of each running tween keyed by (id(target), attribute)
+        self.slots = {}
+    
+    def __len__(self):
+        """Number of running tweens."""
+        return len(self.targets)
+    
+    def tween(self, target, attribute, end_value, duration, easing=ease_out_quad, on_complete=None):
+        """
+        Animate a numeric attribute from its current value to a new value.
+        
+        Args:
+            target (object): Object owning the attribute
+            attribute (str): Attribute name
+            end_value (float): Value at the end of the tween
+            duration (float): Length in seconds
+            easing (callable): Easing function taking and returning progress
+            on_complete (callable): Optional function called with no arguments when the tween ends
+        """
+        key = (id(target), attribute)
+        start_value = getattr(target, attribute)
+        
+        # Nothing to animate: settle immediately
+        if duration <= 0 or start_value == end_value:
+            self.cancel(target, attribute)
+            setattr(target, attribute, end_value)
+            if on_complete:
+                on_complete()
+            return
+        
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = len(self.targets)
+            self.targets.append(target)
+            self.attributes.append(attribute)
+            self.start_values.append(0.0)
+            self.end_values.append(0.0)
+            self.deltas.append(0.0)
+            self.start_times.append(0.0)
+            self.durations.append(0.0)
+            self.easings.append(None)
+            self.callbacks.append(None)
+        
+        self.start_values[slot] = start_value
+        self.end_values[slot] = end_value
+        self.deltas[slot] = end_value - start_value
+        self.start_times[slot] = self.now
+        self.durations[slot] = duration
+        self.easings[slot] = easing
+        self.callbacks[slot] = on_complete
+    
+    def is_running(self, target, attribute):
+        """
+        Check whether an attribute is being animated.
+        
+        Args:
+            target (object): Object owning the attribute
+            attribute (str): Attribute name
+        
+        Returns:
+            bool: True if a tween is running on the attribute
+        """
+        return (id(target), attribute) in self.slots
+    
+    def cancel(self, target, attribute):
+        """
+        Stop a tween, leaving the attribute at its current value.
+        
+        Args:
+            target (object): Object owning the attribute
+            attribute (str): Attribute name
+        """
+        slot = self.slots.get((id(target), attribute))
+        if slot is not None:
+            self._remove(slot)
+    
+    def tick(self):
+        """Read the frame clock once and advance every running tween."""
+        self.now = now = self.clock.tick()
+        if not self.targets:
+            return
+        
+        completed = []
+        for slot in range(len(self.targets) - 1, -1, -1):
+            progress = (now - self.start_times[slot]) / self.durations[slot]
+            target = self.targets[slot]
+            
+            if progress >= 1.0:
+                setattr(target, self.attributes[slot], self.end_values[slot])
+                if self.callbacks[slot]:
+                    completed.append(self.callbacks[slot])
+                self._remove(slot)
+            elif progress > 0.0:
+                setattr(target, self.attributes[slot],
+                        self.start_values[slot] + self.deltas[slot] * self.easings[slot](progress))
+        
+        # Callbacks run after the batch so they can start new tweens safely
+        for callback in completed:
+            callback()
+    
+    def clear(self):
+        """Stop every tween."""
+        for tween_list in self.tween_lists:
+            tween_list.clear()
+        self.slots.clear()
+    
+    def _remove(self, slot):
+        """
+        Remove a tween by moving the last tween into its slot.
+        
+        Args:
+            slot (int): Slot of the tween to remove
+        """
+        last = len(self.targets) - 1
+        del self.slots[(id(self.targets[slot]), self.attributes[slot])]
+        
+        if slot != last:
+            for tween_list in self.tween_lists:
+                tween_list[slot] = tween_list[last]
+            self.slots[(id(self.targets[slot]), self.attributes[slot])] = slot
+        
+        for tween_list in self.tween_lists:
+            tween_list.pop()
+
+# Shared scheduler instance
+_animation_scheduler = None
+
+def get_animation_scheduler():
+    """
+    Get the shared animation scheduler, creating it on first use.
+    
+    Returns:
+        AnimationScheduler: The shared scheduler
+    """
+    global _animation_scheduler
+    if _animation_scheduler is None:
+        _animation_scheduler = AnimationScheduler()
+    return _animation_scheduler
@@ -0,0 +1,264 @@
+"""
+SoulCoreLegacy Arcade - Background Cache
+----------------------------------------
+This module renders the static menu backgrounds from small specs and keeps
+the results in memory and in a disk cache, so that menus built on later
+runs load a finished image instead of drawing it again.
+"""
+
+import os
+import random
+import hashlib
+from collections import namedtuple
+import pygame
+
+# Bump when a renderer changes so stale files on disk are not reused
+BACKGROUND_RENDER_VERSION = 1
+
+# Disk cache location, next to the analytics local storage
+BACKGROUND_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.soulcorelegacy', 'cache', 'backgrounds')
+
+# Description of a background.
+#   kind: Renderer name ("gradient", "tech" or "grid")
+#   size: (width, height) in pixels
+#   colors: Tuple of RGB(A) colors the renderer uses, in renderer order
+#   seed: Seed for any random placement
+#   params: Tuple of extra renderer settings, in renderer order
+BackgroundSpec = namedtuple('BackgroundSpec', ['kind', 'size', 'colors', 'seed', 'params'], defaults=(0, ()))
+
+# Rendered backgrounds keyed by spec
+_background_cache = {}
+
+def get_background(spec):
+    """
+    Get the background described by a spec.
+    
+    Looks in memory, then on disk, and only renders when neither has it.
+    Newly rendered backgrounds are written to the disk cache.
+    
+    Args:
+        spec (BackgroundSpec): The background to get
+    
+    Returns:
+        pygame.Surface: The background in the display format when a display exists
+    """
+    background = _background_cache.get(spec)
+    if background is not None:
+        return background
+    
+    path = get_background_path(spec)
+    background = _load_background(path)
+    if background is None:
+        background = _RENDERERS[spec.kind](spec)
+        _save_background(background, path)
+    
+    background = _to_display_format(background)
+    _background_cache[spec] = background
+    return background
+
+def get_background_path(spec):
+    """
+    Get the disk cache path for a spec.
+    
+    Args:
+        spec (BackgroundSpec): The background spec
+    
+    Returns:
+        str: Path of the cached PNG file
+    """
+    digest = hashlib.sha1(repr((BACKGROUND_RENDER_VERSION, tuple(spec))).encode('utf-8')).hexdigest()[:16]
+    width, height = spec.size
+    return os.path.join(BACKGROUND_CACHE_DIR, f"{spec.kind}_{width}x{height}_{digest}.png")
+
+def clear_background_cache(remove_files=False):
+    """
+    Drop cached backgrounds.
+    
+    Args:
+        remove_files (bool): Whether to delete the disk cache as well
+    """
+    _background_cache.clear()
+    
+    if remove_files and os.path.isdir(BACKGROUND_CACHE_DIR):
+        for filename in os.listdir(BACKGROUND_CACHE_DIR):
+            if filename.endswith('.png'):
+                try:
+                    os.remove(os.path.join(BACKGROUND_CACHE_DIR, filename))
+                except OSError as e:
+                    print(f"Error removing cached background {filename}: {e}")
+
+def _load_background(path):
+    """
+    Load a background from the disk cache.
+    
+    Args:
+        path (str): Path of the cached file
+    
+    Returns:
+        pygame.Surface: The loaded surface, or None if it is not cached
+    """
+    if not os.path.exists(path):
+        return None
+    
+    try:
+        return pygame.image.load(path)
+    except pygame.error as e:
+        print(f"Error loading cached background {path}: {e}")
+        return None
+
+def _save_background(background, path):
+    """
+    Write a background to the disk cache.
+    
+    Args:
+        background (pygame.Surface): The rendered background
+        path (str): Path to write to
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # Write to a temporary file first so a crash never leaves a truncated cache entry
+        temp_path = path + '.tmp.png'
+        pygame.image.save(background, temp_path)
+        os.replace(temp_path, path)
+    except (pygame.error, OSError) as e:
+        print(f"Error saving cached background {path}: {e}")
+
+def _to_display_format(surface):
+    """
+    Convert a surface to the display pixel format if a display exists.
+    
+    Args:
+        surface (pygame.Surface): The surface to convert
+    
+    Returns:
+        pygame.Surface: The converted surface
+    """
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+def _draw_vertical_gradient(width, height, color_top, color_bottom):
+    """
+    Draw a vertical gradient.
+    
+    Each row gets one color, so the gradient is drawn as a single column
+    and stretched to the full width.
+    
+    Args:
+        width (int): The width of the gradient
+        height (int): The height of the gradient
+        color_top (tuple): The RGB color of the first row
+        color_bottom (tuple): The RGB color at the bottom
+    
+    Returns:
+        pygame.Surface: The gradient surface
+    """
+    column = pygame.Surface((1, height))
+    for y in range(height):
+        # Calculate color for this line
+        progress = y / height
+        column.set_at((0, y), tuple(
+            int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
+            for i in range(3)
+        ))
+    
+    return pygame.transform.scale(column, (width, height))
+
+def _render_gradient(spec):
+    """
+    Render a plain vertical gradient.
+    
+    Colors: (top, bottom)
+    
+    Args:
+        spec (BackgroundSpec): The background spec
+    
+    Returns:
+        pygame.Surface: The rendered background
+    """
+    width, height = spec.size
+    color_top, color_bottom = spec.colors
+    return _draw_vertical_gradient(width, height, color_top, color_bottom)
+
+def _render_tech(spec):
+    """
+    Render a gradient with a grid and random nodes and connections.
+    
+    Colors: (top, bottom, grid, node, connection)
+    
+    Args:
+        spec (BackgroundSpec): The background spec
+    
+    Returns:
+        pygame.Surface: The rendered background
+    """
+    width, height = spec.size
+    color_top, color_bottom, grid_color, node_color, connection_color = spec.colors
+    rng = random.Random(spec.seed)
+    
+    background = _draw_vertical_gradient(width, height, color_top, color_bottom)
+    
+    # Horizontal grid lines
+    for y in range(0, height, 40):
+        pygame.draw.line(background, grid_color, (0, y), (width, y))
+    
+    # Vertical grid lines
+    for x in range(0, width, 40):
+        pygame.draw.line(background, grid_color, (x, 0), (x, height))
+    
+    # Draw some "nodes" in the grid
+    for _ in range(30):
+        x = rng.randint(0, width)
+        y = rng.randint(0, height)
+        radius = rng.randint(1, 3)
+        pygame.draw.circle(background, node_color, (x, y), radius)
+    
+    # Draw some "connections" between nodes
+    for _ in range(15):
+        x1 = rng.randint(0, width)
+        y1 = rng.randint(0, height)
+        x2 = rng.randint(max(0, x1 - 200), min(width, x1 + 200))
+        y2 = rng.randint(max(0, y1 - 200), min(height, y1 + 200))
+        pygame.draw.line(background, connection_color, (x1, y1), (x2, y2), 1)
+    
+    return background
+
+def _render_grid(spec):
+    """
+    Render a gradient with a translucent grid blended over it.
+    
+    Colors: (top, bottom, grid RGBA)
+    Params: (grid cell size,)
+    
+    Args:
+        spec (BackgroundSpec): The background spec
+    
+    Returns:
+        pygame.Surface: The rendered background
+    """
+    width, height = spec.size
+    color_top, color_bottom, grid_color = spec.colors
+    grid_size, = spec.params
+    
+    background = _draw_vertical_gradient(width, height, color_top, color_bottom)
+    
+    grid_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    
+    # Horizontal grid lines
+    for y in range(0, height, grid_size):
+        pygame.draw.line(grid_surface, grid_color, (0, y), (width, y))
+    
+    # Vertical grid lines
+    for x in range(0, width, grid_size):
+        pygame.draw.line(grid_surface, grid_color, (x, 0), (x, height))
+    
+    background.blit(grid_surface, (0, 0))
+    return background
+
+# Renderers keyed by spec kind
+_RENDERERS = {
+    'gradient': _render_gradient,
+    'tech': _render_tech,
+    'grid': _render_grid
+}
@@ -0,0 +1,188 @@
+"""
+SoulCoreLegacy Arcade - Catalog Index
+-------------------------------------
+This module indexes the game catalog for search and filtering. Every game
+gets one bit position; words, categories and flags map to bitsets over
+those positions, so a query is a few integer ANDs instead of a scan of the
+catalog.
+"""
+
+import re
+
+# Words are runs of letters and digits, matched case-insensitively
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Boolean game fields that can be used as filters
+CATALOG_FLAGS = ("implemented", "featured", "new_release")
+
+# Result orders
+ORDER_CATALOG = "catalog"
+ORDER_POPULARITY = "popularity"
+
+# Cached query results kept before the cache is cleared
+RESULT_CACHE_SIZE = 256
+
+def tokenize(text):
+    """
+    Split text into lowercase search words.
+    
+    Args:
+        text (str): The text to split
+    
+    Returns:
+        list: The words in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+def iter_bits(bits):
+    """
+    Iterate the positions of the set bits of a bitset, lowest first.
+    
+    Args:
+        bits (int): The bitset
+    
+    Yields:
+        int: Position of each set bit
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+class CatalogIndex:
+    """
+    In-memory search index over a list of game dictionaries.
+    
+    Every prefix of every name and description word maps to the bitset of
+    the games containing a word with that prefix, so typing one more
+    character is a single dictionary lookup. Categories and the flags in
+    CATALOG_FLAGS have their own bitsets, and a popularity ranking is kept
+    for the popularity-sorted view.
+    """
+    
+    def __init__(self, games):
+        """
+        Build the index.
+        
+        Args:
+            games (list): Game dictionaries with at least "name"; "description",
+                "category", "popularity" and the CATALOG_FLAGS fields are optional
+        """
+        self.games = list(games)
+        self.all_bits = (1 << len(self.games)) - 1
+        
+        # Bitsets keyed by word prefix, category and flag
+        self.prefix_bits = {}
+        self.category_bits = {}
+        self.flag_bits = {flag: 0 for flag in CATALOG_FLAGS}
+        
+        for position, game in enumerate(self.games):
+            bit = 1 << position
+            
+            # Index every prefix of every distinct word once per game
+            words = set(tokenize(game.get("name", "")))
+            words.update(tokenize(game.get("description", "")))
+            prefixes = {word[:length] for word in words for length in range(1, len(word) + 1)}
+            for prefix in prefixes:
+                self.prefix_bits[prefix] = self.prefix_bits.get(prefix, 0) | bit
+            
+            category = game.get("category")
+            if category:
+                self.category_bits[category] = self.category_bits.get(category, 0) | bit
+            
+            for flag in CATALOG_FLAGS:
+                if game.get(flag, False):
+                    self.flag_bits[flag] |= bit
+        
+        # Positions from most to least popular; ties keep catalog order
+        self.by_popularity = sorted(
+            range(len(self.games)),
+            key=lambda position: -self.games[position].get("popularity", 0)
+        )
+        self.popularity_rank = [0] * len(self.games)
+        for rank, position in enumerate(self.by_popularity):
+            self.popularity_rank[position] = rank
+        
+        self.result_cache = {}
+    
+    @property
+    def categories(self):
+        """Category names in alphabetical order."""
+        return sorted(self.category_bits)
+    
+    def match(self, query="", category=None, flags=()):
+        """
+        Get the bitset of the games matching a query and filters.
+        
+        Every word of the query must be a prefix of a name or description
+        word; an empty query matches every game.
+        
+        Args:
+            query (str): Search text
+            category (str): Category to restrict to, or None for all
+            flags (iterable): Names from CATALOG_FLAGS that must be set
+        
+        Returns:
+            int: Bitset of matching game positions
+        """
+        bits = self.all_bits
+        
+        for word in tokenize(query):
+            bits &= self.prefix_bits.get(word, 0)
+            if not bits:
+                return 0
+        
+        if category is not None:
+            bits &= self.category_bits.get(category, 0)
+        
+        for flag in flags:
+            bits &= self.flag_bits.get(flag, 0)
+        
+        return bits
+    
+    def search(self, query="", category=None, flags=(), order=ORDER_CATALOG):
+        """
+        Get the games matching a query and filters.
+        
+        Args:
+            query (str): Search text
+            category (str): Category to restrict to, or None for all
+            flags (iterable): Names from CATALOG_FLAGS that must be set
+            order (str): ORDER_CATALOG or ORDER_POPULARITY
+        
+        Returns:
+            list: Matching game dictionaries; treat as read-only, results are cached
+        """
+        key = (" ".join(tokenize(query)), category, tuple(sorted(flags)), order)
+        results = self.result_cache.get(key)
+        if results is not None:
+            return results
+        
+        bits = self.match(query, category, flags)
+        if bits == self.all_bits and order == ORDER_POPULARITY:
+            positions = self.by_popularity
+        else:
+            positions = list(iter_bits(bits))
+            if order == ORDER_POPULARITY:
+                positions.sort(key=self.popularity_rank.__getitem__)
+        
+        results = [self.games[position] for position in positions]
+        
+        if len(self.result_cache) >= RESULT_CACHE_SIZE:
+            self.result_cache.clear()
+        self.result_cache[key] = results
+        return results
+    
+    def count(self, query="", category=None, flags=()):
+        """
+        Count the games matching a query and filters without listing them.
+        
+        Args:
+            query (str): Search text
+            category (str): Category to restrict to, or None for all
+            flags (iterable): Names from CATALOG_FLAGS that must be set
+        
+        Returns:
+            int: Number of matching games
+        """
+        return bin(self.match(query, category, flags)).count("1")
@@ -4,7 +4,7 @@ SoulCoreLegacy Arcade - Configuration
 This module contains global configuration settings for the SoulCoreLegacy Arcade.
 """
 
-# Screen settings
+# Screen settings (logical render resolution; games draw at this size)
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 SCREEN_TITLE = "SoulCoreLegacy Arcade"
@@ -97,3 +97,27 @@ GAME_LIST = [
 
 # Development mode (enables debug features)
 DEBUG_MODE = True
+
+# Visual quality governor settings
+QUALITY_WINDOW = 60  # Frames in the rolling frame time average
+QUALITY_DOWNGRADE_RATIO = 1.15  # Step down when the average exceeds the budget by this factor
+QUALITY_UPGRADE_RATIO = 0.6  # Step up when the average stays under the budget by this factor
+QUALITY_UPGRADE_DELAY = 3  # Windows of headroom needed before stepping up
+
+# Idle throttling settings
+IDLE_TIMEOUT = 15  # Seconds without input before ambient effects stop holding full frame rate
+IDLE_REDRAW_INTERVAL = 250  # Milliseconds between redraws while the shell is idle
+
+# Input latency telemetry settings
+LATENCY_SAMPLES = 1000  # Samples kept per screen
+LATENCY_REPORT_TO_ANALYTICS = False  # Send aggregated latency percentiles through the analytics service
+
+# Surface format audit settings
+SURFACE_AUDIT = DEBUG_MODE  # Check audited blit sites for surfaces not in the display format
+SURFACE_AUTO_CONVERT = True  # Convert flagged surfaces on their first blit and reuse the converted copy
+
+# Render scaling settings
+DISPLAY_SIZE = None  # Window size as (width, height); None for the render resolution, or the desktop when full screen
+FULLSCREEN = False  # Present full screen at the desktop resolution
+RENDER_SCALE_MODE = "auto"  # "auto", "scaled" (pygame.SCALED), "smooth", "integer" or "none"
+RENDER_SCALE_BUDGET = 0.25  # Fraction of the frame budget software smoothscale may take before integer scaling is used
@@ -6,7 +6,9 @@ This module manages the switching between the shell and individual games.
 
 import pygame
 import importlib
-from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, FPS, GAME_LIST
+from core.config import SCREEN_TITLE, FPS, GAME_LIST
+from core.latency_monitor import get_latency_monitor
+from core.render_scaler import get_render_scaler
 from shell.menu import ShellMenu
 
 class GameManager:
@@ -16,8 +18,9 @@ class GameManager:
     
     def __init__(self):
         """Initialize the game manager."""
-        # Set up the display
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Set up the display; games draw on the logical surface and the scaler presents it
+        self.scaler = get_render_scaler()
+        self.screen = self.scaler.create_display()
         pygame.display.set_caption(SCREEN_TITLE)
         
         # Set up the clock
@@ -33,6 +36,9 @@ class GameManager:
         # Dictionary to store loaded game modules
         self.game_modules = {}
         
+        # Input-to-photon latency, attributed to the current screen
+        self.latency_monitor = get_latency_monitor()
+        
         # Cloud services
         self.cloud_services = None
         
@@ -51,6 +57,7 @@ class GameManager:
         self.in_shell = True
         self.current_game = None
         self.shell.reset()
+        self._set_latency_screen("shell")
     
     def start_game(self, game_id):
         """
@@ -91,6 +98,7 @@ class GameManager:
             self.current_game = self.game_modules[game_id]
             self.in_shell = False
             self.current_game.reset()
+            self._set_latency_screen(game_id)
             
             # Track game start if analytics is available
             if self.cloud_services and 'analytics' in self.cloud_services:
@@ -107,6 +115,9 @@ class GameManager:
         Args:
             event (pygame.event.Event): The event to handle
         """
+        # Bring mouse positions into logical surface coordinates
+        self.scaler.map_event(event)
+        
         # Handle escape key to return to shell
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             if not self.in_shell:
@@ -131,15 +142,37 @@ class GameManager:
         elif self.current_game:
             self.current_game.update()
     
+    def is_idle(self):
+        """
+        Check whether the main loop can throttle.
+        
+        Returns:
+            bool: True if the shell is showing and nothing in it is animating
+        """
+        return self.in_shell and not self.shell.is_animating()
+    
     def render(self):
         """Render the current screen."""
+        # Screens may return the rects they changed instead of redrawing everything
+        dirty_rects = None
         if self.in_shell:
             self.shell.render(self.screen)
         elif self.current_game:
-            self.current_game.render(self.screen)
+            dirty_rects = self.current_game.render(self.screen)
+        
+        # Scale the frame to the window if needed and update the display
+        self.scaler.present(dirty_rects)
+        self.latency_monitor.frame_presented()
+    
+    def _set_latency_screen(self, screen):
+        """
+        Attribute latency samples to a new screen, reporting the last one.
         
-        # Update the display
-        pygame.display.flip()
+        Args:
+            screen (str): "shell" or a game ID
+        """
+        self.latency_monitor.report(self.get_cloud_service('analytics'))
+        self.latency_monitor.set_screen(screen)
     
     def get_cloud_service(self, service_name):
         """
@@ -0,0 +1,122 @@
+"""
+SoulCoreLegacy Arcade - GUI Theme Cache
+---------------------------------------
+This module loads pygame_gui theme files through a parsed cache, so later
+runs read a compact binary copy instead of parsing the JSON again until the
+theme file changes.
+"""
+
+import os
+import json
+import marshal
+import hashlib
+
+# Disk cache location, next to the cached backgrounds
+GUI_THEME_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.soulcorelegacy', 'cache', 'themes')
+
+# Bump when the cache layout changes so stale files are not reused
+GUI_THEME_CACHE_VERSION = 1
+
+# Parsed themes keyed by (path, mtime, size)
+_theme_cache = {}
+
+def load_gui_theme(path):
+    """
+    Load a pygame_gui theme file.
+    
+    Looks in memory, then in the disk cache, and only parses the JSON file
+    when neither matches its current modification time and size.
+    
+    Args:
+        path (str): Path to the theme JSON file
+    
+    Returns:
+        dict or str: The parsed theme for pygame_gui.UIManager, or the path
+        itself if the file could not be read, so pygame_gui reports the error
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        print(f"Error reading theme file {path}: {e}")
+        return path
+    
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    theme = _theme_cache.get(key)
+    if theme is not None:
+        return theme
+    
+    cache_path = get_gui_theme_cache_path(path)
+    theme = _load_cached_theme(cache_path, key)
+    if theme is None:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                theme = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error parsing theme file {path}: {e}")
+            return path
+        _save_cached_theme(cache_path, key, theme)
+    
+    _theme_cache[key] = theme
+    return theme
+
+def get_gui_theme_cache_path(path):
+    """
+    Get the disk cache path for a theme file.
+    
+    Args:
+        path (str): Absolute path to the theme file
+    
+    Returns:
+        str: Path of the cache file
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(GUI_THEME_CACHE_DIR, f"{name}_{digest}.bin")
+
+def _load_cached_theme(cache_path, key):
+    """
+    Load a parsed theme from the disk cache.
+    
+    Args:
+        cache_path (str): Path of the cache file
+        key (tuple): (path, mtime, size) the entry must match
+    
+    Returns:
+        dict: The parsed theme, or None if it is missing or stale
+    """
+    if not os.path.exists(cache_path):
+        return None
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            entry = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        print(f"Error loading cached theme {cache_path}: {e}")
+        return None
+    
+    if not isinstance(entry, dict) or entry.get('version') != GUI_THEME_CACHE_VERSION:
+        return None
+    if tuple(entry.get('key', ())) != key:
+        return None
+    return entry.get('theme')
+
+def _save_cached_theme(cache_path, key, theme):
+    """
+    Write a parsed theme to the disk cache.
+    
+    Args:
+        cache_path (str): Path to write to
+        key (tuple): (path, mtime, size) of the source file
+        theme (dict): The parsed theme
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        
+        # Write to a temporary file first so a crash never leaves a truncated cache entry
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            marshal.dump({'version': GUI_THEME_CACHE_VERSION, 'key': key, 'theme': theme}, f)
+        os.replace(temp_path, cache_path)
+    except (OSError, ValueError) as e:
+        print(f"Error saving cached theme {cache_path}: {e}")
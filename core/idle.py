@@ -0,0 +1,80 @@
+"""
+SoulCoreLegacy Arcade - Idle Throttling
+---------------------------------------
+This module tracks user activity so that menu loops can stop redrawing at
+full frame rate while nothing is animating and block on the event queue
+instead.
+"""
+
+import time
+import pygame
+from core.config import IDLE_TIMEOUT, IDLE_REDRAW_INTERVAL
+
+# Event types that count as user activity
+INPUT_EVENT_TYPES = {
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYHATMOTION
+}
+
+class IdleTracker:
+    """
+    Remembers when the user last gave input.
+    
+    Menus treat ambient effects (pulses, particles) as animation only while
+    the user is active, so a menu left alone eventually reports idle.
+    """
+    
+    def __init__(self, timeout=IDLE_TIMEOUT):
+        """
+        Initialize the idle tracker.
+        
+        Args:
+            timeout (float): Seconds without input before the user counts as idle
+        """
+        self.timeout = timeout
+        self.last_input_time = time.time()
+    
+    def notify(self, event):
+        """
+        Record an event, marking the user active if it is input.
+        
+        Args:
+            event (pygame.event.Event): The event to record
+        """
+        if event.type in INPUT_EVENT_TYPES:
+            self.last_input_time = time.time()
+    
+    def reset(self):
+        """Mark the user as active now."""
+        self.last_input_time = time.time()
+    
+    def is_active(self):
+        """
+        Check whether the user gave input recently.
+        
+        Returns:
+            bool: True if the last input was within the timeout
+        """
+        return time.time() - self.last_input_time < self.timeout
+
+def wait_for_events(timeout=IDLE_REDRAW_INTERVAL):
+    """
+    Block until an event arrives or the idle redraw timer expires.
+    
+    Args:
+        timeout (int): Maximum time to wait in milliseconds
+    
+    Returns:
+        list: The pending events, empty if the timer expired first
+    """
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
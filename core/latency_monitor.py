@@ -0,0 +1,209 @@
+"""
+SoulCoreLegacy Arcade - Latency Monitor
+---------------------------------------
+This module measures input-to-photon latency: the time from an input event
+being taken off the queue, through the frame whose handler processed it, to
+the frame that presented the result with display.flip.
+"""
+
+import os
+import json
+import math
+import time
+from collections import deque
+from core.config import LATENCY_SAMPLES, LATENCY_REPORT_TO_ANALYTICS
+from core.idle import INPUT_EVENT_TYPES
+
+# Percentiles included in summaries
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+# Default export location, next to the analytics local storage
+LATENCY_EXPORT_PATH = os.path.join(os.path.expanduser('~'), '.soulcorelegacy', 'latency.json')
+
+def percentile(sorted_values, p):
+    """
+    Get a percentile using the nearest-rank method.
+    
+    Args:
+        sorted_values (list): Values in ascending order
+        p (float): Percentile between 0 and 100
+    
+    Returns:
+        float: The percentile value, or 0.0 for an empty list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100.0 * len(sorted_values))
+    return sorted_values[max(1, min(rank, len(sorted_values))) - 1]
+
+class LatencyMonitor:
+    """
+    Collects input-to-photon latency samples per screen.
+    
+    pygame does not expose SDL event timestamps, so the event time is the
+    moment the main loop polled the event off the queue. Each sample holds
+    three stages in milliseconds: poll to handler finished, handler finished
+    to frame presented, and the total; plus the number of frames between the
+    handler frame and the presented frame. Samples are kept in a ring buffer
+    per screen.
+    """
+    
+    def __init__(self, max_samples=LATENCY_SAMPLES):
+        """
+        Initialize the latency monitor.
+        
+        Args:
+            max_samples (int): Samples kept per screen
+        """
+        self.max_samples = max_samples
+        self.screen = "shell"
+        self.frame = 0
+        
+        # Ring buffers of (handler_ms, present_ms, total_ms, frames) keyed by screen
+        self.samples = {}
+        
+        # Samples added since the last analytics report, keyed by screen
+        self.unreported = {}
+        
+        # Inputs handled but not yet presented: (screen, event_time, handled_time, handler_frame)
+        self.pending = []
+    
+    def set_screen(self, screen):
+        """
+        Set the screen new samples are attributed to.
+        
+        Args:
+            screen (str): "shell" or a game ID
+        """
+        self.screen = screen
+    
+    def record_input(self, event, event_time):
+        """
+        Record an input event whose handler has just returned.
+        
+        Args:
+            event (pygame.event.Event): The handled event
+            event_time (float): time.perf_counter() when the event was polled
+        """
+        if event.type in INPUT_EVENT_TYPES:
+            self.pending.append((self.screen, event_time, time.perf_counter(), self.frame))
+    
+    def frame_presented(self):
+        """Complete the samples for inputs shown by the frame just presented."""
+        present_time = time.perf_counter()
+        
+        for screen, event_time, handled_time, handler_frame in self.pending:
+            samples = self.samples.get(screen)
+            if samples is None:
+                samples = self.samples[screen] = deque(maxlen=self.max_samples)
+            
+            samples.append((
+                (handled_time - event_time) * 1000.0,
+                (present_time - handled_time) * 1000.0,
+                (present_time - event_time) * 1000.0,
+                self.frame - handler_frame
+            ))
+            self.unreported[screen] = self.unreported.get(screen, 0) + 1
+        
+        self.pending.clear()
+        self.frame += 1
+    
+    def get_summary(self, screen):
+        """
+        Summarize the samples of one screen.
+        
+        Args:
+            screen (str): The screen to summarize
+        
+        Returns:
+            dict: Sample count and per-stage percentiles in milliseconds
+        """
+        samples = self.samples.get(screen, ())
+        summary = {'screen': screen, 'count': len(samples)}
+        
+        for index, stage in enumerate(('handler', 'present', 'total')):
+            values = sorted(sample[index] for sample in samples)
+            for p in LATENCY_PERCENTILES:
+                summary[f'{stage}_p{p}_ms'] = round(percentile(values, p), 3)
+            summary[f'{stage}_max_ms'] = round(values[-1], 3) if values else 0.0
+        
+        frames = sorted(sample[3] for sample in samples)
+        summary['frames_p50'] = percentile(frames, 50)
+        summary['frames_max'] = frames[-1] if frames else 0
+        return summary
+    
+    def get_summaries(self):
+        """
+        Summarize every screen.
+        
+        Returns:
+            dict: Summaries keyed by screen
+        """
+        return {screen: self.get_summary(screen) for screen in self.samples}
+    
+    def export(self, path=LATENCY_EXPORT_PATH):
+        """
+        Write the summaries and raw samples to a JSON file.
+        
+        Args:
+            path (str): Output file path
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            report = {
+                'timestamp': int(time.time()),
+                'summaries': self.get_summaries(),
+                'samples': {
+                    screen: [
+                        {'handler_ms': h, 'present_ms': p, 'total_ms': t, 'frames': f}
+                        for h, p, t, f in samples
+                    ]
+                    for screen, samples in self.samples.items()
+                }
+            }
+            
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+            
+            print(f"Saved latency report to {path}")
+            return True
+        except Exception as e:
+            print(f"Error saving latency report: {e}")
+            return False
+    
+    def report(self, analytics):
+        """
+        Send aggregated summaries for screens with new samples to analytics.
+        
+        Does nothing unless LATENCY_REPORT_TO_ANALYTICS is enabled.
+        
+        Args:
+            analytics (AnalyticsService): The analytics service, or None
+        """
+        if not LATENCY_REPORT_TO_ANALYTICS or analytics is None:
+            return
+        
+        for screen in [s for s, count in self.unreported.items() if count]:
+            analytics.track_latency(self.get_summary(screen))
+            self.unreported[screen] = 0
+
+# Shared monitor instance
+_latency_monitor = None
+
+def get_latency_monitor():
+    """
+    Get the shared latency monitor, creating it on first use.
+    
+    Returns:
+        LatencyMonitor: The shared monitor
+    """
+    global _latency_monitor
+    if _latency_monitor is None:
+        _latency_monitor = LatencyMonitor()
+    return _latency_monitor
@@ -0,0 +1,170 @@
+"""
+SoulCoreLegacy Arcade - Quality Governor
+----------------------------------------
+This module measures frame time and steps the visual quality tier of the
+shell effects down when frames run over budget and back up when there is
+headroom again.
+"""
+
+import types
+import weakref
+from collections import deque
+from core.config import FPS, QUALITY_WINDOW, QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO, QUALITY_UPGRADE_DELAY
+
+# Quality tiers, lowest to highest
+QUALITY_LOW = 0
+QUALITY_MEDIUM = 1
+QUALITY_HIGH = 2
+QUALITY_TIER_NAMES = {
+    QUALITY_LOW: "low",
+    QUALITY_MEDIUM: "medium",
+    QUALITY_HIGH: "high"
+}
+
+class QualityGovernor:
+    """
+    Chooses the effect quality tier from a rolling average of frame times.
+    
+    The tier drops one step when the average over a full window exceeds the
+    budget by QUALITY_DOWNGRADE_RATIO. It only rises again after the average
+    has stayed below the budget by QUALITY_UPGRADE_RATIO for
+    QUALITY_UPGRADE_DELAY windows, so the tier does not oscillate around the
+    threshold. Frame times should exclude the frame cap delay (see
+    pygame.time.Clock.get_rawtime), otherwise a capped loop never shows
+    headroom.
+    """
+    
+    def __init__(self, target_fps=FPS, window=QUALITY_WINDOW, tier=QUALITY_HIGH):
+        """
+        Initialize the quality governor.
+        
+        Args:
+            target_fps (int): Frame rate the budget is derived from
+            window (int): Number of frames in the rolling average
+            tier (int): Starting quality tier
+        """
+        self.budget = 1.0 / target_fps
+        self.window = window
+        self.tier = tier
+        
+        # Rolling frame times and their running sum
+        self.frame_times = deque(maxlen=window)
+        self.total_time = 0.0
+        
+        # Consecutive frames with a full window under the upgrade threshold
+        self.headroom_frames = 0
+        
+        # Tier change callbacks
+        self.subscribers = []
+    
+    def subscribe(self, callback):
+        """
+        Register a callback for tier changes and call it with the current tier.
+        
+        Bound methods are held weakly so subscribing does not keep UI
+        elements alive after their menu is discarded; other callables,
+        builtins included, are held strongly. Subscribers that have died
+        since the last tier change are dropped here as well.
+        
+        Args:
+            callback (callable): Function taking the new tier
+        """
+        self.subscribers = [ref for ref in self.subscribers if ref() is not None]
+        if isinstance(callback, types.MethodType):
+            self.subscribers.append(weakref.WeakMethod(callback))
+        else:
+            self.subscribers.append(lambda: callback)
+        callback(self.tier)
+    
+    def unsubscribe(self, callback):
+        """
+        Remove a tier change callback.
+        
+        Args:
+            callback (callable): The callback passed to subscribe
+        """
+        self.subscribers = [ref for ref in self.subscribers if ref() not in (None, callback)]
+    
+    def record_frame(self, frame_time):
+        """
+        Record the time one frame took and adjust the tier if needed.
+        
+        Args:
+            frame_time (float): Frame time in seconds
+        """
+        if len(self.frame_times) == self.window:
+            self.total_time -= self.frame_times[0]
+        self.frame_times.append(frame_time)
+        self.total_time += frame_time
+        
+        # Wait for a full window before judging
+        if len(self.frame_times) < self.window:
+            return
+        
+        average = self.total_time / self.window
+        if average > self.budget * QUALITY_DOWNGRADE_RATIO:
+            self.headroom_frames = 0
+            if self.tier > QUALITY_LOW:
+                self.set_tier(self.tier - 1)
+        elif average < self.budget * QUALITY_UPGRADE_RATIO:
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.window * QUALITY_UPGRADE_DELAY and self.tier < QUALITY_HIGH:
+                self.set_tier(self.tier + 1)
+        else:
+            self.headroom_frames = 0
+    
+    def set_tier(self, tier):
+        """
+        Set the quality tier and notify subscribers.
+        
+        Measurements restart so the next decision only sees frames rendered
+        at the new tier.
+        
+        Args:
+            tier (int): The new quality tier
+        """
+        tier = max(QUALITY_LOW, min(QUALITY_HIGH, tier))
+        self.frame_times.clear()
+        self.total_time = 0.0
+        self.headroom_frames = 0
+        
+        if tier == self.tier:
+            return
+        
+        self.tier = tier
+        print(f"Visual quality set to {QUALITY_TIER_NAMES[tier]}")
+        
+        # Notify live subscribers and drop dead ones
+        alive = []
+        for ref in self.subscribers:
+            callback = ref()
+            if callback is not None:
+                callback(tier)
+                alive.append(ref)
+        self.subscribers = alive
+    
+    def get_average_frame_time(self):
+        """
+        Get the rolling average frame time.
+        
+        Returns:
+            float: Average frame time in seconds, or 0.0 before any frames
+        """
+        if not self.frame_times:
+            return 0.0
+        return self.total_time / len(self.frame_times)
+
+# Shared governor instance
+_quality_governor = None
+
+def get_quality_governor():
+    """
+    Get the shared quality governor, creating it on first use.
+    
+    Returns:
+        QualityGovernor: The shared governor
+    """
+    global _quality_governor
+    if _quality_governor is None:
+        _quality_governor = QualityGovernor()
+    return _quality_governor
@@ -0,0 +1,287 @@
+"""
+SoulCoreLegacy Arcade - Render Scaler
+-------------------------------------
+This module separates the resolution games draw at from the size of the
+window. Games draw to a logical surface of SCREEN_WIDTH x SCREEN_HEIGHT and
+the scaler presents it on the display, letting SDL scale it with
+pygame.SCALED when a hardware renderer is available, and otherwise scaling
+it in software with whichever of smoothscale and integer scaling fits the
+frame budget.
+"""
+
+import time
+import warnings
+import pygame
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DISPLAY_SIZE, FULLSCREEN, RENDER_SCALE_MODE, RENDER_SCALE_BUDGET
+
+# Scale modes
+SCALE_AUTO = "auto"
+SCALE_NONE = "none"
+SCALE_HARDWARE = "scaled"
+SCALE_SMOOTH = "smooth"
+SCALE_INTEGER = "integer"
+
+# Software scale modes and the transform each one uses
+SOFTWARE_SCALERS = {
+    SCALE_SMOOTH: pygame.transform.smoothscale,
+    SCALE_INTEGER: pygame.transform.scale
+}
+
+# Scales timed per software mode when choosing one; the fastest run counts
+SCALE_BENCHMARK_RUNS = 5
+
+# Mouse events whose positions are in window coordinates
+MOUSE_POSITION_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+class RenderScaler:
+    """
+    Creates the display and presents the logical surface on it.
+    
+    In "scaled" mode the logical surface is the display itself and SDL
+    scales it on the GPU, mapping mouse positions too. In the software
+    modes the logical surface is a separate display-format surface that is
+    scaled into a centred, aspect-preserving area of the window on every
+    present: "smooth" filters it to fit, "integer" uses the largest whole
+    factor with nearest-neighbour sampling. Auto mode uses no scaling when
+    the window matches the render resolution, pygame.SCALED when SDL has a
+    fast renderer, and otherwise times both software modes and keeps
+    smoothscale only if it fits within RENDER_SCALE_BUDGET of a frame.
+    """
+    
+    def __init__(self, logical_size=(SCREEN_WIDTH, SCREEN_HEIGHT), display_size=DISPLAY_SIZE,
+                 fullscreen=FULLSCREEN, mode=RENDER_SCALE_MODE, budget=RENDER_SCALE_BUDGET / FPS):
+        """
+        Initialize the render scaler.
+        
+        Args:
+            logical_size (tuple): Resolution games draw at
+            display_size (tuple): Window size, or None for the default
+            fullscreen (bool): Whether to present full screen
+            mode (str): Requested scale mode
+            budget (float): Seconds a software smoothscale may take per frame
+        """
+        self.logical_size = tuple(logical_size)
+        self.display_size = tuple(display_size) if display_size else None
+        self.fullscreen = fullscreen
+        self.requested_mode = mode
+        self.budget = budget
+        
+        # Set by create_display
+        self.mode = None
+        self.display = None
+        self.surface = None
+        
+        # Software scaling target area inside the window
+        self.target_rect = None
+        self.target = None
+        self.scale_costs = {}
+    
+    def create_display(self):
+        """
+        Create the display and the logical surface.
+        
+        Returns:
+            pygame.Surface: The surface games should draw on
+        """
+        flags = pygame.FULLSCREEN if self.fullscreen else 0
+        window_size = self._get_window_size()
+        
+        # Let SDL scale on the GPU when asked to, or when it can do so in auto mode
+        use_hardware = (self.requested_mode == SCALE_HARDWARE or
+                        (self.requested_mode == SCALE_AUTO and window_size != self.logical_size and
+                         (self.fullscreen or not self.display_size)))
+        if use_hardware:
+            try:
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always")
+                    display = pygame.display.set_mode(self.logical_size, flags | pygame.SCALED)
+                
+                # SDL warns when it falls back to its software renderer
+                if self.requested_mode == SCALE_HARDWARE or not caught:
+                    return self._use_display(display, SCALE_HARDWARE)
+            except pygame.error as e:
+                print(f"Error creating scaled display: {e}")
+        
+        display = pygame.display.set_mode(window_size, flags)
+        if display.get_size() == self.logical_size:
+            return self._use_display(display, SCALE_NONE)
+        
+        # Software scaling: draw off screen, then scale into a letterboxed area of the window
+        self.display = display
+        self.surface = pygame.Surface(self.logical_size).convert()
+        display.fill((0, 0, 0))
+        
+        if self.requested_mode in SOFTWARE_SCALERS:
+            self._set_software_mode(self.requested_mode)
+        else:
+            self._set_software_mode(self._choose_software_mode())
+        return self.surface
+    
+    def present(self, dirty_rects=None):
+        """
+        Scale the logical surface onto the display if needed and show it.
+        
+        Args:
+            dirty_rects (list): Rects that changed since the last frame, or None
+                for the whole surface; only an unscaled display updates just these
+        """
+        scale = SOFTWARE_SCALERS.get(self.mode)
+        if scale:
+            scale(self.surface, self.target_rect.size, self.target)
+        
+        if dirty_rects is not None and self.mode == SCALE_NONE:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
+    
+    def map_position(self, position):
+        """
+        Map a window position to logical surface coordinates.
+        
+        Args:
+            position (tuple): Position in the window
+        
+        Returns:
+            tuple: Position on the logical surface, clamped to it
+        """
+        if self.mode not in SOFTWARE_SCALERS:
+            return position
+        
+        logical_width, logical_height = self.logical_size
+        x = (position[0] - self.target_rect.x) * logical_width // self.target_rect.width
+        y = (position[1] - self.target_rect.y) * logical_height // self.target_rect.height
+        return (min(max(x, 0), logical_width - 1), min(max(y, 0), logical_height - 1))
+    
+    def map_event(self, event):
+        """
+        Map the position of a mouse event to logical coordinates in place.
+        
+        Args:
+            event (pygame.event.Event): The event to map
+        """
+        if self.mode not in SOFTWARE_SCALERS or event.type not in MOUSE_POSITION_EVENTS:
+            return
+        
+        event.pos = self.map_position(event.pos)
+        if event.type == pygame.MOUSEMOTION:
+            event.rel = (event.rel[0] * self.logical_size[0] // self.target_rect.width,
+                         event.rel[1] * self.logical_size[1] // self.target_rect.height)
+    
+    def get_mouse_pos(self):
+        """
+        Get the mouse position in logical coordinates.
+        
+        Returns:
+            tuple: The mouse position on the logical surface
+        """
+        return self.map_position(pygame.mouse.get_pos())
+    
+    def _get_window_size(self):
+        """
+        Get the window size to request.
+        
+        Returns:
+            tuple: Window width and height
+        """
+        if self.requested_mode == SCALE_NONE:
+            return self.logical_size
+        if self.display_size:
+            return self.display_size
+        if self.fullscreen:
+            return tuple(pygame.display.get_desktop_sizes()[0])
+        return self.logical_size
+    
+    def _use_display(self, display, mode):
+        """
+        Draw straight on the display.
+        
+        Args:
+            display (pygame.Surface): The display surface
+            mode (str): SCALE_NONE or SCALE_HARDWARE
+        
+        Returns:
+            pygame.Surface: The display surface
+        """
+        self.display = display
+        self.surface = display
+        self.mode = mode
+        return display
+    
+    def _set_software_mode(self, mode):
+        """
+        Lay out the scaled image for a software mode.
+        
+        Args:
+            mode (str): SCALE_SMOOTH or SCALE_INTEGER
+        """
+        self.mode = mode
+        self.target_rect = self._get_target_rect(mode)
+        self.target = self.display.subsurface(self.target_rect)
+    
+    def _get_target_rect(self, mode):
+        """
+        Get the window area the logical surface is scaled into.
+        
+        Args:
+            mode (str): SCALE_SMOOTH or SCALE_INTEGER
+        
+        Returns:
+            pygame.Rect: Centred area keeping the logical aspect ratio
+        """
+        logical_width, logical_height = self.logical_size
+        window_width, window_height = self.display.get_size()
+        factor = min(window_width / logical_width, window_height / logical_height)
+        
+        # Whole factors keep pixels square; a window smaller than the logical size cannot have one
+        if mode == SCALE_INTEGER and factor >= 1:
+            factor = int(factor)
+        
+        width = max(1, int(logical_width * factor))
+        height = max(1, int(logical_height * factor))
+        return pygame.Rect((window_width - width) // 2, (window_height - height) // 2, width, height)
+    
+    def _choose_software_mode(self):
+        """
+        Time both software modes and pick one.
+        
+        Returns:
+            str: SCALE_SMOOTH if it fits the budget, otherwise SCALE_INTEGER
+        """
+        for mode, scale in SOFTWARE_SCALERS.items():
+            target_rect = self._get_target_rect(mode)
+            target = self.display.subsurface(target_rect)
+            best = None
+            for _ in range(SCALE_BENCHMARK_RUNS):
+                start = time.perf_counter()
+                scale(self.surface, target_rect.size, target)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            self.scale_costs[mode] = best
+        
+        if self.scale_costs[SCALE_SMOOTH] <= self.budget:
+            return SCALE_SMOOTH
+        return SCALE_INTEGER
+
+# Shared render scaler instance
+_render_scaler = None
+
+def get_render_scaler():
+    """
+    Get the shared render scaler, creating it on first use.
+    
+    Returns:
+        RenderScaler: The shared render scaler
+    """
+    global _render_scaler
+    if _render_scaler is None:
+        _render_scaler = RenderScaler()
+    return _render_scaler
+
+def get_mouse_pos():
+    """
+    Get the mouse position on the logical surface of the shared scaler.
+    
+    Returns:
+        tuple: The mouse position in logical coordinates
+    """
+    return get_render_scaler().get_mouse_pos()
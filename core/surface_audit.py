@@ -0,0 +1,260 @@
+"""
+SoulCoreLegacy Arcade - Surface Audit
+-------------------------------------
+This module checks blits for source surfaces whose pixel format differs
+from the display. SDL converts such surfaces pixel by pixel on every blit,
+so the auditor records where they are blitted and what those blits cost,
+and can convert each one once and reuse the converted copy.
+"""
+
+import time
+import weakref
+import pygame
+from core.config import SURFACE_AUDIT, SURFACE_AUTO_CONVERT
+
+def get_surface_format(surface):
+    """
+    Get the pixel format of a surface.
+    
+    Alpha here means per-pixel alpha, read from the alpha mask: a convert()ed
+    surface given a surface alpha with set_alpha() also has SRCALPHA set,
+    but it is still in the opaque display format.
+    
+    Args:
+        surface (pygame.Surface): The surface
+    
+    Returns:
+        tuple: (bits per pixel, channel masks, has per-pixel alpha)
+    """
+    masks = surface.get_masks()
+    return (surface.get_bitsize(), masks, bool(masks[3]))
+
+def describe_surface_format(surface_format):
+    """
+    Describe a pixel format for reports.
+    
+    Args:
+        surface_format (tuple): Format from get_surface_format
+    
+    Returns:
+        str: Short description such as "32-bit alpha"
+    """
+    bitsize, masks, alpha = surface_format
+    masks = "/".join(f"{mask:x}" for mask in masks)
+    return f"{bitsize}-bit {'alpha' if alpha else 'opaque'} ({masks})"
+
+class SurfaceAuditor:
+    """
+    Audits blits made through blit().
+    
+    Every audited blit is timed per call site. Sources that are not in the
+    display format (convert() for opaque surfaces, convert_alpha() for
+    per-pixel alpha) are flagged once per site and counted separately.
+    With auto-conversion on, a flagged source is converted on its first
+    blit and the copy is reused for as long as the source is alive, so it
+    must not be drawn on after it is first blitted (or forget() must be
+    called when it is). Its surface alpha and colorkey may still change:
+    they are copied onto the converted surface before each blit.
+    """
+    
+    def __init__(self, enabled=SURFACE_AUDIT, auto_convert=SURFACE_AUTO_CONVERT):
+        """
+        Initialize the surface auditor.
+        
+        Args:
+            enabled (bool): Whether blits are audited; disabled blits go straight through
+            auto_convert (bool): Whether flagged sources are converted and cached
+        """
+        self.enabled = enabled
+        self.auto_convert = auto_convert
+        
+        # Per-site [blits, seconds, mismatched blits, seconds in mismatched blits, conversions]
+        self.sites = {}
+        
+        # Display-compatible formats, refreshed when the display mode changes
+        self.display_key = None
+        self.opaque_format = None
+        self.alpha_format = None
+        
+        # Display-format copies keyed by source surface
+        self.converted = weakref.WeakKeyDictionary()
+    
+    def is_display_format(self, surface):
+        """
+        Check whether a surface can be blitted to the display without conversion.
+        
+        Args:
+            surface (pygame.Surface): The surface to check
+        
+        Returns:
+            bool: True if the format matches, or if there is no display to compare with
+        """
+        if not self._refresh_display_formats():
+            return True
+        surface_format = get_surface_format(surface)
+        return surface_format == (self.alpha_format if surface_format[2] else self.opaque_format)
+    
+    def blit(self, dest, source, position, site, area=None, special_flags=0):
+        """
+        Blit a surface, auditing it when enabled.
+        
+        Args:
+            dest (pygame.Surface): The surface to draw on
+            source (pygame.Surface): The surface to draw
+            position (tuple): Destination position or rect
+            site (str): Name of the call site for the report
+            area (pygame.Rect): Optional source area
+            special_flags (int): Blend flags
+        
+        Returns:
+            pygame.Rect: The affected area
+        """
+        if not self.enabled:
+            return dest.blit(source, position, area, special_flags)
+        
+        stats = self.sites.get(site)
+        if stats is None:
+            stats = self.sites[site] = [0, 0.0, 0, 0.0, 0]
+        
+        mismatched = not self.is_display_format(source)
+        if mismatched:
+            if not stats[2]:
+                print(f"Surface format mismatch at {site}: "
+                      f"{describe_surface_format(get_surface_format(source))}, display is "
+                      f"{describe_surface_format(self.alpha_format if get_surface_format(source)[2] else self.opaque_format)}")
+            if self.auto_convert:
+                converted = self.converted.get(source)
+                if converted is None:
+                    converted = self.converted[source] = self.convert(source)
+                    stats[4] += 1
+                
+                # Carry over surface alpha and colorkey changes made since the conversion
+                if converted.get_alpha() != source.get_alpha():
+                    converted.set_alpha(source.get_alpha())
+                if converted.get_colorkey() != source.get_colorkey():
+                    converted.set_colorkey(source.get_colorkey())
+                source = converted
+        
+        start = time.perf_counter()
+        rect = dest.blit(source, position, area, special_flags)
+        elapsed = time.perf_counter() - start
+        
+        stats[0] += 1
+        stats[1] += elapsed
+        if mismatched:
+            stats[2] += 1
+            stats[3] += elapsed
+        return rect
+    
+    def convert(self, surface):
+        """
+        Convert a surface to the display format.
+        
+        Args:
+            surface (pygame.Surface): The surface to convert
+        
+        Returns:
+            pygame.Surface: The converted surface
+        """
+        if get_surface_format(surface)[2]:
+            return surface.convert_alpha()
+        return surface.convert()
+    
+    def forget(self, surface):
+        """
+        Drop the converted copy of a surface that has been drawn on again.
+        
+        Args:
+            surface (pygame.Surface): The source surface
+        """
+        self.converted.pop(surface, None)
+    
+    def get_report(self):
+        """
+        Summarize the audited blit sites.
+        
+        Returns:
+            list: One dict per site, sites with mismatched blits first by time spent
+        """
+        report = []
+        for site, (blits, seconds, mismatched, mismatched_seconds, conversions) in self.sites.items():
+            report.append({
+                'site': site,
+                'blits': blits,
+                'total_ms': round(seconds * 1000.0, 3),
+                'mean_us': round(seconds / blits * 1e6, 2) if blits else 0.0,
+                'mismatched_blits': mismatched,
+                'mismatched_ms': round(mismatched_seconds * 1000.0, 3),
+                'conversions': conversions
+            })
+        report.sort(key=lambda entry: (-entry['mismatched_ms'], -entry['total_ms']))
+        return report
+    
+    def print_report(self):
+        """Print the audit report."""
+        if not self.sites:
+            return
+        
+        print("Surface audit:")
+        for entry in self.get_report():
+            print(f"  {entry['site']}: {entry['blits']} blits, {entry['total_ms']} ms "
+                  f"({entry['mean_us']} us each), {entry['mismatched_blits']} not in display format "
+                  f"({entry['mismatched_ms']} ms), {entry['conversions']} converted")
+    
+    def reset(self):
+        """Clear the statistics and converted copies."""
+        self.sites.clear()
+        self.converted = weakref.WeakKeyDictionary()
+    
+    def _refresh_display_formats(self):
+        """
+        Capture the display formats if the display mode changed.
+        
+        Returns:
+            bool: True if a display exists
+        """
+        display = pygame.display.get_surface() if pygame.display.get_init() else None
+        if display is None:
+            return False
+        
+        display_key = (id(display), display.get_size(), display.get_bitsize())
+        if display_key != self.display_key:
+            self.display_key = display_key
+            self.opaque_format = get_surface_format(display)
+            self.alpha_format = get_surface_format(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha())
+            
+            # Copies made for the previous mode may no longer match
+            self.converted = weakref.WeakKeyDictionary()
+        return True
+
+# Shared auditor instance
+_surface_auditor = None
+
+def get_surface_auditor():
+    """
+    Get the shared surface auditor, creating it on first use.
+    
+    Returns:
+        SurfaceAuditor: The shared auditor
+    """
+    global _surface_auditor
+    if _surface_auditor is None:
+        _surface_auditor = SurfaceAuditor()
+    return _surface_auditor
+
+def audited_blit(dest, source, position, site, area=None, special_flags=0):
+    """
+    Blit through the shared surface auditor.
+    
+    Args:
+        dest (pygame.Surface): The surface to draw on
+        source (pygame.Surface): The surface to draw
+        position (tuple): Destination position or rect
+        site (str): Name of the call site for the report
+        area (pygame.Rect): Optional source area
+        special_flags (int): Blend flags
+    
+    Returns:
+        pygame.Rect: The affected area
+    """
+    return get_surface_auditor().blit(dest, source, position, site, area, special_flags)
@@ -0,0 +1,245 @@
+"""
+SoulCoreLegacy Arcade - Thumbnail Service
+----------------------------------------
+This module loads game thumbnails in the background and caches them in the
+display pixel format so that every menu implementation shares one copy.
+"""
+
+import os
+import random
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from core.config import BG_COLOR, PRIMARY_COLOR, SECONDARY_COLOR, ACCENT_COLOR
+
+class ThumbnailService:
+    """
+    Loads, scales and caches game thumbnails.
+    
+    Files are decoded and scaled on a worker pool. The finished surfaces are
+    converted to the display format on the main thread the first time they
+    are requested after loading completes. Until then callers receive a
+    shared placeholder of the requested size.
+    """
+    
+    def __init__(self, max_workers=2):
+        """
+        Initialize the thumbnail service.
+        
+        Args:
+            max_workers (int): Number of background loader threads
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail")
+        
+        # Ready surfaces keyed by (game_id, size)
+        self.cache = {}
+        
+        # In-flight loads keyed by (game_id, size)
+        self.pending = {}
+        
+        # Shared placeholders keyed by size
+        self.placeholders = {}
+    
+    def get(self, game_id, path, size):
+        """
+        Get the thumbnail for a game at the given size.
+        
+        Starts a background load on the first request. Never blocks.
+        
+        Args:
+            game_id (str): The ID of the game
+            path (str): Path to the thumbnail image
+            size (tuple): The (width, height) to scale the thumbnail to
+        
+        Returns:
+            pygame.Surface: The thumbnail, or the shared placeholder while loading
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (game_id, size)
+        
+        surface = self.cache.get(key)
+        if surface is not None:
+            return surface
+        
+        future = self.pending.get(key)
+        if future is None:
+            if path and os.path.exists(path):
+                self.pending[key] = self.executor.submit(self._load, path, size)
+            else:
+                # Nothing to load; the placeholder is the final image
+                self.cache[key] = self.get_placeholder(size)
+                return self.cache[key]
+        elif future.done():
+            del self.pending[key]
+            self.cache[key] = self._finish(game_id, future, size)
+            return self.cache[key]
+        
+        return self.get_placeholder(size)
+    
+    def is_ready(self, game_id, size):
+        """
+        Check whether a thumbnail has finished loading.
+        
+        Args:
+            game_id (str): The ID of the game
+            size (tuple): The requested (width, height)
+        
+        Returns:
+            bool: True if the thumbnail is cached
+        """
+        return (game_id, (int(size[0]), int(size[1]))) in self.cache
+    
+    def has_pending(self):
+        """
+        Check whether any thumbnails are still loading.
+        
+        Returns:
+            bool: True if a load is in flight or waiting to be collected
+        """
+        return bool(self.pending)
+    
+    def get_placeholder(self, size):
+        """
+        Get the shared placeholder surface for a size.
+        
+        Args:
+            size (tuple): The (width, height) of the placeholder
+        
+        Returns:
+            pygame.Surface: The placeholder surface
+        """
+        size = (int(size[0]), int(size[1]))
+        if size not in self.placeholders:
+            self.placeholders[size] = self._to_display_format(self._create_placeholder(size))
+        return self.placeholders[size]
+    
+    def clear(self):
+        """Drop all cached thumbnails and placeholders."""
+        self.cache.clear()
+        self.placeholders.clear()
+    
+    def shutdown(self):
+        """Stop the worker pool."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
+    
+    def _load(self, path, size):
+        """
+        Load and scale a thumbnail. Runs on a worker thread.
+        
+        Args:
+            path (str): Path to the image
+            size (tuple): The (width, height) to scale to
+        
+        Returns:
+            pygame.Surface: The scaled, unconverted surface
+        """
+        image = pygame.image.load(path)
+        if image.get_size() != size:
+            if image.get_bitsize() >= 24:
+                image = pygame.transform.smoothscale(image, size)
+            else:
+                image = pygame.transform.scale(image, size)
+        return image
+    
+    def _finish(self, game_id, future, size):
+        """
+        Convert a finished load to the display format.
+        
+        Args:
+            game_id (str): The ID of the game
+            future (Future): The completed load
+            size (tuple): The requested size
+        
+        Returns:
+            pygame.Surface: The display-format thumbnail or the placeholder on error
+        """
+        try:
+            return self._to_display_format(future.result())
+        except Exception as e:
+            print(f"Error loading thumbnail for {game_id}: {e}")
+            return self.get_placeholder(size)
+    
+    def _to_display_format(self, surface):
+        """
+        Convert a surface to the display pixel format if a display exists.
+        
+        Args:
+            surface (pygame.Surface): The surface to convert
+        
+        Returns:
+            pygame.Surface: The converted surface
+        """
+        if not pygame.display.get_init() or pygame.display.get_surface() is None:
+            return surface
+        
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+    
+    def _create_placeholder(self, size):
+        """
+        Create a tech-pattern placeholder thumbnail.
+        
+        The pattern is seeded from the size so every placeholder of the same
+        size looks the same.
+        
+        Args:
+            size (tuple): The (width, height) of the placeholder
+        
+        Returns:
+            pygame.Surface: The placeholder surface
+        """
+        width, height = size
+        rng = random.Random(width * 10007 + height)
+        
+        placeholder = pygame.Surface((max(1, width), max(1, height)))
+        placeholder.fill(BG_COLOR)
+        
+        # Add tech grid pattern
+        grid_color = tuple(c // 3 for c in PRIMARY_COLOR)
+        for y in range(0, height, 10):
+            pygame.draw.line(placeholder, grid_color, (0, y), (width, y), 1)
+        for x in range(0, width, 10):
+            pygame.draw.line(placeholder, grid_color, (x, 0), (x, height), 1)
+        
+        if width > 10 and height > 10:
+            # Add some "nodes" in the grid
+            for _ in range(8):
+                x = rng.randint(5, width - 5)
+                y = rng.randint(5, height - 5)
+                pygame.draw.circle(placeholder, ACCENT_COLOR, (x, y), rng.randint(2, 4))
+            
+            # Add some "connections" between nodes
+            for _ in range(5):
+                start = (rng.randint(5, width - 5), rng.randint(5, height - 5))
+                end = (rng.randint(5, width - 5), rng.randint(5, height - 5))
+                pygame.draw.line(placeholder, SECONDARY_COLOR, start, end, 1)
+        
+        return placeholder
+
+# Shared service instance
+_thumbnail_service = None
+
+def get_thumbnail_service():
+    """
+    Get the shared thumbnail service, creating it on first use.
+    
+    Returns:
+        ThumbnailService: The shared service
+    """
+    global _thumbnail_service
+    if _thumbnail_service is None:
+        _thumbnail_service = ThumbnailService()
+    return _thumbnail_service
+
+def get_thumbnail_path(game_id):
+    """
+    Get the default thumbnail path for a game in the games package.
+    
+    Args:
+        game_id (str): The ID of the game
+    
+    Returns:
+        str: The path to the game's thumbnail
+    """
+    return os.path.join("games", game_id, "assets", "thumbnail.png")
@@ -11,6 +11,7 @@ import math
 import uuid
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, WHITE, PRIMARY_COLOR, SECONDARY_COLOR
 from core.asset_loader import load_font, create_gradient_background
+from core.surface_audit import audited_blit
 
 class NFTArtisanGame:
     """
@@ -229,7 +230,7 @@ class NFTArtisanGame:
             pygame.draw.rect(screen, (50, 50, 50), nft_rect)
             
             # Draw the NFT
-            screen.blit(self.current_nft, (SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 - 140))
+            audited_blit(screen, self.current_nft, (SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 - 140), "NFTArtisan.current_nft")
             
             # Draw save button
             save_button_rect = pygame.Rect(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 170, 200, 40)
@@ -263,7 +264,7 @@ class NFTArtisanGame:
             
             # Draw the current NFT from collection
             current_nft = self.collection[self.current_view_index]
-            screen.blit(current_nft, (SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 - 140))
+            audited_blit(screen, current_nft, (SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 - 140), "NFTArtisan.collection")
             
             # Draw navigation text
             nav_text = self.small_font.render("< Left / Right >", True, WHITE)
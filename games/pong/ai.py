@@ -5,11 +5,19 @@ This module implements the AI for the Pong game.
 """
 
 import random
-from core.config import SCREEN_HEIGHT
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from games.pong.prediction import TrajectoryPredictor
 
 class PongAI:
     """
     A simple AI for the Pong game.
+    
+    While the ball approaches, the AI heads for the predicted intercept
+    plus an aiming error drawn once per approach, so the paddle settles on
+    a steady target instead of chasing a new random one every frame. The
+    intercept itself comes from a TrajectoryPredictor and is only worked
+    out again when the ball's velocity changes. The AI plays whichever side
+    its paddle is on, so two of them can play each other.
     """
     
     def __init__(self, paddle, ball):
@@ -23,75 +31,91 @@ class PongAI:
         self.paddle = paddle
         self.ball = ball
         
-        # Reaction speed (lower = faster)
+        # Reaction speed: seconds before the AI responds to a new approach (lower = faster)
         self.reaction_speed = 0.1
         
         # Difficulty level (0.0 to 1.0)
         self.difficulty = 0.7
+        
+        # Side of the court: 1 for the right-hand paddle, -1 for the left
+        self.side = 1 if paddle.x + paddle.width / 2 > SCREEN_WIDTH / 2 else -1
+        
+        # Intercept prediction between the heights the ball's centre bounces at
+        self.predictor = TrajectoryPredictor(ball.radius, SCREEN_HEIGHT - ball.radius)
+        
+        # Current approach of the ball: frames since it started and the aiming error for it
+        self.approaching = False
+        self.approach_frames = 0
+        self.error = 0.0
     
     def update(self):
         """Update the AI's paddle position based on the ball's position."""
         # Only move if the ball is moving towards the AI's paddle
-        if self.ball.velocity_x > 0:
-            # Calculate the target y position
-            target_y = self.predict_ball_y()
+        if self.ball.velocity_x * self.side > 0:
+            # A new approach: draw its aiming error and start the reaction delay
+            if not self.approaching:
+                self.approaching = True
+                self.approach_frames = 0
+                self.error = self.sample_error()
+                self.predictor.invalidate()
+            self.approach_frames += 1
+            
+            # Keep doing what it was doing until it has had time to react
+            if self.approach_frames <= self.reaction_speed * FPS:
+                return
             
             # Move the paddle towards the target position
-            if self.paddle.y + self.paddle.height / 2 < target_y - 10:
-                self.paddle.moving_up = False
-                self.paddle.moving_down = True
-            elif self.paddle.y + self.paddle.height / 2 > target_y + 10:
-                self.paddle.moving_up = True
-                self.paddle.moving_down = False
-            else:
-                self.paddle.moving_up = False
-                self.paddle.moving_down = False
+            self._move_towards(self.predict_ball_y())
         else:
             # Move towards the center when the ball is moving away
-            if self.paddle.y + self.paddle.height / 2 < self.ball.initial_y - 10:
-                self.paddle.moving_up = False
-                self.paddle.moving_down = True
-            elif self.paddle.y + self.paddle.height / 2 > self.ball.initial_y + 10:
-                self.paddle.moving_up = True
-                self.paddle.moving_down = False
-            else:
-                self.paddle.moving_up = False
-                self.paddle.moving_down = False
+            self.approaching = False
+            self._move_towards(self.ball.initial_y)
     
     def predict_ball_y(self):
         """
         Predict where the ball will be when it reaches the AI's paddle.
         
         Returns:
-            float: The predicted y-coordinate of the ball
+            float: The predicted y-coordinate of the ball, including this approach's aiming error
         """
         # If the ball is moving away from the AI, return the center
-        if self.ball.velocity_x <= 0:
+        if self.ball.velocity_x * self.side <= 0:
             return self.ball.initial_y
         
-        # Calculate time to reach the paddle
-        distance_x = self.paddle.x - self.ball.x
-        if self.ball.velocity_x == 0:  # Avoid division by zero
-            return self.ball.y
-            
-        time_to_reach = distance_x / self.ball.velocity_x
-        
-        # Predict the y position
-        predicted_y = self.ball.y + self.ball.velocity_y * time_to_reach
+        # The ball meets the paddle when its leading edge reaches the paddle's face
+        if self.side > 0:
+            target_x = self.paddle.x - self.ball.radius
+        else:
+            target_x = self.paddle.x + self.paddle.width + self.ball.radius
+        return self.predictor.predict(self.ball, target_x) + self.error
+    
+    def sample_error(self):
+        """
+        Draw an aiming error for one approach.
         
-        # Account for bounces off the top and bottom walls
-        screen_height = SCREEN_HEIGHT
-        while predicted_y < 0 or predicted_y > screen_height:
-            if predicted_y < 0:
-                predicted_y = -predicted_y
-            elif predicted_y > screen_height:
-                predicted_y = 2 * screen_height - predicted_y
+        Lower difficulty means a wider spread.
         
-        # Add some randomness based on difficulty
-        # Lower difficulty means more randomness
-        if self.difficulty < 1.0:
-            max_error = (1.0 - self.difficulty) * self.paddle.height
-            error = random.uniform(-max_error, max_error)
-            predicted_y += error
+        Returns:
+            float: Offset added to the predicted intercept
+        """
+        if self.difficulty >= 1.0:
+            return 0.0
+        max_error = (1.0 - self.difficulty) * self.paddle.height
+        return random.uniform(-max_error, max_error)
+    
+    def _move_towards(self, target_y):
+        """
+        Steer the paddle's center towards a height, stopping within a dead zone.
         
-        return predicted_y
+        Args:
+            target_y (float): The height to reach
+        """
+        if self.paddle.y + self.paddle.height / 2 < target_y - 10:
+            self.paddle.moving_up = False
+            self.paddle.moving_down = True
+        elif self.paddle.y + self.paddle.height / 2 > target_y + 10:
+            self.paddle.moving_up = True
+            self.paddle.moving_down = False
+        else:
+            self.paddle.moving_up = False
+            self.paddle.moving_down = False
@@ -319,6 +319,9 @@ class PongGame:
         self.player_paddle.rect.y = self.player_paddle.y
         self.ai_paddle.rect.y = self.ai_paddle.y
         
+        # The ball jumped, so the AI's cached intercept no longer applies
+        self.ai.predictor.invalidate()
+        
         # If the game was in progress, mark the ball as started
         if not self.waiting_for_start and (self.ball.velocity_x != 0 or self.ball.velocity_y != 0):
             self.ball.game_started = True
@@ -1,14 +1,103 @@
 """
 SoulCoreLegacy Arcade - Pong Game Logic
 --------------------------------------
-This module implements the logic for the Pong game.
+This module implements the logic for the Pong game. pygame is only
+imported for drawing, so matches can be simulated without it.
 """
 
-import pygame
 import random
 import math
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
 
+# Ball speed in pixels per frame above which a frame is split into sub-steps
+SUBSTEP_SPEED = 12
+
+# Impacts resolved at most per sub-step, so a ball wedged between a paddle and a wall cannot stall a frame
+MAX_IMPACTS_PER_STEP = 4
+
+def sweep_circle_aabb(x, y, dx, dy, radius, left, top, right, bottom):
+    """
+    Find when a moving circle first touches a box.
+    
+    The circle's centre is cast as a ray against the box grown by the
+    radius with rounded corners: the slab test against the grown box
+    gives the entry point, and an entry in a corner region is checked
+    against the circle around that corner instead.
+    
+    Args:
+        x (float): Circle centre x at the start of the move
+        y (float): Circle centre y at the start of the move
+        dx (float): Movement along x over the move
+        dy (float): Movement along y over the move
+        radius (float): Circle radius
+        left (float): Box left edge
+        top (float): Box top edge
+        right (float): Box right edge
+        bottom (float): Box bottom edge
+    
+    Returns:
+        tuple: (time of impact from 0 to 1, normal x, normal y) with the normal
+        pointing out of the box, or None if the circle does not touch it while
+        moving towards it
+    """
+    grown_left = left - radius
+    grown_top = top - radius
+    grown_right = right + radius
+    grown_bottom = bottom + radius
+    
+    # Already touching: push out along the axis of least overlap if moving inwards
+    if grown_left < x < grown_right and grown_top < y < grown_bottom:
+        overlaps = ((x - grown_left, -1.0, 0.0), (grown_right - x, 1.0, 0.0),
+                    (y - grown_top, 0.0, -1.0), (grown_bottom - y, 0.0, 1.0))
+        _, normal_x, normal_y = min(overlaps)
+        if dx * normal_x + dy * normal_y < 0:
+            return (0.0, normal_x, normal_y)
+        return None
+    
+    # Slab test against the grown box
+    t_enter = 0.0
+    t_exit = 1.0
+    normal_x = normal_y = 0.0
+    for start, delta, low, high, axis in ((x, dx, grown_left, grown_right, 0), (y, dy, grown_top, grown_bottom, 1)):
+        if delta == 0:
+            if not low <= start <= high:
+                return None
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        if t_low > t_enter:
+            t_enter = t_low
+            normal_x, normal_y = (-math.copysign(1.0, delta), 0.0) if axis == 0 else (0.0, -math.copysign(1.0, delta))
+        t_exit = min(t_exit, t_high)
+        if t_enter > t_exit:
+            return None
+    if normal_x == 0 and normal_y == 0:
+        return None
+    
+    # An entry beside a corner only counts if the ray reaches the circle around that corner
+    hit_x = x + dx * t_enter
+    hit_y = y + dy * t_enter
+    corner_x = left if hit_x < left else right if hit_x > right else None
+    corner_y = top if hit_y < top else bottom if hit_y > bottom else None
+    if corner_x is None or corner_y is None:
+        return (t_enter, normal_x, normal_y)
+    
+    # Ray against the corner circle: the smaller root of |start + t * delta - corner| = radius
+    offset_x = x - corner_x
+    offset_y = y - corner_y
+    a = dx * dx + dy * dy
+    b = offset_x * dx + offset_y * dy
+    c = offset_x * offset_x + offset_y * offset_y - radius * radius
+    discriminant = b * b - a * c
+    if b >= 0 or discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / a
+    if not 0 <= t <= 1:
+        return None
+    return (t, (offset_x + dx * t) / radius, (offset_y + dy * t) / radius)
+
 class Ball:
     """
     Represents the ball in the Pong game.
@@ -59,22 +148,99 @@ class Ball:
             self.velocity_y = random.uniform(-3, 3)
             self.game_started = True
     
-    def update(self):
-        """Update the ball's position."""
+    def update(self, paddles=(), on_paddle_hit=None):
+        """
+        Update the ball's position over one frame.
+        
+        Hits are found by sweeping the ball along its path rather than by
+        testing where it ends up, so a fast ball cannot pass through a
+        paddle or past a wall between frames. Fast balls also move in
+        sub-steps of at most SUBSTEP_SPEED pixels. Everything is plain
+        arithmetic on the current state, so the same inputs always give the
+        same result.
+        
+        Args:
+            paddles (iterable): Paddles the ball can hit
+            on_paddle_hit (callable): Called with (paddle, normal x, normal y) when
+                the ball hits a paddle, to set the new velocity; by default it reflects
+        """
         # Only move if the game has started
-        if self.game_started:
-            self.x += self.velocity_x
-            self.y += self.velocity_y
+        if not self.game_started:
+            return
+        
+        speed = math.hypot(self.velocity_x, self.velocity_y)
+        steps = max(1, math.ceil(speed / SUBSTEP_SPEED))
+        for _ in range(steps):
+            self._move(1.0 / steps, paddles, on_paddle_hit)
+    
+    def _move(self, duration, paddles, on_paddle_hit):
+        """
+        Move the ball for part of a frame, resolving hits in the order they happen.
+        
+        Args:
+            duration (float): Fraction of a frame to move for
+            paddles (iterable): Paddles the ball can hit
+            on_paddle_hit (callable): Paddle hit response, or None to reflect
+        """
+        for _ in range(MAX_IMPACTS_PER_STEP):
+            dx = self.velocity_x * duration
+            dy = self.velocity_y * duration
             
-            # Bounce off the top and bottom walls
-            if self.y - self.radius <= 0 or self.y + self.radius >= SCREEN_HEIGHT:
+            # Earliest impact with the top or bottom wall
+            impact = None
+            if dy < 0:
+                impact = (max((self.radius - self.y) / dy, 0.0), None, 0.0, 1.0)
+            elif dy > 0:
+                impact = (max((SCREEN_HEIGHT - self.radius - self.y) / dy, 0.0), None, 0.0, -1.0)
+            if impact and impact[0] > 1:
+                impact = None
+            
+            # Earlier impacts with a paddle take precedence; paddles outside the
+            # horizontal span of the move are skipped without a sweep
+            reach_left = min(self.x, self.x + dx) - self.radius
+            reach_right = max(self.x, self.x + dx) + self.radius
+            for paddle in paddles:
+                if paddle.x > reach_right or paddle.x + paddle.width < reach_left:
+                    continue
+                hit = sweep_circle_aabb(self.x, self.y, dx, dy, self.radius, paddle.x, paddle.y,
+                                        paddle.x + paddle.width, paddle.y + paddle.height)
+                if hit and (impact is None or hit[0] < impact[0]):
+                    impact = (hit[0], paddle, hit[1], hit[2])
+            
+            if impact is None:
+                self.x += dx
+                self.y += dy
+                break
+            
+            # Move to the point of impact and respond, then carry on for the rest of the time
+            t, paddle, normal_x, normal_y = impact
+            self.x += dx * t
+            self.y += dy * t
+            duration *= 1.0 - t
+            if paddle is None:
                 self.velocity_y = -self.velocity_y
-                
-                # Ensure the ball stays within bounds
-                if self.y - self.radius <= 0:
-                    self.y = self.radius
-                elif self.y + self.radius >= SCREEN_HEIGHT:
-                    self.y = SCREEN_HEIGHT - self.radius
+            elif on_paddle_hit:
+                on_paddle_hit(paddle, normal_x, normal_y)
+            else:
+                self.reflect(normal_x, normal_y)
+            if duration <= 0:
+                break
+        
+        # Ensure the ball stays within bounds
+        self.y = min(max(self.y, self.radius), SCREEN_HEIGHT - self.radius)
+    
+    def reflect(self, normal_x, normal_y):
+        """
+        Mirror the velocity about a surface.
+        
+        Args:
+            normal_x (float): Surface normal x
+            normal_y (float): Surface normal y
+        """
+        along_normal = self.velocity_x * normal_x + self.velocity_y * normal_y
+        if along_normal < 0:
+            self.velocity_x -= 2 * along_normal * normal_x
+            self.velocity_y -= 2 * along_normal * normal_y
     
     def draw(self, screen):
         """
@@ -83,6 +249,7 @@ class Ball:
         Args:
             screen (pygame.Surface): The surface to draw on
         """
+        import pygame
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
 
 class Paddle:
@@ -114,8 +281,8 @@ class Paddle:
         # Movement speed
         self.speed = 7
         
-        # Create the rect for collision detection
-        self.rect = pygame.Rect(x, y, width, height)
+        # Drawing rect, created on first use
+        self._rect = None
     
     def update(self):
         """Update the paddle's position based on movement flags."""
@@ -129,9 +296,21 @@ class Paddle:
             self.y = 0
         elif self.y + self.height > SCREEN_HEIGHT:
             self.y = SCREEN_HEIGHT - self.height
+    
+    @property
+    def rect(self):
+        """
+        Get the paddle's rectangle, kept in step with its position.
         
-        # Update the rect
-        self.rect.y = self.y
+        Returns:
+            pygame.Rect: The paddle's rectangle
+        """
+        import pygame
+        if self._rect is None:
+            self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        else:
+            self._rect.update(self.x, self.y, self.width, self.height)
+        return self._rect
     
     def draw(self, screen):
         """
@@ -140,6 +319,7 @@ class Paddle:
         Args:
             screen (pygame.Surface): The surface to draw on
         """
+        import pygame
         pygame.draw.rect(screen, self.color, self.rect)
 
 class PongLogic:
@@ -177,11 +357,8 @@ class PongLogic:
         self.player_paddle.update()
         self.ai_paddle.update()
         
-        # Update the ball
-        self.ball.update()
-        
-        # Check for collisions with paddles
-        self._check_paddle_collisions()
+        # Update the ball, bouncing it off the walls and paddles it sweeps into
+        self.ball.update((self.player_paddle, self.ai_paddle), self._bounce_off_paddle)
         
         # Check if the ball went out of bounds
         if self.ball.game_started:
@@ -194,41 +371,32 @@ class PongLogic:
         
         return None
     
-    def _check_paddle_collisions(self):
-        """Check for collisions between the ball and paddles."""
-        # Check collision with player paddle
-        if (self.ball.x - self.ball.radius <= self.player_paddle.x + self.player_paddle.width and
-            self.ball.y >= self.player_paddle.y and
-            self.ball.y <= self.player_paddle.y + self.player_paddle.height and
-            self.ball.velocity_x < 0):
-            
-            # Reverse the horizontal velocity
-            self.ball.velocity_x = -self.ball.velocity_x
-            
-            # Adjust the vertical velocity based on where the ball hit the paddle
-            # This creates more interesting bounces
-            relative_intersect_y = (self.player_paddle.y + self.player_paddle.height / 2) - self.ball.y
-            normalized_relative_intersect_y = relative_intersect_y / (self.player_paddle.height / 2)
-            bounce_angle = normalized_relative_intersect_y * (5 * math.pi / 12)  # Max angle: 75 degrees
-            self.ball.velocity_y = -self.ball.velocity_x * -math.sin(bounce_angle)
-            
-            # Increase the speed slightly
-            self.ball.velocity_x *= 1.05
-        
-        # Check collision with AI paddle
-        if (self.ball.x + self.ball.radius >= self.ai_paddle.x and
-            self.ball.y >= self.ai_paddle.y and
-            self.ball.y <= self.ai_paddle.y + self.ai_paddle.height and
-            self.ball.velocity_x > 0):
-            
-            # Reverse the horizontal velocity
-            self.ball.velocity_x = -self.ball.velocity_x
-            
-            # Adjust the vertical velocity based on where the ball hit the paddle
-            relative_intersect_y = (self.ai_paddle.y + self.ai_paddle.height / 2) - self.ball.y
-            normalized_relative_intersect_y = relative_intersect_y / (self.ai_paddle.height / 2)
-            bounce_angle = normalized_relative_intersect_y * (5 * math.pi / 12)  # Max angle: 75 degrees
-            self.ball.velocity_y = -self.ball.velocity_x * math.sin(bounce_angle)
-            
-            # Increase the speed slightly
-            self.ball.velocity_x *= 1.05
+    def _bounce_off_paddle(self, paddle, normal_x, normal_y):
+        """
+        Send the ball back after it hits a paddle.
+        
+        A hit on the face reverses the ball, angles it by where it struck
+        (up to 75 degrees from the centre outwards) and speeds it up
+        slightly; a hit on the top or bottom edge just reflects it.
+        
+        Args:
+            paddle (Paddle): The paddle that was hit
+            normal_x (float): Surface normal x at the point of impact
+            normal_y (float): Surface normal y at the point of impact
+        """
+        if abs(normal_x) < abs(normal_y):
+            self.ball.reflect(normal_x, normal_y)
+            return
+        
+        # Reverse the horizontal velocity, away from the face that was hit
+        self.ball.velocity_x = math.copysign(self.ball.velocity_x, normal_x)
+        
+        # Adjust the vertical velocity based on where the ball hit the paddle
+        # This creates more interesting bounces
+        relative_intersect_y = (paddle.y + paddle.height / 2) - self.ball.y
+        normalized_relative_intersect_y = max(-1.0, min(relative_intersect_y / (paddle.height / 2), 1.0))
+        bounce_angle = normalized_relative_intersect_y * (5 * math.pi / 12)  # Max angle: 75 degrees
+        self.ball.velocity_y = abs(self.ball.velocity_x) * math.sin(bounce_angle)
+        
+        # Increase the speed slightly
+        self.ball.velocity_x *= 1.05
@@ -0,0 +1,97 @@
+"""
+SoulCoreLegacy Arcade - Pong Trajectory Prediction
+-------------------------------------------------
+This module predicts where the ball will cross a given x position. Bounces
+off the top and bottom walls are folded in closed form, so a prediction
+costs the same however many bounces lie ahead, and the result is cached
+for as long as the ball keeps its velocity.
+"""
+
+def reflect_into_range(value, low, high):
+    """
+    Fold a position into a range as if it bounced between its ends.
+    
+    Motion between two walls is periodic with period 2 * (high - low): the
+    unfolded position is taken modulo the period and mirrored in its second
+    half.
+    
+    Args:
+        value (float): Position on a line with no walls
+        low (float): Lower wall
+        high (float): Upper wall
+    
+    Returns:
+        float: The position between low and high
+    """
+    span = high - low
+    if span <= 0:
+        return low
+    
+    offset = (value - low) % (2 * span)
+    if offset > span:
+        offset = 2 * span - offset
+    return low + offset
+
+class TrajectoryPredictor:
+    """
+    Predicts the ball's height where it reaches a target x position.
+    
+    Between hits the ball moves in a straight line, so the unfolded
+    intercept does not change from frame to frame; it is computed once and
+    reused until the ball's velocity changes (a paddle or wall hit), the
+    target moves, or invalidate() is called after the ball is moved by
+    other means.
+    """
+    
+    def __init__(self, low, high):
+        """
+        Initialize the predictor.
+        
+        Args:
+            low (float): Smallest height the ball's centre reaches (top wall plus radius)
+            high (float): Largest height the ball's centre reaches (bottom wall minus radius)
+        """
+        self.low = low
+        self.high = high
+        
+        # Last prediction and the velocity and target it was made for
+        self.cache_key = None
+        self.cached_y = None
+        
+        # Statistics
+        self.computations = 0
+        self.cache_hits = 0
+    
+    def predict(self, ball, target_x):
+        """
+        Predict the ball's height at a target x position.
+        
+        Args:
+            ball (Ball): The ball
+            target_x (float): x position of the ball's centre at the intercept
+        
+        Returns:
+            float: The predicted height, or the ball's current height if it is
+            not moving towards the target
+        """
+        cache_key = (ball.velocity_x, ball.velocity_y, target_x)
+        if cache_key == self.cache_key:
+            self.cache_hits += 1
+            return self.cached_y
+        
+        # Time until the ball reaches the target, in frames
+        distance_x = target_x - ball.x
+        if ball.velocity_x == 0 or (distance_x > 0) != (ball.velocity_x > 0):
+            return ball.y
+        time_to_reach = distance_x / ball.velocity_x
+        
+        # Unfold the walls, then fold the straight-line height back between them
+        self.computations += 1
+        self.cache_key = cache_key
+        self.cached_y = reflect_into_range(ball.y + ball.velocity_y * time_to_reach, self.low, self.high)
+        return self.cached_y
+    
+    def invalidate(self):
+        """Forget the cached prediction, e.g. after the ball was placed by hand."""
+        self.cache_key = None
+        self.cached_y = None
@@ -0,0 +1,351 @@
+"""
+SoulCoreLegacy Arcade - Pong Match Simulator
+-------------------------------------------
+This module plays headless Pong matches between the AI and an opponent,
+sweeping the AI's difficulty and reaction speed across a process pool,
+and reports win rates, rally lengths and ball speeds for each setting as
+CSV or JSON. Matches use PongLogic and PongAI directly, so workers never
+import pygame.
+
+Run it from the repository root, for example:
+    
+    python -m games.pong.simulator --matches 500 --output pong_sweep.csv
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from games.pong.logic import Ball, Paddle, PongLogic
+from games.pong.ai import PongAI
+
+# Court layout, as set up by PongGame.reset
+PADDLE_WIDTH = 10
+PADDLE_HEIGHT = 100
+PADDLE_MARGIN = 20
+BALL_RADIUS = 10
+
+# Points needed to win a match, as in PongGame
+POINTS_TO_WIN = 5
+
+# Frames after which a point is abandoned as a stalemate
+MAX_FRAMES_PER_POINT = 60 * FPS
+
+# Opponents the AI can be matched against
+OPPONENTS = ("ai", "tracker")
+
+# Defaults for the sweep and for an AI opponent (PongAI's own defaults)
+DEFAULT_DIFFICULTIES = (0.3, 0.5, 0.7, 0.9, 1.0)
+DEFAULT_REACTION_SPEEDS = (0.0, 0.1, 0.2, 0.4)
+DEFAULT_OPPONENT_DIFFICULTY = 0.7
+DEFAULT_OPPONENT_REACTION_SPEED = 0.1
+
+# Matches handed to a worker at a time
+CHUNK_SIZE = 25
+
+# Histogram bins for the JSON report: paddle hits per point and ball speed in pixels per frame
+RALLY_BINS = (0, 1, 2, 4, 8, 16, 32)
+SPEED_BINS = (0, 6, 8, 10, 12, 16, 20, 30)
+
+class TrackingOpponent:
+    """
+    A scripted opponent that keeps its paddle centred on the ball.
+    
+    It has no prediction and no reaction delay, so it only loses points
+    once the ball moves vertically faster than the paddle can.
+    """
+    
+    def __init__(self, paddle, ball):
+        """
+        Initialize the opponent.
+        
+        Args:
+            paddle (Paddle): The opponent's paddle
+            ball (Ball): The ball object
+        """
+        self.paddle = paddle
+        self.ball = ball
+    
+    def update(self):
+        """Steer the paddle towards the ball's height."""
+        center = self.paddle.y + self.paddle.height / 2
+        self.paddle.moving_up = center > self.ball.y + self.paddle.speed
+        self.paddle.moving_down = center < self.ball.y - self.paddle.speed
+
+def simulate_match(difficulty, reaction_speed, opponent="ai",
+                   opponent_difficulty=DEFAULT_OPPONENT_DIFFICULTY,
+                   opponent_reaction_speed=DEFAULT_OPPONENT_REACTION_SPEED,
+                   seed=None, points_to_win=POINTS_TO_WIN):
+    """
+    Play one match, with the AI under test on the right as in the game.
+    
+    The module-level random generator, which both the ball's serve and
+    PongAI draw from, is seeded first, so a seed always replays the same
+    match.
+    
+    Args:
+        difficulty (float): The AI's difficulty (0.0 to 1.0)
+        reaction_speed (float): The AI's reaction delay in seconds
+        opponent (str): "ai" for a second PongAI, or "tracker" for a TrackingOpponent
+        opponent_difficulty (float): Difficulty of an AI opponent
+        opponent_reaction_speed (float): Reaction delay of an AI opponent
+        seed (int): Seed for the match
+        points_to_win (int): Points needed to win
+    
+    Returns:
+        dict: "won", "points_won", "points_lost" and "stalled" points, plus the
+        paddle hits of every point ("rallies") and the ball speed after every hit ("speeds")
+    """
+    if opponent not in OPPONENTS:
+        raise ValueError(f"Unknown opponent {opponent!r}, expected one of {OPPONENTS}")
+    random.seed(seed)
+    
+    # Set up the court
+    paddle_y = SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2
+    left_paddle = Paddle(PADDLE_MARGIN, paddle_y, PADDLE_WIDTH, PADDLE_HEIGHT, None)
+    right_paddle = Paddle(SCREEN_WIDTH - PADDLE_MARGIN - PADDLE_WIDTH, paddle_y, PADDLE_WIDTH, PADDLE_HEIGHT, None)
+    ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, BALL_RADIUS, None)
+    logic = PongLogic(ball, left_paddle, right_paddle)
+    
+    # Set up the players
+    ai = PongAI(right_paddle, ball)
+    ai.difficulty = difficulty
+    ai.reaction_speed = reaction_speed
+    if opponent == "ai":
+        rival = PongAI(left_paddle, ball)
+        rival.difficulty = opponent_difficulty
+        rival.reaction_speed = opponent_reaction_speed
+    else:
+        rival = TrackingOpponent(left_paddle, ball)
+    
+    points_won = 0
+    points_lost = 0
+    stalled = 0
+    rallies = []
+    speeds = []
+    while max(points_won, points_lost) < points_to_win and stalled < points_to_win:
+        ball.reset()
+        logic.start_game()
+        
+        # Play the point out, counting the hits as the ball changes direction
+        hits = 0
+        result = None
+        for _ in range(MAX_FRAMES_PER_POINT):
+            ai.update()
+            rival.update()
+            moving_right = ball.velocity_x > 0
+            result = logic.update()
+            if (ball.velocity_x > 0) != moving_right:
+                hits += 1
+                speeds.append(round(math.hypot(ball.velocity_x, ball.velocity_y), 3))
+            if result:
+                break
+        
+        rallies.append(hits)
+        if result == "ai_scored":
+            points_won += 1
+        elif result == "player_scored":
+            points_lost += 1
+        else:
+            stalled += 1
+    
+    return {
+        "won": points_won >= points_to_win,
+        "points_won": points_won,
+        "points_lost": points_lost,
+        "stalled": stalled,
+        "rallies": rallies,
+        "speeds": speeds
+    }
+
+def _simulate_matches(settings, seeds):
+    """
+    Play a chunk of matches with the same settings; runs in a worker.
+    
+    Args:
+        settings (dict): simulate_match arguments other than the seed
+        seeds (list): One seed per match
+    
+    Returns:
+        list: The match results, in seed order
+    """
+    return [simulate_match(seed=seed, **settings) for seed in seeds]
+
+def run_sweep(difficulties=DEFAULT_DIFFICULTIES, reaction_speeds=DEFAULT_REACTION_SPEEDS, matches=200,
+              opponent="ai", opponent_difficulty=DEFAULT_OPPONENT_DIFFICULTY,
+              opponent_reaction_speed=DEFAULT_OPPONENT_REACTION_SPEED, workers=None, seed=0,
+              chunk_size=CHUNK_SIZE):
+    """
+    Play matches for every combination of difficulty and reaction speed.
+    
+    Every setting plays the same seeds, so settings are compared on the
+    same serves, and the report does not depend on how the matches were
+    spread over the workers.
+    
+    Args:
+        difficulties (iterable): AI difficulties to try
+        reaction_speeds (iterable): AI reaction delays to try, in seconds
+        matches (int): Matches per setting
+        opponent (str): "ai" or "tracker"
+        opponent_difficulty (float): Difficulty of an AI opponent
+        opponent_reaction_speed (float): Reaction delay of an AI opponent
+        workers (int): Worker processes (None for one per CPU, 0 to play in this process)
+        seed (int): Seed of the first match; match i uses seed + i
+        chunk_size (int): Matches handed to a worker at a time
+    
+    Returns:
+        list: One summary dict per setting (see summarize)
+    """
+    grid = [{
+        "difficulty": difficulty,
+        "reaction_speed": reaction_speed,
+        "opponent": opponent,
+        "opponent_difficulty": opponent_difficulty,
+        "opponent_reaction_speed": opponent_reaction_speed
+    } for difficulty in difficulties for reaction_speed in reaction_speeds]
+    seeds = [seed + i for i in range(matches)]
+    chunks = [seeds[start:start + chunk_size] for start in range(0, matches, chunk_size)]
+    
+    # Play every chunk, in this process or spread over the pool
+    if workers == 0:
+        outcomes = [[_simulate_matches(settings, chunk) for chunk in chunks] for settings in grid]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [[executor.submit(_simulate_matches, settings, chunk) for chunk in chunks] for settings in grid]
+            outcomes = [[future.result() for future in row] for row in futures]
+    
+    return [summarize(settings, [result for chunk in row for result in chunk])
+            for settings, row in zip(grid, outcomes)]
+
+def summarize(settings, results):
+    """
+    Reduce the matches played with one setting to a report row.
+    
+    Args:
+        settings (dict): The setting the matches were played with
+        results (list): simulate_match results
+    
+    Returns:
+        dict: The setting, win rate and point totals, rally length and ball
+        speed statistics, and "rally_histogram" and "speed_histogram" counts
+        over RALLY_BINS and SPEED_BINS
+    """
+    rallies = sorted(rally for result in results for rally in result["rallies"])
+    speeds = sorted(speed for result in results for speed in result["speeds"])
+    wins = sum(result["won"] for result in results)
+    
+    row = dict(settings)
+    row.update({
+        "matches": len(results),
+        "wins": wins,
+        "win_rate": wins / len(results) if results else 0.0,
+        "points_won": sum(result["points_won"] for result in results),
+        "points_lost": sum(result["points_lost"] for result in results),
+        "stalled_points": sum(result["stalled"] for result in results)
+    })
+    for name, values in (("rally", rallies), ("speed", speeds)):
+        row[f"{name}_mean"] = sum(values) / len(values) if values else 0.0
+        row[f"{name}_median"] = _percentile(values, 0.5)
+        row[f"{name}_p90"] = _percentile(values, 0.9)
+        row[f"{name}_max"] = values[-1] if values else 0.0
+    row["rally_histogram"] = _histogram(rallies, RALLY_BINS)
+    row["speed_histogram"] = _histogram(speeds, SPEED_BINS)
+    return row
+
+def _percentile(values, fraction):
+    """
+    Get a nearest-rank percentile.
+    
+    Args:
+        values (list): Sorted values
+        fraction (float): Percentile as a fraction (0.5 for the median)
+    
+    Returns:
+        float: The value at that rank, or 0.0 with no values
+    """
+    if not values:
+        return 0.0
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+def _histogram(values, bins):
+    """
+    Count values into bins.
+    
+    Args:
+        values (list): Sorted values
+        bins (tuple): Lower edges of the bins; the last bin is open-ended
+    
+    Returns:
+        dict: Count per bin, keyed by a label such as "4-8" or "32+"
+    """
+    labels = [f"{low}-{high}" for low, high in zip(bins, bins[1:])] + [f"{bins[-1]}+"]
+    counts = dict.fromkeys(labels, 0)
+    index = 0
+    for value in values:
+        while index + 1 < len(bins) and value >= bins[index + 1]:
+            index += 1
+        counts[labels[index]] += 1
+    return counts
+
+def write_report(rows, path):
+    """
+    Save sweep results, as CSV if the path ends in .csv and JSON otherwise.
+    
+    The CSV has one line per setting and leaves out the histograms.
+    
+    Args:
+        rows (list): Rows from run_sweep
+        path (str): File to write
+    """
+    if str(path).lower().endswith(".csv"):
+        fields = [field for field in rows[0] if not field.endswith("_histogram")] if rows else []
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+def main(argv=None):
+    """
+    Run a sweep from the command line and print a summary table.
+    
+    Args:
+        argv (list): Command line arguments (defaults to sys.argv)
+    
+    Returns:
+        list: The report rows
+    """
+    parser = argparse.ArgumentParser(description="Sweep Pong AI settings over headless matches.")
+    parser.add_argument("--difficulties", type=float, nargs="+", default=DEFAULT_DIFFICULTIES)
+    parser.add_argument("--reaction-speeds", type=float, nargs="+", default=DEFAULT_REACTION_SPEEDS)
+    parser.add_argument("--matches", type=int, default=200, help="matches per setting")
+    parser.add_argument("--opponent", choices=OPPONENTS, default="ai")
+    parser.add_argument("--opponent-difficulty", type=float, default=DEFAULT_OPPONENT_DIFFICULTY)
+    parser.add_argument("--opponent-reaction-speed", type=float, default=DEFAULT_OPPONENT_REACTION_SPEED)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (0 to run in this process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="pong_sweep.json", help="report file (.csv or .json)")
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    rows = run_sweep(args.difficulties, args.reaction_speeds, args.matches, args.opponent,
+                     args.opponent_difficulty, args.opponent_reaction_speed, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    write_report(rows, args.output)
+    
+    print(f"{'difficulty':>10} {'reaction':>8} {'win rate':>8} {'rally':>6} {'speed p90':>9}")
+    for row in rows:
+        print(f"{row['difficulty']:>10.2f} {row['reaction_speed']:>8.2f} {row['win_rate']:>8.1%} "
+              f"{row['rally_mean']:>6.2f} {row['speed_p90']:>9.2f}")
+    total = len(rows) * args.matches
+    print(f"{total} matches in {elapsed:.1f}s ({total / elapsed:.0f}/s), report saved to {args.output}")
+    return rows
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,642 @@
+"""
+SoulCoreLegacy Arcade - Snake AI
+-------------------------------
+This module implements an autopilot for the Snake game. It plans routes to
+the food with A* over a precomputed neighbour table, only takes a route if
+the snake could still reach its own tail after eating, and otherwise
+follows its tail until a safe route opens up.
+"""
+
+import heapq
+import time
+from array import array
+from games.snake.logic import SnakeLogic
+
+# Direction names in neighbour table order, and their grid steps
+DIRECTIONS = ("UP", "DOWN", "LEFT", "RIGHT")
+DIRECTION_STEPS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Ticks between attempts to find a safe route to the food while following the tail
+REPLAN_INTERVAL = 8
+
+# Hunger limit as a multiple of the free cells: ticks without eating after which the AI takes riskier routes,
+# and after twice as many any route to the food
+HUNGER_FACTOR = 4
+
+# Plan modes
+PLAN_NONE = "none"
+PLAN_FOOD = "food"
+PLAN_TAIL = "tail"
+
+# Neighbour tables keyed by (grid width, grid height, wrap-around)
+_neighbor_tables = {}
+
+def get_neighbor_table(grid_width, grid_height, wrap_around):
+    """
+    Get the neighbours of every cell of a grid, building them once per grid shape.
+    
+    Args:
+        grid_width (int): Columns in the grid
+        grid_height (int): Rows in the grid
+        wrap_around (bool): Whether edges connect to the opposite side
+    
+    Returns:
+        tuple: One array per direction in DIRECTIONS giving, for each flat
+        cell index (row * grid_width + column), the neighbouring cell's
+        index, or -1 where a wall is in the way
+    """
+    key = (grid_width, grid_height, wrap_around)
+    table = _neighbor_tables.get(key)
+    if table is not None:
+        return table
+    
+    table = []
+    for dx, dy in DIRECTION_STEPS:
+        neighbors = []
+        for y in range(grid_height):
+            ny = y + dy
+            if wrap_around:
+                ny %= grid_height
+            for x in range(grid_width):
+                nx = x + dx
+                if wrap_around:
+                    nx %= grid_width
+                if 0 <= nx < grid_width and 0 <= ny < grid_height:
+                    neighbors.append(ny * grid_width + nx)
+                else:
+                    neighbors.append(-1)
+        table.append(array('i', neighbors))
+    
+    table = _neighbor_tables[key] = tuple(table)
+    return table
+
+def get_tail_distance(pending_growth):
+    """
+    Get the fewest moves in which the head can safely reach the tail's cell.
+    
+    The tail stays put while the snake grows and leaves its cell only after
+    the head has moved on the following move, so a move onto the tail's
+    current cell is always fatal.
+    
+    Args:
+        pending_growth (int): Segments the snake will still grow by
+    
+    Returns:
+        int: Minimum path length from the head to the tail
+    """
+    return pending_growth + 2
+
+class SnakeAI:
+    """
+    Autopilot for a SnakeLogic game.
+    
+    The AI mirrors the snake in a flat occupancy array that is updated from
+    the head and tail changes of each move. A route is planned when the
+    food moves or the route stops being valid and is then followed one step
+    per tick without searching again. A route to the food is only taken if,
+    once the snake has followed it and eaten, its head can still reach its
+    tail. Otherwise the AI follows its own tail, extending that route as
+    the tail moves, and retries the food about every replan_interval ticks
+    (staggered, so a snake circling a loop tries from different cells); with
+    no route at all it moves to the neighbour with the most room.
+    
+    Following the tail can settle into a loop that never opens a safe route
+    to the food. Once the snake has gone longer without eating than there
+    are free cells (times hunger_factor), it is hungry: it retries the food
+    every tick and takes a route if the free space behind the food is as
+    large as the snake (or is all the free space there is), and otherwise
+    follows its tail by the shortest route instead of the long way round,
+    which changes the shape of the loop. After twice as long it is starving
+    and takes any route to the food, even one it may not survive.
+    """
+    
+    def __init__(self, logic, replan_interval=REPLAN_INTERVAL, blocked=None, hunger_factor=HUNGER_FACTOR):
+        """
+        Initialize the AI.
+        
+        Args:
+            logic (SnakeLogic): The game to play, or any object with the same
+                snake, food, grid_width, grid_height and wrap_around attributes
+            replan_interval (int): Ticks between food retries while following the tail
+            blocked (bytearray): Optional occupancy shared by several snakes, indexed
+                by flat cell and kept up to date by its owner instead of by the AI
+            hunger_factor (float): Multiple of the free cells the snake may go without eating
+                before it takes riskier routes
+        """
+        self.logic = logic
+        self.replan_interval = replan_interval
+        self.hunger_factor = hunger_factor
+        self.shared_blocked = blocked
+        
+        # Grid the tables and buffers were built for
+        self.grid_key = None
+        self.neighbors = None
+        self.blocked = blocked
+        
+        # Search buffers reused between searches; entries are valid where seen == stamp
+        self.seen = None
+        self.parent = None
+        self.cost = None
+        self.stamp = 0
+        
+        # Body the occupancy mirrors; set_body and reset replace the deque
+        self.body = None
+        self.synced_moves = 0
+        
+        # Current route, as flat cells still to visit
+        self.plan = []
+        self.plan_index = 0
+        self.plan_mode = PLAN_NONE
+        self.plan_food = None
+        self.ticks_since_plan = 0
+        self.retry_delay = replan_interval
+        self.failed_retries = 0
+        
+        # Ticks since the snake last grew, and the length it grew to
+        self.ticks_since_food = 0
+        self.fed_length = None
+        
+        # Planning statistics
+        self.searches = 0
+        self.planning_time = 0.0
+    
+    def next_direction(self):
+        """
+        Choose the direction for the next tick.
+        
+        Returns:
+            str: "UP", "DOWN", "LEFT" or "RIGHT", or None if every move is fatal
+        """
+        self._sync()
+        snake = self.logic.snake
+        head = self._flat(snake.head)
+        food = self.logic.food
+        food = self._flat(food.position) if food is not None and food.position is not None else None
+        self.ticks_since_plan += 1
+        
+        # Count the ticks since the snake last ate, which a new game also resets
+        if snake.length != self.fed_length:
+            self.fed_length = snake.length
+            self.ticks_since_food = 0
+        else:
+            self.ticks_since_food += 1
+        
+        # Extend a tail-following route by the cell the tail has moved to
+        if self.plan_mode == PLAN_TAIL:
+            tail = self._flat(snake.body[-1])
+            if self.plan[-1] != tail:
+                self.plan.append(tail)
+        
+        # Plan again when the food moved, the route is used up or blocked, or it is time to retry the food
+        if (self.plan_index >= len(self.plan) or self.blocked[self.plan[self.plan_index]] or
+                (self.plan_mode == PLAN_FOOD and self.plan_food != food) or
+                (self.plan_mode == PLAN_TAIL and self.ticks_since_plan >= self.retry_delay) or
+                self._get_direction(head, self.plan[self.plan_index]) is None):
+            self._plan(head, food)
+        
+        if self.plan_index < len(self.plan):
+            next_cell = self.plan[self.plan_index]
+            self.plan_index += 1
+            return self._get_direction(head, next_cell)
+        return self._get_escape_direction(head)
+    
+    def _plan(self, head, food):
+        """
+        Choose a new route.
+        
+        Args:
+            head (int): Flat cell of the head
+            food (int): Flat cell of the food, or None
+        """
+        start = time.perf_counter()
+        self.plan = []
+        self.plan_index = 0
+        self.plan_mode = PLAN_NONE
+        self.plan_food = food
+        self.ticks_since_plan = 0
+        hunger = self.get_hunger()
+        
+        # Go for the food if the snake can still reach its tail afterwards, has room enough when hungry,
+        # or at all when starving
+        if food is not None:
+            path = self._find_path(head, food, self.blocked)
+            if path and (hunger >= 2 or self._is_safe_after(path) or (hunger and self._has_room_after(path))):
+                self.plan = path
+                self.plan_mode = PLAN_FOOD
+                self.failed_retries = 0
+        
+        # Otherwise follow the tail, if it will have moved off its cell by the time the head gets there,
+        # keeping off the food since eating it was just found unsafe
+        if self.plan_mode == PLAN_NONE:
+            snake = self.logic.snake
+            tail = self._flat(snake.body[-1])
+            min_length = get_tail_distance(snake.length - len(snake.body))
+            find_tail_path = self._find_tail_path if hunger else self._find_long_tail_path
+            if food is not None:
+                self.blocked[food] = 1
+            path = find_tail_path(head, tail, self.blocked, min_length)
+            if food is not None:
+                self.blocked[food] = 0
+                
+                # A route through the food still beats having none
+                if not path:
+                    path = find_tail_path(head, tail, self.blocked, min_length)
+            if path:
+                self.plan = path
+                self.plan_mode = PLAN_TAIL
+                self.retry_delay = 1 if hunger else self.replan_interval + self.failed_retries % self.replan_interval
+                self.failed_retries += 1
+        
+        self.planning_time += time.perf_counter() - start
+    
+    def get_hunger(self):
+        """
+        Get how long the snake has gone without eating.
+        
+        Returns:
+            int: 0 while fed, 1 once the ticks since the last food reach the free
+            cells times hunger_factor (hungry), 2 after twice that (starving)
+        """
+        limit = (len(self.blocked) - len(self.logic.snake.body)) * self.hunger_factor
+        return min(int(self.ticks_since_food // max(limit, 1)), 2)
+    
+    def _is_safe_after(self, path):
+        """
+        Check that the tail is reachable once the snake has followed a path and eaten.
+        
+        Args:
+            path (list): Flat cells from the head's first step to the food
+        
+        Returns:
+            bool: True if the head can reach the tail afterwards
+        """
+        blocked, tail, length_after = self._get_board_after(path)
+        
+        # The snake grows after eating, so its tail stays put for at least one more move
+        min_length = get_tail_distance(self.logic.snake.length + 1 - length_after)
+        return self._find_tail_path(path[-1], tail, blocked, min_length) is not None
+    
+    def _has_room_after(self, path):
+        """
+        Check that the head has room once the snake has followed a path and eaten.
+        
+        This is the weaker check used when hungry: the free space reachable
+        from the food must be at least as large as the snake, or take in
+        every free cell when there are fewer than that.
+        
+        Args:
+            path (list): Flat cells from the head's first step to the food
+        
+        Returns:
+            bool: True if there is room enough afterwards
+        """
+        blocked, _, length_after = self._get_board_after(path)
+        limit = min(length_after, len(blocked) - length_after)
+        return self._count_room(path[-1], limit, blocked) >= limit
+    
+    def _get_board_after(self, path):
+        """
+        Work out the board once the snake has followed a path.
+        
+        Args:
+            path (list): Flat cells from the head's first step to the food
+        
+        Returns:
+            tuple: (occupancy copy, flat cell of the tail, body length)
+        """
+        snake = self.logic.snake
+        body_length = len(snake.body)
+        steps = len(path)
+        length_after = min(body_length + steps, snake.length)
+        
+        # Cells the tail leaves while the snake follows the path become free
+        blocked = bytearray(self.blocked)
+        dropped = body_length + steps - length_after
+        for index, cell in enumerate(reversed(snake.body)):
+            if index >= dropped:
+                break
+            blocked[self._flat(cell)] = 0
+        for cell in path:
+            blocked[cell] = 1
+        
+        # The tail afterwards is on the path if the snake is no longer than it, else in the old body
+        if length_after <= steps:
+            tail = path[steps - length_after]
+        else:
+            tail = self._flat(snake.body[length_after - steps - 1])
+        return blocked, tail, length_after
+    
+    def _find_tail_path(self, start, tail, blocked, min_length):
+        """
+        Find a path to the tail that is long enough for the tail to have moved off.
+        
+        The shortest path is used if it is long enough; otherwise each free
+        first step is tried in turn, blocked like the body it becomes, and
+        the rest of the path searched from there. min_length is small (two
+        moves, plus one per pending segment), so this stays cheap.
+        
+        Args:
+            start (int): Flat cell of the head
+            tail (int): Flat cell of the tail
+            blocked (bytearray): Non-zero for cells that cannot be entered; restored before returning
+            min_length (int): Fewest moves the path may take
+        
+        Returns:
+            list: Flat cells from the first step to the tail, or None if there is no such path
+        """
+        path = self._find_path(start, tail, blocked)
+        if not path or len(path) >= min_length:
+            return path
+        
+        for table in self.neighbors:
+            cell = table[start]
+            if cell < 0 or blocked[cell]:
+                continue
+            blocked[cell] = 1
+            rest = self._find_tail_path(cell, tail, blocked, min_length - 1)
+            blocked[cell] = 0
+            if rest:
+                return [cell] + rest
+        return None
+    
+    def _find_long_tail_path(self, start, tail, blocked, min_length):
+        """
+        Find a path to the tail through the first step that makes it longest.
+        
+        Always chasing the tail by the shortest path keeps the body in the
+        same shape, which can wall the food off for good; taking the long
+        way round instead spreads the body over the free space.
+        
+        Args:
+            start (int): Flat cell of the head
+            tail (int): Flat cell of the tail
+            blocked (bytearray): Non-zero for cells that cannot be entered; restored before returning
+            min_length (int): Fewest moves the path may take
+        
+        Returns:
+            list: Flat cells from the first step to the tail, or None if there is no such path
+        """
+        best = None
+        for table in self.neighbors:
+            cell = table[start]
+            if cell < 0 or blocked[cell]:
+                continue
+            blocked[cell] = 1
+            rest = self._find_tail_path(cell, tail, blocked, min_length - 1)
+            blocked[cell] = 0
+            if rest and (best is None or len(rest) >= len(best)):
+                best = [cell] + rest
+        return best
+    
+    def _find_path(self, start, goal, blocked):
+        """
+        Find a shortest path with A*.
+        
+        Args:
+            start (int): Flat cell to start from
+            goal (int): Flat cell to reach; it may be blocked itself
+            blocked (bytearray): Non-zero for cells that cannot be entered
+        
+        Returns:
+            list: Flat cells from the first step to the goal, or None if unreachable
+        """
+        self.searches += 1
+        self.stamp += 1
+        stamp = self.stamp
+        seen, parent, cost = self.seen, self.parent, self.cost
+        neighbors = self.neighbors
+        width, height, wrap_around = self.grid_key
+        goal_y, goal_x = divmod(goal, width)
+        
+        seen[start] = stamp
+        cost[start] = 0
+        parent[start] = -1
+        heap = [(0, 0, start)]
+        while heap:
+            _, negative_cost, cell = heapq.heappop(heap)
+            if cell == goal:
+                break
+            step_cost = -negative_cost
+            if step_cost > cost[cell]:
+                continue
+            step_cost += 1
+            
+            for table in neighbors:
+                next_cell = table[cell]
+                if next_cell < 0 or (blocked[next_cell] and next_cell != goal):
+                    continue
+                if seen[next_cell] == stamp and cost[next_cell] <= step_cost:
+                    continue
+                seen[next_cell] = stamp
+                cost[next_cell] = step_cost
+                parent[next_cell] = cell
+                
+                # Manhattan distance, the short way round when the edges wrap
+                y, x = divmod(next_cell, width)
+                dx = abs(x - goal_x)
+                dy = abs(y - goal_y)
+                if wrap_around:
+                    dx = min(dx, width - dx)
+                    dy = min(dy, height - dy)
+                heapq.heappush(heap, (step_cost + dx + dy, -step_cost, next_cell))
+        else:
+            return None
+        
+        path = []
+        cell = goal
+        while cell != start:
+            path.append(cell)
+            cell = parent[cell]
+        path.reverse()
+        return path
+    
+    def _get_escape_direction(self, head):
+        """
+        Pick the safe move with the most room when no route exists.
+        
+        Args:
+            head (int): Flat cell of the head
+        
+        Returns:
+            str: The direction, or None if every move is fatal
+        """
+        best_direction = None
+        best_room = -1
+        limit = len(self.logic.snake.body)
+        for direction, table in zip(DIRECTIONS, self.neighbors):
+            cell = table[head]
+            if cell < 0 or self.blocked[cell]:
+                continue
+            room = self._count_room(cell, limit)
+            if room > best_room:
+                best_direction = direction
+                best_room = room
+        return best_direction
+    
+    def _count_room(self, start, limit, blocked=None):
+        """
+        Count the free cells reachable from a cell, stopping at a limit.
+        
+        Args:
+            start (int): Flat cell to start from
+            limit (int): Count at which the room is considered enough
+            blocked (bytearray): Occupancy to use instead of the current one
+        
+        Returns:
+            int: Number of reachable free cells, at most limit
+        """
+        if blocked is None:
+            blocked = self.blocked
+        self.stamp += 1
+        stamp = self.stamp
+        seen = self.seen
+        seen[start] = stamp
+        frontier = [start]
+        count = 1
+        while frontier and count < limit:
+            next_frontier = []
+            for cell in frontier:
+                for table in self.neighbors:
+                    next_cell = table[cell]
+                    if next_cell >= 0 and not blocked[next_cell] and seen[next_cell] != stamp:
+                        seen[next_cell] = stamp
+                        next_frontier.append(next_cell)
+            count += len(next_frontier)
+            frontier = next_frontier
+        return min(count, limit)
+    
+    def _get_direction(self, cell, next_cell):
+        """
+        Get the direction from a cell to a neighbouring cell.
+        
+        Args:
+            cell (int): Flat cell to move from
+            next_cell (int): Flat cell to move to
+        
+        Returns:
+            str: The direction, or None if the cells are not neighbours
+        """
+        for direction, table in zip(DIRECTIONS, self.neighbors):
+            if table[cell] == next_cell:
+                return direction
+        return None
+    
+    def _sync(self):
+        """Bring the occupancy mirror and buffers up to date with the game."""
+        logic = self.logic
+        snake = logic.snake
+        grid_key = (logic.grid_width, logic.grid_height, logic.wrap_around)
+        
+        # New grid shape or wrap mode: new tables and buffers
+        if grid_key != self.grid_key:
+            self.grid_key = grid_key
+            self.neighbors = get_neighbor_table(*grid_key)
+            cell_count = logic.grid_width * logic.grid_height
+            self.seen = array('i', bytes(4 * cell_count))
+            self.parent = array('i', bytes(4 * cell_count))
+            self.cost = array('i', bytes(4 * cell_count))
+            self.stamp = 0
+            self.body = None
+        
+        if snake.body is self.body and snake.moves == self.synced_moves:
+            return
+        
+        # A shared board is kept up to date by its owner; a new body only needs a new route
+        if self.shared_blocked is not None:
+            if snake.body is not self.body:
+                self.plan = []
+                self.plan_index = 0
+                self.plan_mode = PLAN_NONE
+        
+        # One move since the last tick: mark the new head and clear the cell the tail left
+        elif snake.body is self.body and snake.moves == self.synced_moves + 1:
+            self.blocked[self._flat(snake.head)] = 1
+            if snake.previous_tail is not None:
+                self.blocked[self._flat(snake.previous_tail)] = 0
+        else:
+            # New game, restored game or missed ticks: rebuild from the body
+            self.blocked = bytearray(logic.grid_width * logic.grid_height)
+            for cell in snake.occupied:
+                self.blocked[self._flat(cell)] = 1
+            self.plan = []
+            self.plan_index = 0
+            self.plan_mode = PLAN_NONE
+        
+        self.body = snake.body
+        self.synced_moves = snake.moves
+    
+    def _flat(self, cell):
+        """
+        Get the flat index of a (column, row) cell.
+        
+        Args:
+            cell (tuple): The cell
+        
+        Returns:
+            int: row * grid width + column
+        """
+        return cell[1] * self.logic.grid_width + cell[0]
+
+def benchmark(grid_sizes=((40, 30), (100, 100), (250, 250), (500, 500)), ticks=5000, wrap_around=False, seed=0):
+    """
+    Measure planning cost per tick on grids of several sizes.
+    
+    Args:
+        grid_sizes (iterable): (columns, rows) of each grid to run
+        ticks (int): Ticks to play on each grid, restarting after a game over
+        wrap_around (bool): Whether the snake wraps around the grid edges
+        seed (int): Seed for food placement
+    
+    Returns:
+        list: One dict per grid with the table build time in milliseconds,
+        tick timings in microseconds, searches, best score and games played
+    """
+    import random
+    random.seed(seed)
+    
+    results = []
+    for grid_size in grid_sizes:
+        logic = SnakeLogic(1, (0, 0, 0), (0, 0, 0), wrap_around, grid_size=grid_size)
+        ai = SnakeAI(logic)
+        
+        # The neighbour table is built once per grid shape, so time it separately
+        _neighbor_tables.pop((grid_size[0], grid_size[1], wrap_around), None)
+        start = time.perf_counter()
+        get_neighbor_table(grid_size[0], grid_size[1], wrap_around)
+        table_time = time.perf_counter() - start
+        
+        tick_times = []
+        best_score = 0
+        games = 1
+        for _ in range(ticks):
+            start = time.perf_counter()
+            direction = ai.next_direction()
+            tick_times.append(time.perf_counter() - start)
+            
+            if direction:
+                logic.change_direction(direction)
+            if not logic.update():
+                best_score = max(best_score, logic.score)
+                logic.reset()
+                games += 1
+        best_score = max(best_score, logic.score)
+        
+        tick_times.sort()
+        results.append({
+            'grid': grid_size,
+            'table_ms': round(table_time * 1000.0, 1),
+            'mean_us': round(sum(tick_times) / len(tick_times) * 1e6, 1),
+            'p99_us': round(tick_times[int(len(tick_times) * 0.99)] * 1e6, 1),
+            'max_us': round(tick_times[-1] * 1e6, 1),
+            'searches': ai.searches,
+            'best_score': best_score,
+            'games': games
+        })
+    return results
+
+if __name__ == "__main__":
+    for result in benchmark():
+        width, height = result['grid']
+        print(f"{width}x{height}: {result['table_ms']} ms table, {result['mean_us']} us mean, {result['p99_us']} us p99, "
+              f"{result['max_us']} us max per tick, {result['searches']} searches, "
+              f"best score {result['best_score']} in {result['games']} games")
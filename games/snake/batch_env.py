@@ -0,0 +1,317 @@
+"""
+SoulCoreLegacy Arcade - Batch Snake Environment
+----------------------------------------------
+This module simulates many independent Snake games in lockstep with NumPy
+arrays, for training and evaluating autopilot agents without a display.
+The rules are those of SnakeLogic: reversing is ignored, a snake stands
+still until its first turn, hitting a wall (unless wrapping) or any
+segment ends the game, eating grows the snake by one on its next move,
+and a board with no room left for food is a win.
+"""
+
+import time
+import numpy as np
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Actions, in the same order as the names used by SnakeLogic.change_direction
+ACTION_UP = 0
+ACTION_DOWN = 1
+ACTION_LEFT = 2
+ACTION_RIGHT = 3
+ACTION_NAMES = ("UP", "DOWN", "LEFT", "RIGHT")
+
+# Grid step and opposite of each action
+ACTION_DX = np.array([0, 0, -1, 1], dtype=np.int32)
+ACTION_DY = np.array([-1, 1, 0, 0], dtype=np.int32)
+ACTION_OPPOSITE = np.array([ACTION_DOWN, ACTION_UP, ACTION_RIGHT, ACTION_LEFT], dtype=np.int8)
+
+# Rewards per step
+REWARD_FOOD = 1.0
+REWARD_DEATH = -1.0
+
+# Vectorized random draws tried before picking food cells exactly on nearly full boards
+FOOD_SAMPLE_TRIES = 4
+
+# Columns of the observation array
+OBSERVATION_FIELDS = ("head_x", "head_y", "food_x", "food_y", "direction", "length")
+
+class BatchSnakeEnv:
+    """
+    Lockstep batch of Snake games.
+    
+    Every game has an occupancy grid and a ring buffer of its body cells
+    (flat cell indices, head at head_index), so a step is a fixed number of
+    array operations over the whole batch whatever the snake lengths.
+    Games that end are reset automatically at the end of the step unless
+    auto_reset is off, in which case they ignore actions until reset().
+    
+    Observations are an int32 array of shape (num_envs, 6) with the columns
+    in OBSERVATION_FIELDS; the occupancy grids are available as
+    occupancy[env, row, column] for agents that need the whole board.
+    """
+    
+    def __init__(self, num_envs, grid_width=SCREEN_WIDTH // 20, grid_height=SCREEN_HEIGHT // 20,
+                 wrap_around=False, auto_reset=True, seed=None):
+        """
+        Initialize the environment.
+        
+        Args:
+            num_envs (int): Number of games simulated together
+            grid_width (int): Columns in each grid (defaults to the Snake game's)
+            grid_height (int): Rows in each grid
+            wrap_around (bool): If True, snakes wrap around the grid edges
+            auto_reset (bool): Whether finished games restart during step()
+            seed (int): Seed for food placement
+        """
+        # The starting snake is three cells long, ending left of the centre column
+        if grid_width < 4 or grid_height < 1:
+            raise ValueError("The grid must be at least 4 cells wide and 1 cell high")
+        
+        self.num_envs = num_envs
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.num_cells = grid_width * grid_height
+        self.wrap_around = wrap_around
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+        
+        # Boards and bodies
+        self.occupancy = np.zeros((num_envs, grid_height, grid_width), dtype=np.uint8)
+        self.occupancy_flat = self.occupancy.reshape(num_envs, self.num_cells)
+        self.body = np.zeros((num_envs, self.num_cells), dtype=np.int32)
+        self.head_index = np.zeros(num_envs, dtype=np.int32)
+        self.body_length = np.zeros(num_envs, dtype=np.int32)
+        
+        # Per-game state
+        self.head_x = np.zeros(num_envs, dtype=np.int32)
+        self.head_y = np.zeros(num_envs, dtype=np.int32)
+        self.direction = np.zeros(num_envs, dtype=np.int8)
+        self.moving = np.zeros(num_envs, dtype=bool)
+        self.length = np.zeros(num_envs, dtype=np.int32)
+        self.food = np.zeros(num_envs, dtype=np.int32)
+        self.score = np.zeros(num_envs, dtype=np.int32)
+        self.finished = np.zeros(num_envs, dtype=bool)
+        self.won = np.zeros(num_envs, dtype=bool)
+        
+        self.reset()
+    
+    def reset(self, env_ids=None, seed=None):
+        """
+        Start new games.
+        
+        Args:
+            env_ids (array): Games to reset, or None for all of them
+            seed (int): Optional new seed for food placement
+        
+        Returns:
+            numpy.ndarray: The observations
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        ids = np.arange(self.num_envs) if env_ids is None else np.asarray(env_ids, dtype=np.intp)
+        if ids.size:
+            self._reset_games(ids)
+        return self.get_observations()
+    
+    def step(self, actions):
+        """
+        Advance every game by one tick.
+        
+        Args:
+            actions (array): One action per game (ACTION_UP to ACTION_RIGHT), or -1 to keep going
+        
+        Returns:
+            tuple: (observations, rewards, dones, info); info holds the final
+            "score" and "won" of the games that ended this step
+        """
+        actions = np.asarray(actions)
+        live = ~self.finished
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        
+        # Turn unless the action reverses the snake, as in Snake.change_direction
+        turning = live & (actions >= 0)
+        turning &= actions != ACTION_OPPOSITE[self.direction]
+        self.direction[turning] = actions[turning]
+        self.moving |= turning
+        
+        # Work out each new head position
+        stepping = np.flatnonzero(live & self.moving)
+        direction = self.direction[stepping]
+        x = self.head_x[stepping] + ACTION_DX[direction]
+        y = self.head_y[stepping] + ACTION_DY[direction]
+        if self.wrap_around:
+            x %= self.grid_width
+            y %= self.grid_height
+            hit = np.zeros(stepping.size, dtype=bool)
+        else:
+            hit = (x < 0) | (x >= self.grid_width) | (y < 0) | (y >= self.grid_height)
+        cells = np.clip(y, 0, self.grid_height - 1) * self.grid_width + np.clip(x, 0, self.grid_width - 1)
+        
+        # Walls and any current segment, tail included, end the game
+        hit |= self.occupancy_flat[stepping, cells].astype(bool)
+        dead = stepping[hit]
+        rewards[dead] = REWARD_DEATH
+        self.finished[dead] = True
+        
+        # Push the new heads
+        movers = stepping[~hit]
+        cells = cells[~hit]
+        self.head_x[movers] = x[~hit]
+        self.head_y[movers] = y[~hit]
+        self.head_index[movers] = (self.head_index[movers] + 1) % self.num_cells
+        self.body[movers, self.head_index[movers]] = cells
+        self.occupancy_flat[movers, cells] = 1
+        self.body_length[movers] += 1
+        
+        # Pop the tails of snakes that have not grown
+        shrinking = movers[self.body_length[movers] > self.length[movers]]
+        tails = (self.head_index[shrinking] - self.body_length[shrinking] + 1) % self.num_cells
+        self.occupancy_flat[shrinking, self.body[shrinking, tails]] = 0
+        self.body_length[shrinking] -= 1
+        
+        # Eat, grow and place new food; no free cell left means the board is won
+        eaters = movers[cells == self.food[movers]]
+        self.length[eaters] += 1
+        self.score[eaters] += 1
+        rewards[eaters] = REWARD_FOOD
+        full = self.body_length[eaters] >= self.num_cells
+        winners = eaters[full]
+        self.won[winners] = True
+        self.finished[winners] = True
+        self.food[winners] = -1
+        self._spawn_food(eaters[~full])
+        
+        # Report the games that ended, then restart them
+        dones = live & self.finished
+        ended = np.flatnonzero(dones)
+        info = {"score": self.score[ended].copy(), "won": self.won[ended].copy()}
+        if self.auto_reset and ended.size:
+            self._reset_games(ended)
+        
+        return self.get_observations(), rewards, dones, info
+    
+    def get_observations(self):
+        """
+        Get the compact state of every game.
+        
+        Returns:
+            numpy.ndarray: int32 array of shape (num_envs, 6), columns as in OBSERVATION_FIELDS;
+            food is (-1, -1) once a board is won
+        """
+        food = self.food
+        has_food = food >= 0
+        return np.stack((
+            self.head_x,
+            self.head_y,
+            np.where(has_food, food % self.grid_width, -1),
+            np.where(has_food, food // self.grid_width, -1),
+            self.direction.astype(np.int32),
+            self.length
+        ), axis=1)
+    
+    def get_body(self, env_id):
+        """
+        Get the body of one game, for checking against SnakeLogic or drawing.
+        
+        Args:
+            env_id (int): The game
+        
+        Returns:
+            list: (column, row) cells from head to tail
+        """
+        head = self.head_index[env_id]
+        indexes = (head - np.arange(self.body_length[env_id])) % self.num_cells
+        return [(int(cell % self.grid_width), int(cell // self.grid_width)) for cell in self.body[env_id, indexes]]
+    
+    def _reset_games(self, ids):
+        """
+        Put new snakes on cleared boards, as SnakeLogic.reset does.
+        
+        Args:
+            ids (numpy.ndarray): Games to reset
+        """
+        start_x = self.grid_width // 2
+        start_y = self.grid_height // 2
+        head = start_y * self.grid_width + start_x
+        start_cells = np.array([head - 2, head - 1, head], dtype=np.int32)
+        
+        self.occupancy_flat[ids] = 0
+        self.occupancy_flat[np.ix_(ids, start_cells)] = 1
+        self.body[np.ix_(ids, np.arange(3))] = start_cells
+        self.head_index[ids] = 2
+        self.body_length[ids] = 3
+        self.length[ids] = 3
+        
+        self.head_x[ids] = start_x
+        self.head_y[ids] = start_y
+        self.direction[ids] = ACTION_RIGHT
+        self.moving[ids] = False
+        self.score[ids] = 0
+        self.finished[ids] = False
+        self.won[ids] = False
+        self._spawn_food(ids)
+    
+    def _spawn_food(self, ids):
+        """
+        Place food on a uniformly random free cell of each game.
+        
+        Random cells are drawn for the whole group at once and redrawn where
+        they land on the snake; games still unplaced after FOOD_SAMPLE_TRIES
+        rounds, which only happens on nearly full boards, pick from their
+        free cells directly, so placement always terminates.
+        
+        Args:
+            ids (numpy.ndarray): Games needing food
+        """
+        pending = ids
+        for _ in range(FOOD_SAMPLE_TRIES):
+            if not pending.size:
+                return
+            cells = self.rng.integers(0, self.num_cells, size=pending.size, dtype=np.int32)
+            free = self.occupancy_flat[pending, cells] == 0
+            self.food[pending[free]] = cells[free]
+            pending = pending[~free]
+        
+        for env_id in pending:
+            free_cells = np.flatnonzero(self.occupancy_flat[env_id] == 0)
+            self.food[env_id] = free_cells[self.rng.integers(free_cells.size)] if free_cells.size else -1
+
+def benchmark(num_envs=4096, steps=1000, seed=0, **kwargs):
+    """
+    Measure simulation throughput with random actions.
+    
+    Args:
+        num_envs (int): Games simulated together
+        steps (int): Steps to run
+        seed (int): Seed for the environment and the actions
+        **kwargs: Further BatchSnakeEnv arguments
+    
+    Returns:
+        dict: Steps per second, games finished and their mean score
+    """
+    env = BatchSnakeEnv(num_envs, seed=seed, **kwargs)
+    rng = np.random.default_rng(seed + 1)
+    actions = rng.integers(0, 4, size=(steps, num_envs), dtype=np.int8)
+    
+    finished = 0
+    total_score = 0
+    start = time.perf_counter()
+    for step in range(steps):
+        _, _, dones, info = env.step(actions[step])
+        finished += int(dones.sum())
+        total_score += int(info["score"].sum())
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "num_envs": num_envs,
+        "steps": steps,
+        "steps_per_second": num_envs * steps / elapsed,
+        "games_finished": finished,
+        "mean_score": total_score / finished if finished else 0.0
+    }
+
+if __name__ == "__main__":
+    for num_envs in (1, 256, 4096, 16384):
+        result = benchmark(num_envs)
+        print(f"{num_envs} games: {result['steps_per_second']:,.0f} steps/s, "
+              f"{result['games_finished']} finished, mean score {result['mean_score']:.2f}")
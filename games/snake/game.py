@@ -6,9 +6,12 @@ This module implements the classic Snake game.
 
 import pygame
 import time
+from collections import deque
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, WHITE, PRIMARY_COLOR, SECONDARY_COLOR
 from core.asset_loader import load_font
-from games.snake.logic import SnakeLogic
+from games.snake.logic import SnakeLogic, SnakeBoard, OPPOSITE_DIRECTIONS
+from games.snake.ai import SnakeAI
+from games.snake.world import SnakeWorld, WorldRenderer
 
 class SnakeGame:
     """
@@ -29,7 +32,12 @@ class SnakeGame:
         self.snake_color = (0, 200, 0)  # Green
         self.food_color = (255, 50, 50)  # Red
         self.wrap_around = False  # Whether the snake can wrap around the screen
-        self.game_speed = 10  # Frames per second
+        self.game_speed = 10  # Logic ticks per second
+        self.interpolate = False  # Whether segments slide smoothly between cells
+        self.input_buffer_size = 3  # Direction presses kept for the following ticks
+        self.max_ticks_per_update = 3  # Ticks caught up at most after a slow frame
+        self.demo_restart_delay = 2.0  # Seconds the autopilot waits before starting a new game
+        self.demo_stall_timeout = 300.0  # Seconds of play without scoring after which a demo game ends
         
         # Game state
         self.score = 0
@@ -37,10 +45,31 @@ class SnakeGame:
         self.game_over = False
         self.paused = False
         self.start_time = None
+        self.game_over_time = None
+        self.ticks_since_score = 0
+        
+        # Autopilot; while it plays, the game runs as an attract demo that restarts itself
+        self.autopilot = None
+        self.assisted = False  # Whether the autopilot has played any of the current game
+        
+        # Large-world mode, shared with AI snakes; None while playing the classic board
+        self.world = None
+        self.world_renderer = None
+        
+        # Tick timing: real time is accumulated and spent in whole logic ticks
+        self.last_update_time = time.perf_counter()
+        self.tick_accumulator = 0.0
+        self.direction_queue = deque()
         
         # Create the game objects
         self.logic = SnakeLogic(self.block_size, self.snake_color, self.food_color, self.wrap_around)
         
+        # Persistent board picture, repainted cell by cell as the snake moves
+        self.board = SnakeBoard(self.logic, (SCREEN_WIDTH, SCREEN_HEIGHT), BG_COLOR)
+        self.needs_full_redraw = True
+        self.text_rects = []
+        self.text_cache = {}
+        
         # Create fonts
         self.font = load_font("Arial", 36)
         self.message_font = load_font("Arial", 24)
@@ -58,15 +87,32 @@ class SnakeGame:
     
     def reset(self):
         """Reset the game state."""
-        self.logic.reset()
+        if self.world:
+            self.world.reset()
+            self.world_renderer.reset()
+            self.autopilot = self.world.player.ai
+        else:
+            self.logic.reset()
+            self.board.redraw()
+        self._start_new_game()
+    
+    def _start_new_game(self):
+        """Reset the score, timers and input for a game whose board is already set up."""
         self.score = 0
         self.game_over = False
         self.paused = False
         self.start_time = time.time()
+        self.game_over_time = None
+        self.ticks_since_score = 0
+        self.assisted = bool(self.autopilot)
+        self.last_update_time = time.perf_counter()
+        self.tick_accumulator = 0.0
+        self.direction_queue.clear()
+        self.needs_full_redraw = True
         
         # Track game start
         if hasattr(self, 'analytics_service') and self.analytics_service:
-            self.analytics_service.track_game_start('snake', 'classic')
+            self.analytics_service.track_game_start('snake', 'world' if self.world else 'classic')
     
     def handle_event(self, event):
         """
@@ -83,31 +129,47 @@ class SnakeGame:
                 else:
                     self.paused = not self.paused
             
-            # Direction keys
+            # Direction keys are queued and applied one per tick, taking over from the autopilot
             if not self.paused and not self.game_over:
+                if event.key in (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT) and self.autopilot:
+                    self.set_autopilot(False)
                 if event.key == pygame.K_UP:
-                    self.logic.change_direction("UP")
+                    self.queue_direction("UP")
                 elif event.key == pygame.K_DOWN:
-                    self.logic.change_direction("DOWN")
+                    self.queue_direction("DOWN")
                 elif event.key == pygame.K_LEFT:
-                    self.logic.change_direction("LEFT")
+                    self.queue_direction("LEFT")
                 elif event.key == pygame.K_RIGHT:
-                    self.logic.change_direction("RIGHT")
+                    self.queue_direction("RIGHT")
             
-            # Save/load keys
-            if event.key == pygame.K_s:
+            # Save/load keys; saves only hold the classic board
+            if event.key == pygame.K_s and not self.world:
                 self.save_game_state()
-            elif event.key == pygame.K_l:
+            elif event.key == pygame.K_l and not self.world:
                 self.load_game_state()
             
             # Toggle wrap-around mode
             if event.key == pygame.K_w:
                 self.wrap_around = not self.wrap_around
                 self.logic.wrap_around = self.wrap_around
+                if self.world:
+                    self.world.wrap_around = self.wrap_around
                 
                 # Show a message
                 print(f"Wrap-around mode: {'ON' if self.wrap_around else 'OFF'}")
             
+            # Toggle smooth movement
+            if event.key == pygame.K_i:
+                self.interpolate = not self.interpolate
+            
+            # Toggle the autopilot
+            if event.key == pygame.K_a:
+                self.set_autopilot(not self.autopilot)
+            
+            # Switch between the classic board and the large world
+            if event.key == pygame.K_g:
+                self.set_world_mode(not self.world)
+            
             # Change game speed
             if event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
                 self.game_speed = min(self.game_speed + 1, 20)
@@ -116,90 +178,280 @@ class SnakeGame:
                 self.game_speed = max(self.game_speed - 1, 5)
                 print(f"Game speed: {self.game_speed}")
     
+    def set_autopilot(self, enabled):
+        """
+        Turn the autopilot for the player's snake on or off.
+        
+        Args:
+            enabled (bool): Whether the autopilot plays
+        """
+        if self.world:
+            self.autopilot = self.world.set_player_autopilot(enabled)
+        else:
+            self.autopilot = SnakeAI(self.logic) if enabled else None
+        self.direction_queue.clear()
+        
+        # Scores the autopilot helped build never count, even after the player takes over
+        if enabled:
+            self.assisted = True
+    
+    def set_world_mode(self, enabled):
+        """
+        Switch between the classic board and the large world, starting a new game.
+        
+        Args:
+            enabled (bool): Whether to play in the large world
+        """
+        if enabled:
+            # A new world and renderer start out reset, so only the game state needs resetting
+            self.world = SnakeWorld(block_size=self.block_size, wrap_around=self.wrap_around,
+                                    player_color=self.snake_color, food_color=self.food_color,
+                                    player_autopilot=bool(self.autopilot))
+            self.world_renderer = WorldRenderer(self.world, (SCREEN_WIDTH, SCREEN_HEIGHT), BG_COLOR)
+            self.autopilot = self.world.player.ai
+            self._start_new_game()
+        else:
+            self.world = None
+            self.world_renderer = None
+            if self.autopilot:
+                self.autopilot = SnakeAI(self.logic)
+            self.reset()
+    
+    def get_player_snake(self):
+        """
+        Get the snake the player steers.
+        
+        Returns:
+            Snake: The player's snake on the classic board or in the world
+        """
+        return self.world.player.snake if self.world else self.logic.snake
+    
+    def queue_direction(self, direction):
+        """
+        Buffer a direction change for the next free tick.
+        
+        Presses that would not change the direction taken after the presses
+        already queued, or would reverse it, are dropped.
+        
+        Args:
+            direction (str): The new direction ("UP", "DOWN", "LEFT", "RIGHT")
+        """
+        snake = self.get_player_snake()
+        last_direction = self.direction_queue[-1] if self.direction_queue else snake.direction
+        moving = self.direction_queue or snake.x_change or snake.y_change
+        if direction == OPPOSITE_DIRECTIONS[last_direction] or (moving and direction == last_direction):
+            return
+        if len(self.direction_queue) < self.input_buffer_size:
+            self.direction_queue.append(direction)
+    
     def update(self):
         """Update the game state."""
+        now = time.perf_counter()
+        elapsed = now - self.last_update_time
+        self.last_update_time = now
+        
+        # The autopilot starts a new game a little while after the last one ended
+        if self.game_over and self.autopilot and now - self.game_over_time >= self.demo_restart_delay:
+            self.reset()
+            return
+        
         # Don't update if the game is paused or over
         if self.paused or self.game_over:
             return
         
-        # Update the game logic at the specified speed
-        pygame.time.Clock().tick(self.game_speed)
+        # Run as many logic ticks as have come due, dropping time after a long stall
+        tick_interval = 1.0 / self.game_speed
+        self.tick_accumulator = min(self.tick_accumulator + elapsed, tick_interval * self.max_ticks_per_update)
+        while self.tick_accumulator >= tick_interval:
+            self.tick_accumulator -= tick_interval
+            if not self.tick():
+                break
+    
+    def tick(self):
+        """
+        Advance the game logic by one step.
         
-        # Update the game logic
-        if self.logic.update():
-            # Update the score
-            self.score = self.logic.score
+        Returns:
+            bool: True if the game is still running
+        """
+        previous_score = self.score
+        if self.world:
+            # The world steers the autopilot along with its own snakes
+            if self.direction_queue and not self.autopilot:
+                self.world.player.snake.change_direction(self.direction_queue.popleft())
+            alive = self.world.update()
+            self.score = self.world.player.score
+        else:
+            if self.autopilot:
+                direction = self.autopilot.next_direction()
+                if direction:
+                    self.logic.change_direction(direction)
+            elif self.direction_queue:
+                self.logic.change_direction(self.direction_queue.popleft())
             
-            # Update high score
-            if self.score > self.high_score:
+            # Update the game logic and repaint the cells it changed
+            alive = self.logic.update()
+            self.board.update()
+            self.score = self.logic.score
+        
+        # A demo game that has stopped scoring is ended, so the demo moves on to a new one
+        self.ticks_since_score = 0 if self.score != previous_score else self.ticks_since_score + 1
+        if alive and self.autopilot and self.ticks_since_score >= self.demo_stall_timeout * self.game_speed:
+            alive = False
+        
+        if alive:
+            # Update high score; games the autopilot played any part of and world scores don't count
+            if self.score > self.high_score and not self.assisted and not self.world:
                 self.high_score = self.score
                 self.save_high_score()
-        else:
-            # Game over
-            self.game_over = True
-            
-            # Track game end
-            self.track_game_end('loss')
+            return True
+        
+        # Game over
+        self.game_over = True
+        self.game_over_time = time.perf_counter()
+        
+        # Track game end
+        self.track_game_end('win' if self.logic.won and not self.world else 'loss')
+        return False
     
     def render(self, screen):
         """
         Render the game.
         
+        The board surface is kept up to date tick by tick, so a normal frame
+        only copies the repainted cells and the text areas to the screen.
+        
         Args:
             screen (pygame.Surface): The surface to render on
+            
+        Returns:
+            list: The screen rects that changed, or None if the whole screen did
         """
-        # Clear the screen
-        screen.fill(BG_COLOR)
+        # The world scrolls with the camera, so every frame is drawn in full
+        if self.world:
+            self.world_renderer.follow()
+            self.world_renderer.render(screen)
+            self.text_rects = self.draw_text(screen)
+            self.needs_full_redraw = True
+            return None
+        
+        # Smooth movement draws the snake between cells, which needs a full redraw
+        if self.interpolate and not self.paused and not self.game_over:
+            progress = min(self.tick_accumulator * self.game_speed, 1.0)
+            screen.fill(BG_COLOR)
+            self.logic.draw(screen, progress)
+            self.text_rects = self.draw_text(screen)
+            self.needs_full_redraw = True
+            return None
         
-        # Draw the game
-        self.logic.draw(screen)
+        # Copy the whole board after a reset, a load or a smooth frame
+        if self.needs_full_redraw:
+            screen.blit(self.board.surface, (0, 0))
+            self.board.take_dirty_rects()
+            self.needs_full_redraw = False
+            self.text_rects = self.draw_text(screen)
+            return None
+        
+        # Copy the repainted cells and the board under last frame's text
+        dirty_rects = self.board.take_dirty_rects() + self.text_rects
+        for rect in dirty_rects:
+            screen.blit(self.board.surface, rect, rect)
+        
+        self.text_rects = self.draw_text(screen)
+        return dirty_rects + self.text_rects
+    
+    def draw_text(self, screen):
+        """
+        Draw the score, settings, messages and controls help.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            
+        Returns:
+            list: The rects the text was drawn in
+        """
+        rects = []
         
         # Draw the score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
+        score_text = self._render_text(self.font, f"Score: {self.score}", WHITE)
+        rects.append(screen.blit(score_text, (10, 10)))
         
         # Draw the high score
-        high_score_text = self.small_font.render(f"High Score: {self.high_score}", True, SECONDARY_COLOR)
-        screen.blit(high_score_text, (10, 50))
+        high_score_text = self._render_text(self.small_font, f"High Score: {self.high_score}", SECONDARY_COLOR)
+        rects.append(screen.blit(high_score_text, (10, 50)))
         
         # Draw game speed
-        speed_text = self.small_font.render(f"Speed: {self.game_speed}", True, SECONDARY_COLOR)
-        screen.blit(speed_text, (10, 80))
+        speed_text = self._render_text(self.small_font, f"Speed: {self.game_speed}", SECONDARY_COLOR)
+        rects.append(screen.blit(speed_text, (10, 80)))
         
         # Draw wrap-around mode
-        wrap_text = self.small_font.render(f"Wrap: {'ON' if self.wrap_around else 'OFF'}", True, SECONDARY_COLOR)
-        screen.blit(wrap_text, (10, 110))
+        wrap_text = self._render_text(self.small_font, f"Wrap: {'ON' if self.wrap_around else 'OFF'}", SECONDARY_COLOR)
+        rects.append(screen.blit(wrap_text, (10, 110)))
+        
+        # Draw autopilot mode
+        if self.autopilot:
+            autopilot_text = self._render_text(self.small_font, "Autopilot: ON (arrows take over)", PRIMARY_COLOR)
+            rects.append(screen.blit(autopilot_text, (10, 140)))
+        
+        # Draw the world size and how many snakes are left in it
+        if self.world:
+            world_text = self._render_text(self.small_font, f"World: {self.world.grid_width}x{self.world.grid_height}  "
+                                           f"Snakes: {self.world.get_alive_count()}", SECONDARY_COLOR)
+            rects.append(screen.blit(world_text, (10, 170)))
         
         # Draw game over message
         if self.game_over:
-            game_over_text = self.font.render("Game Over!", True, PRIMARY_COLOR)
-            restart_text = self.message_font.render("Press SPACE to restart", True, WHITE)
+            won = self.logic.won and not self.world
+            game_over_text = self._render_text(self.font, "You Win!" if won else "Game Over!", PRIMARY_COLOR)
+            restart_text = self._render_text(self.message_font, "Restarting..." if self.autopilot else "Press SPACE to restart", WHITE)
             
             # Center the text
             game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
             restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
             
             # Draw the text
-            screen.blit(game_over_text, game_over_rect)
-            screen.blit(restart_text, restart_rect)
+            rects.append(screen.blit(game_over_text, game_over_rect))
+            rects.append(screen.blit(restart_text, restart_rect))
         
         # Draw paused message
         elif self.paused:
-            paused_text = self.font.render("Paused", True, PRIMARY_COLOR)
-            resume_text = self.message_font.render("Press SPACE to resume", True, WHITE)
+            paused_text = self._render_text(self.font, "Paused", PRIMARY_COLOR)
+            resume_text = self._render_text(self.message_font, "Press SPACE to resume", WHITE)
             
             # Center the text
             paused_rect = paused_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
             resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
             
             # Draw the text
-            screen.blit(paused_text, paused_rect)
-            screen.blit(resume_text, resume_rect)
+            rects.append(screen.blit(paused_text, paused_rect))
+            rects.append(screen.blit(resume_text, resume_rect))
         
         # Draw controls help
-        controls_text = self.small_font.render("S: Save  L: Load  W: Toggle Wrap  +/-: Speed", True, WHITE)
+        controls_text = self._render_text(self.small_font, "S: Save  L: Load  W: Toggle Wrap  I: Smooth  A: Autopilot  G: World  +/-: Speed", WHITE)
         controls_rect = controls_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20))
-        screen.blit(controls_text, controls_rect)
+        rects.append(screen.blit(controls_text, controls_rect))
+        
+        return rects
+    
+    def _render_text(self, font, text, color):
+        """
+        Render text, reusing the surface while the text stays the same.
+        
+        Args:
+            font (pygame.font.Font): The font to use
+            text (str): The text
+            color (tuple): The RGB text color
+            
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (id(font), text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= 64:
+                self.text_cache.clear()
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
     
     def save_game_state(self):
         """Save the current game state."""
@@ -211,9 +463,9 @@ class SnakeGame:
             # Create the game state
             state = {
                 'score': self.score,
-                'snake_body': self.logic.snake.body,
+                'snake_body': self.logic.snake.get_pixel_body(),
                 'snake_direction': self.logic.snake.direction,
-                'food_position': self.logic.food.position,
+                'food_position': [coordinate * self.block_size for coordinate in self.logic.food.position],
                 'wrap_around': self.wrap_around,
                 'game_speed': self.game_speed
             }
@@ -268,36 +520,20 @@ class SnakeGame:
             self.logic.wrap_around = self.wrap_around
             self.game_speed = state.get('game_speed', 10)
             
-            # Restore the snake
+            # Restore the snake; saved positions are in pixels
             snake_body = state.get('snake_body')
             if snake_body and len(snake_body) > 0:
-                self.logic.snake.body = snake_body
-                self.logic.snake.head = snake_body[0]
-                self.logic.snake.length = len(snake_body)
-                
-                # Restore the direction
-                direction = state.get('snake_direction')
-                if direction:
-                    self.logic.snake.direction = direction
-                    
-                    # Set the velocity based on the direction
-                    if direction == "UP":
-                        self.logic.snake.x_change = 0
-                        self.logic.snake.y_change = -self.logic.snake.speed
-                    elif direction == "DOWN":
-                        self.logic.snake.x_change = 0
-                        self.logic.snake.y_change = self.logic.snake.speed
-                    elif direction == "LEFT":
-                        self.logic.snake.x_change = -self.logic.snake.speed
-                        self.logic.snake.y_change = 0
-                    elif direction == "RIGHT":
-                        self.logic.snake.x_change = self.logic.snake.speed
-                        self.logic.snake.y_change = 0
+                cells = [(x // self.block_size, y // self.block_size) for x, y in snake_body]
+                self.logic.snake.set_body(cells, state.get('snake_direction'))
             
             # Restore the food
             food_position = state.get('food_position')
             if food_position:
-                self.logic.food.position = food_position
+                self.logic.food.position = (food_position[0] // self.block_size, food_position[1] // self.block_size)
+            
+            # Repaint the restored board
+            self.board.redraw()
+            self.needs_full_redraw = True
             
             print("Game state loaded successfully.")
         except Exception as e:
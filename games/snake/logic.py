@@ -6,68 +6,218 @@ This module implements the logic for the Snake game.
 
 import random
 import pygame
+from collections import deque
+from itertools import chain, islice
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT
 
+# Grid step for each direction
+DIRECTION_VECTORS = {
+    "UP": (0, -1),
+    "DOWN": (0, 1),
+    "LEFT": (-1, 0),
+    "RIGHT": (1, 0)
+}
+OPPOSITE_DIRECTIONS = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
+
+class FreeCells:
+    """
+    Indexable set of the empty grid cells.
+    
+    Cells are kept in a list alongside a dictionary of their indexes.
+    Removing a cell moves the last cell into its slot, so adding, removing,
+    membership tests and drawing a uniformly random empty cell are all O(1)
+    whatever the grid size or how full it is.
+    """
+    
+    def __init__(self, grid_width, grid_height, occupied=()):
+        """
+        Initialize the free cell set.
+        
+        Args:
+            grid_width (int): Columns in the grid
+            grid_height (int): Rows in the grid
+            occupied (set): Cells that start out taken
+        """
+        self.cells = [(x, y) for y in range(grid_height) for x in range(grid_width) if (x, y) not in occupied]
+        self.indexes = {cell: index for index, cell in enumerate(self.cells)}
+    
+    def __len__(self):
+        """Number of empty cells."""
+        return len(self.cells)
+    
+    def __contains__(self, cell):
+        """Check whether a cell is empty."""
+        return cell in self.indexes
+    
+    def add(self, cell):
+        """
+        Mark a cell as empty.
+        
+        Args:
+            cell (tuple): The (column, row) cell
+        """
+        if cell not in self.indexes:
+            self.indexes[cell] = len(self.cells)
+            self.cells.append(cell)
+    
+    def remove(self, cell):
+        """
+        Mark a cell as taken.
+        
+        Args:
+            cell (tuple): The (column, row) cell
+        """
+        index = self.indexes.pop(cell, None)
+        if index is None:
+            return
+        
+        last = self.cells.pop()
+        if index < len(self.cells):
+            self.cells[index] = last
+            self.indexes[last] = index
+    
+    def sample(self):
+        """
+        Pick a uniformly random empty cell.
+        
+        Returns:
+            tuple: The cell, or None if the grid is full
+        """
+        if not self.cells:
+            return None
+        return self.cells[random.randrange(len(self.cells))]
+
 class Snake:
     """
     Represents the snake in the Snake game.
+    
+    The body is a deque of (column, row) grid cells from head to tail,
+    mirrored by a set of occupied cells, so moving, growing and the
+    self-collision test cost the same however long the snake is.
     """
     
-    def __init__(self, x, y, block_size, color):
+    def __init__(self, x, y, block_size, color, grid_width=None, grid_height=None, free_cells=None):
         """
         Initialize the snake.
         
         Args:
-            x (int): The x-coordinate of the snake's head
-            y (int): The y-coordinate of the snake's head
+            x (int): The grid column of the snake's head
+            y (int): The grid row of the snake's head
             block_size (int): The size of each snake segment
             color (tuple): The RGB color of the snake
+            grid_width (int): Columns in the grid (defaults to the screen width)
+            grid_height (int): Rows in the grid (defaults to the screen height)
+            free_cells (FreeCells): Optional empty cells of a board shared with other
+                snakes; by default the snake keeps its own
         """
         self.block_size = block_size
         self.color = color
-        self.speed = block_size
+        self.grid_width = grid_width or SCREEN_WIDTH // block_size
+        self.grid_height = grid_height or SCREEN_HEIGHT // block_size
+        self.shared_free_cells = free_cells
         
-        # Initial position and direction
+        # Initial direction; the snake stands still until the first turn
         self.x_change = 0
         self.y_change = 0
         self.direction = "RIGHT"
         
-        # Create the snake body (list of positions)
-        self.body = []
-        self.head = [x, y]
-        self.body.append(self.head)
+        # Create the snake body with two more segments behind the head
+        self.set_body([(x, y), (x - 1, y), (x - 2, y)])
+    
+    def set_body(self, cells, direction=None):
+        """
+        Replace the body, e.g. when restoring a saved game.
         
-        # Add two more segments to start with
-        self.body.append([x - block_size, y])
-        self.body.append([x - 2 * block_size, y])
+        Args:
+            cells (list): Grid cells from head to tail
+            direction (str): Optional direction to move in ("UP", "DOWN", "LEFT", "RIGHT")
+        """
+        # A shared board gets the old body's cells back and loses the new body's
+        if self.shared_free_cells is not None:
+            for cell in getattr(self, 'body', ()):
+                self.shared_free_cells.add(cell)
+        
+        self.body = deque(tuple(cell) for cell in cells)
+        self.occupied = set(self.body)
+        if self.shared_free_cells is not None:
+            self.free_cells = self.shared_free_cells
+            for cell in self.body:
+                self.free_cells.remove(cell)
+        else:
+            self.free_cells = FreeCells(self.grid_width, self.grid_height, self.occupied)
+        self.head = self.body[0]
         
         # Track the length
-        self.length = 3
+        self.length = len(self.body)
+        
+        # Last move, for interpolated drawing, and moves made so far
+        self.moved = False
+        self.previous_tail = None
+        self.moves = 0
+        
+        if direction in DIRECTION_VECTORS:
+            self.direction = direction
+            self.x_change, self.y_change = DIRECTION_VECTORS[direction]
     
-    def update(self):
+    def update(self, wrap_around=False):
         """
         Update the snake's position.
         
+        Args:
+            wrap_around (bool): If True, the snake wraps around the grid edges
+        
         Returns:
-            bool: True if the snake is still alive, False if it collided with itself
+            bool: True if the snake is still alive, False if it hit a wall or itself
         """
-        # Update the head position based on the current direction
-        new_head = [self.head[0] + self.x_change, self.head[1] + self.y_change]
+        self.moved = False
+        new_head = self.get_next_head(wrap_around)
+        if new_head is None:
+            return True
         
-        # Check for collision with self
-        if new_head in self.body[1:]:
+        # Check for collision with the walls or self
+        if not (0 <= new_head[0] < self.grid_width and 0 <= new_head[1] < self.grid_height):
+            return False
+        if new_head in self.occupied:
             return False
         
         # Add the new head to the body
-        self.body.insert(0, new_head)
+        self.body.appendleft(new_head)
+        self.occupied.add(new_head)
+        self.free_cells.remove(new_head)
         self.head = new_head
         
         # Remove the tail if the snake hasn't grown
+        self.previous_tail = None
         if len(self.body) > self.length:
-            self.body.pop()
+            tail = self.previous_tail = self.body.pop()
+            self.occupied.discard(tail)
+            self.free_cells.add(tail)
         
+        self.moved = True
+        self.moves += 1
         return True
     
+    def get_next_head(self, wrap_around=False):
+        """
+        Get the cell the head moves into on the next update.
+        
+        Args:
+            wrap_around (bool): If True, the snake wraps around the grid edges
+        
+        Returns:
+            tuple: The (column, row) cell, off the grid when heading into a wall,
+            or None while the snake is standing still
+        """
+        if not self.x_change and not self.y_change:
+            return None
+        
+        x = self.head[0] + self.x_change
+        y = self.head[1] + self.y_change
+        if wrap_around:
+            x %= self.grid_width
+            y %= self.grid_height
+        return (x, y)
+    
     def grow(self):
         """Increase the length of the snake."""
         self.length += 1
@@ -80,93 +230,93 @@ class Snake:
             direction (str): The new direction ("UP", "DOWN", "LEFT", "RIGHT")
         """
         # Prevent the snake from reversing direction
-        if direction == "UP" and self.direction != "DOWN":
-            self.x_change = 0
-            self.y_change = -self.speed
-            self.direction = "UP"
-        elif direction == "DOWN" and self.direction != "UP":
-            self.x_change = 0
-            self.y_change = self.speed
-            self.direction = "DOWN"
-        elif direction == "LEFT" and self.direction != "RIGHT":
-            self.x_change = -self.speed
-            self.y_change = 0
-            self.direction = "LEFT"
-        elif direction == "RIGHT" and self.direction != "LEFT":
-            self.x_change = self.speed
-            self.y_change = 0
-            self.direction = "RIGHT"
-    
-    def check_boundary_collision(self, wrap_around=False):
-        """
-        Check if the snake has collided with the boundaries.
+        if direction in DIRECTION_VECTORS and self.direction != OPPOSITE_DIRECTIONS[direction]:
+            self.x_change, self.y_change = DIRECTION_VECTORS[direction]
+            self.direction = direction
+    
+    def get_pixel_body(self):
+        """
+        Get the body in screen coordinates.
         
-        Args:
-            wrap_around (bool): If True, the snake wraps around the screen
-            
         Returns:
-            bool: True if the snake is still alive, False if it collided with the boundary
+            list: [x, y] pixel positions from head to tail
         """
-        if wrap_around:
-            # Wrap around the screen
-            if self.head[0] >= SCREEN_WIDTH:
-                self.head[0] = 0
-            elif self.head[0] < 0:
-                self.head[0] = SCREEN_WIDTH - self.block_size
-            
-            if self.head[1] >= SCREEN_HEIGHT:
-                self.head[1] = 0
-            elif self.head[1] < 0:
-                self.head[1] = SCREEN_HEIGHT - self.block_size
-            
-            # Update the body[0] (head) with the wrapped position
-            self.body[0] = self.head
-            
-            return True
-        else:
-            # Check for boundary collision
-            if (self.head[0] >= SCREEN_WIDTH or self.head[0] < 0 or
-                self.head[1] >= SCREEN_HEIGHT or self.head[1] < 0):
-                return False
-            
-            return True
+        return [[x * self.block_size, y * self.block_size] for x, y in self.body]
     
-    def draw(self, screen):
+    def draw(self, screen, progress=1.0):
         """
         Draw the snake.
         
         Args:
             screen (pygame.Surface): The surface to draw on
+            progress (float): Fraction of the way from the previous tick to the
+                current one; below 1 segments are drawn sliding between cells
         """
+        # Each segment moved from the cell of the segment behind it; the tail from the cell it left
+        interpolate = self.moved and progress < 1.0
+        previous_cells = chain(islice(self.body, 1, None), (self.previous_tail or self.body[-1],))
+        
         # Draw each segment of the snake
-        for i, segment in enumerate(self.body):
-            # Draw the head in a slightly different color
-            if i == 0:
-                # Make the head a bit brighter
-                head_color = tuple(min(c + 50, 255) for c in self.color)
-                pygame.draw.rect(screen, head_color, [segment[0], segment[1], self.block_size, self.block_size])
-                
-                # Draw eyes
-                eye_size = max(2, self.block_size // 5)
-                eye_offset = self.block_size // 4
-                
-                if self.direction == "RIGHT":
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + eye_offset), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
-                elif self.direction == "LEFT":
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + eye_offset), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
-                elif self.direction == "UP":
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + eye_offset), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + eye_offset), eye_size)
-                elif self.direction == "DOWN":
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
-                    pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
-            else:
-                pygame.draw.rect(screen, self.color, [segment[0], segment[1], self.block_size, self.block_size])
+        for i, (cell, previous) in enumerate(zip(self.body, previous_cells)):
+            segment = self._get_segment_position(cell, previous, progress if interpolate else 1.0)
+            self.draw_segment(screen, segment, i == 0)
+    
+    def draw_segment(self, screen, segment, is_head):
+        """
+        Draw one segment of the snake.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            segment (tuple): Pixel position of the segment's top-left corner
+            is_head (bool): Whether to draw the head, facing the current direction
+        """
+        # Draw the head in a slightly different color
+        if is_head:
+            # Make the head a bit brighter
+            head_color = tuple(min(c + 50, 255) for c in self.color)
+            pygame.draw.rect(screen, head_color, [segment[0], segment[1], self.block_size, self.block_size])
+            
+            # Draw eyes
+            eye_size = max(2, self.block_size // 5)
+            eye_offset = self.block_size // 4
             
-            # Add a small border to each segment
-            pygame.draw.rect(screen, (0, 0, 0), [segment[0], segment[1], self.block_size, self.block_size], 1)
+            if self.direction == "RIGHT":
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + eye_offset), eye_size)
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
+            elif self.direction == "LEFT":
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + eye_offset), eye_size)
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
+            elif self.direction == "UP":
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + eye_offset), eye_size)
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + eye_offset), eye_size)
+            elif self.direction == "DOWN":
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
+                pygame.draw.circle(screen, (0, 0, 0), (segment[0] + self.block_size - eye_offset, segment[1] + self.block_size - eye_offset), eye_size)
+        else:
+            pygame.draw.rect(screen, self.color, [segment[0], segment[1], self.block_size, self.block_size])
+        
+        # Add a small border to each segment
+        pygame.draw.rect(screen, (0, 0, 0), [segment[0], segment[1], self.block_size, self.block_size], 1)
+    
+    def _get_segment_position(self, cell, previous, progress):
+        """
+        Get the screen position of a segment partway through a move.
+        
+        Args:
+            cell (tuple): The segment's current cell
+            previous (tuple): The cell it moved from
+            progress (float): Fraction of the move completed
+        
+        Returns:
+            tuple: Pixel position of the segment's top-left corner
+        """
+        x, y = cell
+        
+        # Moves across a wrapped edge jump rather than slide across the screen
+        if progress < 1.0 and abs(x - previous[0]) + abs(y - previous[1]) == 1:
+            x = previous[0] + (x - previous[0]) * progress
+            y = previous[1] + (y - previous[1]) * progress
+        return (round(x * self.block_size), round(y * self.block_size))
 
 class Food:
     """
@@ -183,31 +333,28 @@ class Food:
         """
         self.block_size = block_size
         self.color = color
-        self.position = [0, 0]
+        self.position = (0, 0)
         self.respawn()
     
-    def respawn(self, snake_body=None):
+    def respawn(self, free_cells=None):
         """
         Respawn the food at a random position.
         
         Args:
-            snake_body (list): The snake's body to avoid spawning food on the snake
+            free_cells (FreeCells): Empty cells to choose from, to avoid spawning food on the snake
+        
+        Returns:
+            bool: True if the food was placed, False if there is no empty cell left
         """
-        # Calculate the number of possible positions
+        if free_cells is not None:
+            self.position = free_cells.sample()
+            return self.position is not None
+        
+        # Without a free cell set, any cell of the screen grid will do
         grid_width = SCREEN_WIDTH // self.block_size
         grid_height = SCREEN_HEIGHT // self.block_size
-        
-        # Generate a random position
-        x = random.randint(0, grid_width - 1) * self.block_size
-        y = random.randint(0, grid_height - 1) * self.block_size
-        
-        # Make sure the food doesn't spawn on the snake
-        if snake_body:
-            while [x, y] in snake_body:
-                x = random.randint(0, grid_width - 1) * self.block_size
-                y = random.randint(0, grid_height - 1) * self.block_size
-        
-        self.position = [x, y]
+        self.position = (random.randrange(grid_width), random.randrange(grid_height))
+        return True
     
     def draw(self, screen):
         """
@@ -216,9 +363,22 @@ class Food:
         Args:
             screen (pygame.Surface): The surface to draw on
         """
+        # Nothing to draw once the board is full
+        if self.position is None:
+            return
+        self.draw_at(screen, (self.position[0] * self.block_size, self.position[1] * self.block_size))
+    
+    def draw_at(self, screen, position):
+        """
+        Draw the food in the cell at a pixel position.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+            position (tuple): Pixel position of the cell's top-left corner
+        """
         # Draw the food as a circle
-        center_x = self.position[0] + self.block_size // 2
-        center_y = self.position[1] + self.block_size // 2
+        center_x = position[0] + self.block_size // 2
+        center_y = position[1] + self.block_size // 2
         radius = self.block_size // 2
         
         pygame.draw.circle(screen, self.color, (center_x, center_y), radius)
@@ -233,7 +393,7 @@ class SnakeLogic:
     Implements the game logic for Snake.
     """
     
-    def __init__(self, block_size, snake_color, food_color, wrap_around=False):
+    def __init__(self, block_size, snake_color, food_color, wrap_around=False, grid_size=None):
         """
         Initialize the game logic.
         
@@ -242,51 +402,52 @@ class SnakeLogic:
             snake_color (tuple): The RGB color of the snake
             food_color (tuple): The RGB color of the food
             wrap_around (bool): If True, the snake wraps around the screen
+            grid_size (tuple): Optional (columns, rows); defaults to the screen divided into blocks
         """
         # Calculate the grid size
-        self.grid_width = SCREEN_WIDTH // block_size
-        self.grid_height = SCREEN_HEIGHT // block_size
+        self.grid_size = grid_size
+        self.grid_width, self.grid_height = grid_size or (SCREEN_WIDTH // block_size, SCREEN_HEIGHT // block_size)
         self.block_size = block_size
         
-        # Create the snake at the center of the screen
-        start_x = (self.grid_width // 2) * block_size
-        start_y = (self.grid_height // 2) * block_size
-        self.snake = Snake(start_x, start_y, block_size, snake_color)
+        # Create the snake at the center of the grid
+        self.snake = Snake(self.grid_width // 2, self.grid_height // 2, block_size, snake_color,
+                           self.grid_width, self.grid_height)
         
         # Create the food
         self.food = Food(block_size, food_color)
-        self.food.respawn(self.snake.body)
+        self.food.respawn(self.snake.free_cells)
         
         # Game settings
         self.wrap_around = wrap_around
         self.score = 0
         self.game_over = False
+        self.won = False
     
     def update(self):
         """
         Update the game state.
         
         Returns:
-            bool: True if the game is still running, False if game over
+            bool: True if the game is still running, False if game over (check won for a full board)
         """
         if self.game_over:
             return False
         
-        # Update the snake
-        if not self.snake.update():
-            self.game_over = True
-            return False
-        
-        # Check for boundary collision
-        if not self.snake.check_boundary_collision(self.wrap_around):
+        # Update the snake, checking for wall and self collisions
+        if not self.snake.update(self.wrap_around):
             self.game_over = True
             return False
         
         # Check for food collision
         if self.snake.head == self.food.position:
             self.snake.grow()
-            self.food.respawn(self.snake.body)
             self.score += 1
+            
+            # No empty cell left for the food: the snake has filled the board
+            if not self.food.respawn(self.snake.free_cells):
+                self.won = True
+                self.game_over = True
+                return False
         
         return True
     
@@ -299,15 +460,16 @@ class SnakeLogic:
         """
         self.snake.change_direction(direction)
     
-    def draw(self, screen):
+    def draw(self, screen, progress=1.0):
         """
         Draw the game.
         
         Args:
             screen (pygame.Surface): The surface to draw on
+            progress (float): Fraction of the way to the next tick, for interpolated movement
         """
         # Draw the snake
-        self.snake.draw(screen)
+        self.snake.draw(screen, progress)
         
         # Draw the food
         self.food.draw(screen)
@@ -315,17 +477,101 @@ class SnakeLogic:
     def reset(self):
         """Reset the game state."""
         # Calculate the grid size
-        self.grid_width = SCREEN_WIDTH // self.block_size
-        self.grid_height = SCREEN_HEIGHT // self.block_size
+        self.grid_width, self.grid_height = self.grid_size or (SCREEN_WIDTH // self.block_size, SCREEN_HEIGHT // self.block_size)
         
-        # Create the snake at the center of the screen
-        start_x = (self.grid_width // 2) * self.block_size
-        start_y = (self.grid_height // 2) * self.block_size
-        self.snake = Snake(start_x, start_y, self.block_size, self.snake.color)
+        # Create the snake at the center of the grid
+        self.snake = Snake(self.grid_width // 2, self.grid_height // 2, self.block_size, self.snake.color,
+                           self.grid_width, self.grid_height)
         
         # Create the food
-        self.food.respawn(self.snake.body)
+        self.food.respawn(self.snake.free_cells)
         
         # Reset game state
         self.score = 0
         self.game_over = False
+        self.won = False
+
+class SnakeBoard:
+    """
+    Persistent picture of the snake and food.
+    
+    The board is painted in full once, then each tick only repaints the
+    cells that changed: the new head, the old head (now a body segment),
+    the cell the tail left and a newly placed food. The rects of repainted
+    cells are collected until take_dirty_rects(), so the cost of a frame
+    does not depend on the length of the snake.
+    """
+    
+    def __init__(self, logic, size, background_color):
+        """
+        Initialize the board.
+        
+        Args:
+            logic (SnakeLogic): The game logic to picture
+            size (tuple): Board size in pixels
+            background_color (tuple): The RGB color of empty cells
+        """
+        self.logic = logic
+        self.background_color = background_color
+        self.surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        
+        self.food_position = None
+        self.dirty_rects = []
+        self.redraw()
+    
+    def redraw(self):
+        """Paint the whole board from the current game state."""
+        self.surface.fill(self.background_color)
+        self.logic.draw(self.surface)
+        self.food_position = self.logic.food.position
+        self.dirty_rects = [self.surface.get_rect()]
+    
+    def update(self):
+        """Repaint the cells changed by the last tick."""
+        snake = self.logic.snake
+        if snake.moved:
+            # The tail leaves first, so food placed on the freed cell is painted over it
+            if snake.previous_tail is not None:
+                self._paint_cell(snake.previous_tail, None)
+            if len(snake.body) > 1:
+                self._paint_cell(snake.body[1], snake.draw_segment, False)
+            self._paint_cell(snake.head, snake.draw_segment, True)
+        
+        food = self.logic.food
+        if food.position != self.food_position:
+            self.food_position = food.position
+            if food.position is not None:
+                self._paint_cell(food.position, lambda surface, segment: food.draw(surface))
+    
+    def take_dirty_rects(self):
+        """
+        Get the rects repainted since the last call.
+        
+        Returns:
+            list: pygame.Rect of each repainted area
+        """
+        dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        return dirty_rects
+    
+    def _paint_cell(self, cell, draw, *args):
+        """
+        Clear one cell and optionally draw into it.
+        
+        Args:
+            cell (tuple): The (column, row) cell
+            draw (callable): Function taking (surface, pixel position, *args), or None to leave it empty
+            *args: Extra arguments for draw
+        """
+        block_size = self.logic.block_size
+        rect = pygame.Rect(cell[0] * block_size, cell[1] * block_size, block_size, block_size)
+        self.surface.fill(self.background_color, rect)
+        
+        # Keep small-cell eyes and circles from bleeding into neighbouring cells
+        if draw:
+            self.surface.set_clip(rect)
+            draw(self.surface, rect.topleft, *args)
+            self.surface.set_clip(None)
+        self.dirty_rects.append(rect)
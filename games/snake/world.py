@@ -0,0 +1,618 @@
+"""
+SoulCoreLegacy Arcade - Snake World
+----------------------------------
+This module implements the large-world Snake mode: a grid far bigger than
+the screen that the player shares with AI snakes, a camera that follows
+the player's head, and a renderer that only draws the visible part of the
+world from cached chunk surfaces.
+"""
+
+import random
+import time
+from collections import OrderedDict
+import pygame
+from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR
+from games.snake.logic import Snake, Food, FreeCells
+from games.snake.ai import SnakeAI
+
+# World defaults
+WORLD_SIZE = (200, 150)  # Columns and rows
+AI_SNAKE_COUNT = 12
+FOOD_COUNT = 150
+RESPAWN_DELAY = 30  # Ticks before a dead AI snake comes back
+
+# Colors of the AI snakes, used in turn
+AI_COLORS = [
+    (50, 150, 255),
+    (255, 200, 0),
+    (200, 80, 255),
+    (0, 220, 200),
+    (255, 120, 40),
+    (255, 90, 170)
+]
+
+# Rendering
+CHUNK_CELLS = 16  # Chunk width and height in cells
+MAX_CACHED_CHUNKS = 96  # Chunk surfaces kept, least recently drawn dropped first
+CAMERA_SMOOTHING = 0.25  # Fraction of the distance to its target the camera covers each frame
+CHUNK_SHADE = 8  # Brightness difference between neighbouring chunks, so scrolling shows
+OUTSIDE_COLOR = (5, 5, 10)  # Beyond the world edges
+
+# Tries at finding room for a new snake before giving up for this tick
+SPAWN_TRIES = 50
+
+class WorldSnake:
+    """
+    One snake in a SnakeWorld.
+    
+    Besides the snake's own state, this offers the grid_width, grid_height,
+    wrap_around, snake and food attributes SnakeAI reads from a SnakeLogic,
+    with food being the snake's current target, so the same AI can drive
+    any snake in the world.
+    """
+    
+    def __init__(self, world, color, ai_controlled):
+        """
+        Initialize the world snake.
+        
+        Args:
+            world (SnakeWorld): The world the snake lives in
+            color (tuple): The RGB color of the snake
+            ai_controlled (bool): Whether an AI steers the snake
+        """
+        self.world = world
+        self.color = color
+        self.grid_width = world.grid_width
+        self.grid_height = world.grid_height
+        
+        # Set when the snake is placed
+        self.snake = None
+        self.alive = False
+        self.score = 0
+        self.respawn_ticks = 0
+        
+        # Food the snake is heading for, and where it was when chosen
+        self.food = None
+        self.target_position = None
+        
+        self.ai = SnakeAI(self, blocked=world.blocked) if ai_controlled else None
+    
+    @property
+    def wrap_around(self):
+        """Whether the world wraps around its edges."""
+        return self.world.wrap_around
+
+class SnakeWorld:
+    """
+    A large Snake board shared by the player and AI snakes.
+    
+    All snakes take their cells from one FreeCells set, so a cell missing
+    from it is taken by some snake and moving into it is a collision,
+    whoever owns it. Snakes move in turn each tick, the player first. The
+    world also keeps a flat occupancy array for the AI snakes' planning,
+    a map of cells to their owners for the renderer, and the list of cells
+    changed since the renderer last asked.
+    
+    Dead AI snakes leave the board and come back elsewhere after
+    RESPAWN_DELAY ticks; the player's death ends the game.
+    """
+    
+    def __init__(self, grid_width=WORLD_SIZE[0], grid_height=WORLD_SIZE[1], block_size=20,
+                 ai_snakes=AI_SNAKE_COUNT, food_count=FOOD_COUNT, wrap_around=False,
+                 player_color=(0, 200, 0), food_color=(255, 50, 50), player_autopilot=False):
+        """
+        Initialize the world.
+        
+        Args:
+            grid_width (int): Columns in the world
+            grid_height (int): Rows in the world
+            block_size (int): The size of each cell in pixels
+            ai_snakes (int): Number of AI snakes
+            food_count (int): Food items kept on the board
+            wrap_around (bool): If True, snakes wrap around the world edges
+            player_color (tuple): The RGB color of the player's snake
+            food_color (tuple): The RGB color of the food
+            player_autopilot (bool): Whether the player's snake starts on autopilot
+        """
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.block_size = block_size
+        self.ai_snake_count = ai_snakes
+        self.food_count = food_count
+        self.wrap_around = wrap_around
+        self.player_color = player_color
+        self.food_color = food_color
+        self.player_autopilot = player_autopilot
+        self.reset()
+    
+    def reset(self):
+        """Clear the world and place the snakes and food."""
+        self.free_cells = FreeCells(self.grid_width, self.grid_height)
+        self.blocked = bytearray(self.grid_width * self.grid_height)
+        self.owners = {}
+        self.foods = {}
+        self.changed_cells = []
+        self.ticks = 0
+        self.game_over = False
+        
+        # The player starts in the middle, the AI snakes wherever there is room
+        self.player = WorldSnake(self, self.player_color, self.player_autopilot)
+        self._place_snake(self.player, (self.grid_width // 2, self.grid_height // 2))
+        self.snakes = [self.player]
+        for index in range(self.ai_snake_count):
+            world_snake = WorldSnake(self, AI_COLORS[index % len(AI_COLORS)], True)
+            self._place_snake(world_snake)
+            self.snakes.append(world_snake)
+        
+        for _ in range(self.food_count):
+            self._spawn_food(Food(self.block_size, self.food_color))
+    
+    def update(self):
+        """
+        Advance every snake by one tick.
+        
+        Returns:
+            bool: True while the player's snake is alive
+        """
+        if self.game_over:
+            return False
+        
+        self.ticks += 1
+        for world_snake in self.snakes:
+            if not world_snake.alive:
+                # Bring dead AI snakes back once their time is up
+                if world_snake is not self.player:
+                    world_snake.respawn_ticks -= 1
+                    if world_snake.respawn_ticks <= 0:
+                        self._place_snake(world_snake)
+                continue
+            
+            if world_snake.ai:
+                self._choose_target(world_snake)
+                direction = world_snake.ai.next_direction()
+                if direction:
+                    world_snake.snake.change_direction(direction)
+            self._move(world_snake)
+        
+        self.game_over = not self.player.alive
+        return not self.game_over
+    
+    def set_player_autopilot(self, enabled):
+        """
+        Let an AI steer the player's snake, in this game and after resets.
+        
+        Args:
+            enabled (bool): Whether the AI steers the player's snake
+        
+        Returns:
+            SnakeAI: The player's AI, or None
+        """
+        self.player_autopilot = enabled
+        self.player.ai = SnakeAI(self.player, blocked=self.blocked) if enabled else None
+        return self.player.ai
+    
+    def get_alive_count(self):
+        """
+        Count the snakes on the board.
+        
+        Returns:
+            int: Snakes currently alive, the player's included
+        """
+        return sum(1 for world_snake in self.snakes if world_snake.alive)
+    
+    def take_changed_cells(self):
+        """
+        Get the cells changed since the last call.
+        
+        Returns:
+            list: (column, row) cells whose contents changed
+        """
+        changed_cells = self.changed_cells
+        self.changed_cells = []
+        return changed_cells
+    
+    def _move(self, world_snake):
+        """
+        Move one snake, handling collisions and food.
+        
+        Args:
+            world_snake (WorldSnake): The snake to move
+        """
+        snake = world_snake.snake
+        cell = snake.get_next_head(self.wrap_around)
+        if cell is None:
+            return
+        
+        # Walls and every snake's cells are missing from the shared free cells
+        if cell not in self.free_cells:
+            self._kill(world_snake)
+            return
+        
+        snake.update(self.wrap_around)
+        self.blocked[cell[1] * self.grid_width + cell[0]] = 1
+        self.owners[cell] = world_snake
+        self.changed_cells.append(cell)
+        if len(snake.body) > 1:
+            self.changed_cells.append(snake.body[1])
+        if snake.previous_tail is not None:
+            tail = snake.previous_tail
+            self.blocked[tail[1] * self.grid_width + tail[0]] = 0
+            del self.owners[tail]
+            self.changed_cells.append(tail)
+        
+        # Eat any food in the new cell and put it somewhere else
+        food = self.foods.pop(cell, None)
+        if food is not None:
+            snake.grow()
+            world_snake.score += 1
+            self._spawn_food(food)
+    
+    def _kill(self, world_snake):
+        """
+        Take a snake off the board.
+        
+        Args:
+            world_snake (WorldSnake): The snake that crashed
+        """
+        for cell in world_snake.snake.body:
+            self.free_cells.add(cell)
+            self.blocked[cell[1] * self.grid_width + cell[0]] = 0
+            self.owners.pop(cell, None)
+            self.changed_cells.append(cell)
+        world_snake.alive = False
+        world_snake.respawn_ticks = RESPAWN_DELAY
+    
+    def _place_snake(self, world_snake, head=None):
+        """
+        Put a new three-cell snake on the board.
+        
+        Args:
+            world_snake (WorldSnake): The snake to place
+            head (tuple): Cell for the head, or None for a random free spot
+        
+        Returns:
+            bool: True if the snake was placed, False if no room was found
+        """
+        # The body trails to the left of the head and must land on empty, food-free cells
+        cells = None
+        for _ in range(SPAWN_TRIES if head is None else 1):
+            x, y = head or (random.randrange(2, self.grid_width), random.randrange(self.grid_height))
+            candidate = [(x, y), (x - 1, y), (x - 2, y)]
+            if all(cell in self.free_cells and cell not in self.foods for cell in candidate):
+                cells = candidate
+                break
+        if cells is None:
+            return False
+        
+        snake = Snake(x, y, self.block_size, world_snake.color, self.grid_width, self.grid_height,
+                      free_cells=self.free_cells)
+        for cell in cells:
+            self.blocked[cell[1] * self.grid_width + cell[0]] = 1
+            self.owners[cell] = world_snake
+            self.changed_cells.append(cell)
+        
+        world_snake.snake = snake
+        world_snake.alive = True
+        world_snake.score = 0
+        world_snake.food = None
+        world_snake.target_position = None
+        return True
+    
+    def _spawn_food(self, food):
+        """
+        Put a food item on an empty cell without food.
+        
+        Args:
+            food (Food): The food item
+        """
+        for _ in range(SPAWN_TRIES):
+            if not food.respawn(self.free_cells):
+                return
+            if food.position not in self.foods:
+                self.foods[food.position] = food
+                self.changed_cells.append(food.position)
+                return
+    
+    def _choose_target(self, world_snake):
+        """
+        Point an AI snake at the nearest food once its target has been eaten.
+        
+        Args:
+            world_snake (WorldSnake): The AI snake
+        """
+        food = world_snake.food
+        if food is not None and food.position == world_snake.target_position and food.position in self.foods:
+            return
+        
+        head_x, head_y = world_snake.snake.head
+        best = None
+        best_distance = None
+        for (x, y), candidate in self.foods.items():
+            dx = abs(x - head_x)
+            dy = abs(y - head_y)
+            if self.wrap_around:
+                dx = min(dx, self.grid_width - dx)
+                dy = min(dy, self.grid_height - dy)
+            if best is None or dx + dy < best_distance:
+                best = candidate
+                best_distance = dx + dy
+        
+        world_snake.food = best
+        world_snake.target_position = best.position if best else None
+
+class WorldRenderer:
+    """
+    Draws the part of a SnakeWorld around the camera.
+    
+    The world is divided into CHUNK_CELLS x CHUNK_CELLS chunks. Each
+    visible chunk is painted once into its own surface and reused until a
+    cell in it changes, so a frame costs one blit per visible chunk plus
+    repainting the few chunks the snakes moved in, however big the world
+    is. Chunk surfaces are kept in least-recently-drawn order and dropped
+    beyond MAX_CACHED_CHUNKS.
+    """
+    
+    def __init__(self, world, view_size=(SCREEN_WIDTH, SCREEN_HEIGHT), background_color=BG_COLOR):
+        """
+        Initialize the renderer.
+        
+        Args:
+            world (SnakeWorld): The world to draw
+            view_size (tuple): Size of the view in pixels
+            background_color (tuple): The RGB color of empty cells
+        """
+        self.world = world
+        self.view_width, self.view_height = view_size
+        self.background_color = background_color
+        self.chunk_pixels = CHUNK_CELLS * world.block_size
+        
+        # Camera top-left in world pixels; with wrap-around it is not kept inside the world
+        self.camera_x = 0.0
+        self.camera_y = 0.0
+        
+        # Chunk surfaces by (column, row) chunk, and chunks needing a repaint
+        self.chunks = OrderedDict()
+        self.dirty_chunks = set()
+        
+        # Statistics of the last frame
+        self.chunks_drawn = 0
+        self.chunks_painted = 0
+        
+        self.reset()
+    
+    def reset(self):
+        """Drop the cached chunks and jump the camera to the player."""
+        self.chunks.clear()
+        self.dirty_chunks.clear()
+        self.world.take_changed_cells()
+        self.follow(1.0)
+    
+    def follow(self, smoothing=CAMERA_SMOOTHING):
+        """
+        Move the camera towards the player's head.
+        
+        Args:
+            smoothing (float): Fraction of the remaining distance to cover; 1 jumps straight there
+        """
+        world = self.world
+        block_size = world.block_size
+        head_x, head_y = world.player.snake.head
+        world_width = world.grid_width * block_size
+        world_height = world.grid_height * block_size
+        target_x = head_x * block_size + block_size / 2 - self.view_width / 2
+        target_y = head_y * block_size + block_size / 2 - self.view_height / 2
+        
+        if world.wrap_around:
+            # Go the short way round, so crossing an edge does not swing the camera across the world
+            dx = (target_x - self.camera_x + world_width / 2) % world_width - world_width / 2
+            dy = (target_y - self.camera_y + world_height / 2) % world_height - world_height / 2
+            self.camera_x = (self.camera_x + dx * smoothing) % world_width
+            self.camera_y = (self.camera_y + dy * smoothing) % world_height
+            return
+        
+        # Keep the view inside the world, centring it on a world smaller than the view
+        target_x = self._clamp(target_x, world_width - self.view_width)
+        target_y = self._clamp(target_y, world_height - self.view_height)
+        self.camera_x += (target_x - self.camera_x) * smoothing
+        self.camera_y += (target_y - self.camera_y) * smoothing
+    
+    def render(self, screen):
+        """
+        Draw the visible chunks.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+        """
+        # Chunks whose cells changed are repainted when next drawn
+        for x, y in self.world.take_changed_cells():
+            chunk = (x // CHUNK_CELLS, y // CHUNK_CELLS)
+            if chunk in self.chunks:
+                self.dirty_chunks.add(chunk)
+        
+        camera_x = int(round(self.camera_x))
+        camera_y = int(round(self.camera_y))
+        if not self.world.wrap_around:
+            screen.fill(OUTSIDE_COLOR)
+        
+        self.chunks_drawn = 0
+        self.chunks_painted = 0
+        for offset_y, chunk_rows in self._get_visible_spans(camera_y, self.view_height, self.world.grid_height):
+            for offset_x, chunk_columns in self._get_visible_spans(camera_x, self.view_width, self.world.grid_width):
+                for row in chunk_rows:
+                    for column in chunk_columns:
+                        surface = self._get_chunk((column, row))
+                        screen.blit(surface, (column * self.chunk_pixels + offset_x - camera_x,
+                                              row * self.chunk_pixels + offset_y - camera_y))
+                        self.chunks_drawn += 1
+        
+        # Drop the chunks drawn longest ago
+        while len(self.chunks) > MAX_CACHED_CHUNKS:
+            chunk, _ = self.chunks.popitem(last=False)
+            self.dirty_chunks.discard(chunk)
+    
+    def _get_visible_spans(self, camera, view_size, cell_count):
+        """
+        Get the chunks the view covers along one axis.
+        
+        Args:
+            camera (int): Camera position along the axis in world pixels
+            view_size (int): View size along the axis in pixels
+            cell_count (int): World size along the axis in cells
+        
+        Returns:
+            list: (pixel offset of the world copy, range of chunk indexes) pairs;
+            with wrap-around the view can take in the world's start again
+        """
+        world_size = cell_count * self.world.block_size
+        chunk_count = -(-cell_count // CHUNK_CELLS)
+        if self.world.wrap_around:
+            copies = range(camera // world_size, (camera + view_size - 1) // world_size + 1)
+        else:
+            copies = (0,)
+        
+        spans = []
+        for copy in copies:
+            offset = copy * world_size
+            start = max(camera - offset, 0)
+            end = min(camera + view_size - offset, world_size)
+            if start < end:
+                spans.append((offset, range(start // self.chunk_pixels,
+                                            min((end - 1) // self.chunk_pixels + 1, chunk_count))))
+        return spans
+    
+    def _get_chunk(self, chunk):
+        """
+        Get the surface of a chunk, painting it if needed.
+        
+        Args:
+            chunk (tuple): (column, row) of the chunk
+        
+        Returns:
+            pygame.Surface: The chunk's picture
+        """
+        surface = self.chunks.get(chunk)
+        if surface is None or chunk in self.dirty_chunks:
+            surface = self._paint_chunk(chunk, surface)
+            self.chunks[chunk] = surface
+            self.dirty_chunks.discard(chunk)
+            self.chunks_painted += 1
+        self.chunks.move_to_end(chunk)
+        return surface
+    
+    def _paint_chunk(self, chunk, surface=None):
+        """
+        Paint the cells of a chunk.
+        
+        Args:
+            chunk (tuple): (column, row) of the chunk
+            surface (pygame.Surface): Surface to reuse, or None to create one
+        
+        Returns:
+            pygame.Surface: The painted surface
+        """
+        world = self.world
+        block_size = world.block_size
+        first_x = chunk[0] * CHUNK_CELLS
+        first_y = chunk[1] * CHUNK_CELLS
+        columns = min(CHUNK_CELLS, world.grid_width - first_x)
+        rows = min(CHUNK_CELLS, world.grid_height - first_y)
+        
+        if surface is None:
+            surface = pygame.Surface((columns * block_size, rows * block_size))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+        
+        # Alternate chunk shades so that movement shows on an empty board
+        shade = CHUNK_SHADE if (chunk[0] + chunk[1]) % 2 else 0
+        surface.fill(tuple(min(channel + shade, 255) for channel in self.background_color))
+        
+        owners = world.owners
+        foods = world.foods
+        for y in range(first_y, first_y + rows):
+            for x in range(first_x, first_x + columns):
+                cell = (x, y)
+                position = ((x - first_x) * block_size, (y - first_y) * block_size)
+                owner = owners.get(cell)
+                if owner is not None:
+                    owner.snake.draw_segment(surface, position, cell == owner.snake.head)
+                    continue
+                food = foods.get(cell)
+                if food is not None:
+                    food.draw_at(surface, position)
+        return surface
+    
+    def _clamp(self, value, maximum):
+        """
+        Clamp a camera coordinate to the world.
+        
+        Args:
+            value (float): The coordinate
+            maximum (float): Largest coordinate keeping the view inside the world
+        
+        Returns:
+            float: The clamped coordinate, or half of a negative maximum to centre the world
+        """
+        if maximum < 0:
+            return maximum / 2
+        return min(max(value, 0), maximum)
+
+def benchmark(grid_sizes=((200, 150), (500, 500)), ai_snakes=(12, 48), ticks=300, seed=0):
+    """
+    Measure world ticks and rendering on large grids with many AI snakes.
+    
+    Args:
+        grid_sizes (iterable): (columns, rows) of each world to run
+        ai_snakes (iterable): AI snake counts to run on each world
+        ticks (int): Ticks to run, rendering a frame after each
+        seed (int): Seed for placement
+    
+    Returns:
+        list: One dict per run with mean tick and frame times in milliseconds,
+        chunks painted per frame and snakes alive at the end
+    """
+    random.seed(seed)
+    screen = pygame.display.get_surface() or pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    results = []
+    for grid_size in grid_sizes:
+        for ai_count in ai_snakes:
+            world = SnakeWorld(grid_size[0], grid_size[1], ai_snakes=ai_count,
+                               food_count=grid_size[0] * grid_size[1] // 200)
+            renderer = WorldRenderer(world, screen.get_size())
+            
+            # The player is steered by an AI of its own so that the camera moves
+            world.set_player_autopilot(True)
+            
+            tick_time = 0.0
+            frame_time = 0.0
+            chunks_painted = 0
+            for _ in range(ticks):
+                start = time.perf_counter()
+                world.update()
+                tick_time += time.perf_counter() - start
+                if world.game_over:
+                    world.reset()
+                    renderer.reset()
+                
+                start = time.perf_counter()
+                renderer.follow()
+                renderer.render(screen)
+                frame_time += time.perf_counter() - start
+                chunks_painted += renderer.chunks_painted
+            
+            results.append({
+                'grid': grid_size,
+                'ai_snakes': ai_count,
+                'tick_ms': round(tick_time / ticks * 1000.0, 3),
+                'frame_ms': round(frame_time / ticks * 1000.0, 3),
+                'chunks_painted': round(chunks_painted / ticks, 2),
+                'alive': world.get_alive_count()
+            })
+    return results
+
+if __name__ == "__main__":
+    for result in benchmark():
+        width, height = result['grid']
+        print(f"{width}x{height}, {result['ai_snakes']} AI snakes: {result['tick_ms']} ms per tick, "
+              f"{result['frame_ms']} ms per frame, {result['chunks_painted']} chunks painted per frame, "
+              f"{result['alive']} alive")
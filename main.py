@@ -8,8 +8,15 @@ It initializes the game manager and starts the shell interface.
 
 import os
 import sys
+import time
 import pygame
 from core.game_manager import GameManager
+from core.quality_governor import get_quality_governor
+from core.idle import wait_for_events
+from core.latency_monitor import get_latency_monitor
+from core.animation import get_animation_scheduler
+from core.surface_audit import get_surface_auditor
+from core.config import DEBUG_MODE
 
 def main():
     """Main function to start the SoulCoreLegacy Arcade."""
@@ -22,16 +29,36 @@ def main():
     # Start the shell (main menu)
     game_manager.start_shell()
     
+    # Shared effect quality tier, adjusted from measured frame times
+    quality_governor = get_quality_governor()
+    
+    # Input-to-photon latency, completed by GameManager.render after each flip
+    latency_monitor = get_latency_monitor()
+    
+    # Shared UI animation clock, advanced once per frame
+    animation_scheduler = get_animation_scheduler()
+    
     # Main game loop
     running = True
     while running:
         # Process events
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        idle = not events and game_manager.is_idle()
+        if idle:
+            # Nothing is animating: sleep until input arrives or the idle redraw timer fires
+            events = wait_for_events()
+        poll_time = time.perf_counter()
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             
             # Let the game manager handle events
             game_manager.handle_event(event)
+            latency_monitor.record_input(event, poll_time)
+        
+        # Advance UI animations to this frame
+        animation_scheduler.tick()
         
         # Update game state
         game_manager.update()
@@ -39,8 +66,23 @@ def main():
         # Render the current screen
         game_manager.render()
         
-        # Cap the frame rate
-        game_manager.clock.tick(60)
+        if idle:
+            # The wait already throttled this frame; keep it out of the frame time measurements
+            game_manager.clock.tick()
+        else:
+            # Cap the frame rate
+            game_manager.clock.tick(60)
+            
+            # Let the quality governor see how long the frame took without the cap delay
+            quality_governor.record_frame(game_manager.clock.get_rawtime() / 1000.0)
+    
+    # Report and keep the latency measurements of this session
+    latency_monitor.report(game_manager.get_cloud_service('analytics'))
+    if DEBUG_MODE:
+        latency_monitor.export()
+    
+    # Show where blits paid for pixel format conversion
+    get_surface_auditor().print_report()
     
     # Clean up
     pygame.quit()
@@ -6,6 +6,15 @@ import time
 import random
 import math
 from typing import List, Dict, Tuple, Callable, Optional
+from core.thumbnail_service import get_thumbnail_service
+from core.idle import IdleTracker, wait_for_events
+from core.background_cache import BackgroundSpec, get_background
+from core.catalog_index import CatalogIndex
+from core.gui_theme_cache import load_gui_theme
+from core.latency_monitor import get_latency_monitor
+from core.surface_audit import audited_blit
+from core.render_scaler import RenderScaler
+from core.quality_governor import get_quality_governor, QUALITY_LOW, QUALITY_MEDIUM, QUALITY_HIGH
 
 # Define constants
 SCREEN_WIDTH = 1280
@@ -15,7 +24,14 @@ FPS = 60
 # Define colors
 BACKGROUND_COLOR = (10, 5, 30)  # Deep space black with hint of purple
 
+# Background effect detail at each quality tier
+PARTICLE_COUNTS = {QUALITY_LOW: 15, QUALITY_MEDIUM: 30, QUALITY_HIGH: 50}
+
+# Category filter option that shows every game
+ALL_CATEGORIES = "All Categories"
+
 # Define paths
+THEME_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pygame_gui_theme.json")
 THUMBNAIL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "thumbnails")
 
 # Game list for the arcade
@@ -415,7 +431,14 @@ class ParticleSystem:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.particles = []
-        self.create_particles(50)  # Start with 50 particles
+        self.max_particles = PARTICLE_COUNTS[QUALITY_HIGH]
+        get_quality_governor().subscribe(self.set_quality)
+    
+    def set_quality(self, tier: int):
+        """Resize the particle pool for a quality tier."""
+        self.max_particles = PARTICLE_COUNTS[tier]
+        del self.particles[self.max_particles:]
+        self.create_particles(self.max_particles - len(self.particles))
     
     def create_particles(self, count: int):
         """Create a number of particles."""
@@ -473,7 +496,7 @@ class ParticleSystem:
                 particle['y'] = 0
         
         # Add new particles if needed
-        if len(self.particles) < 50:
+        if len(self.particles) < self.max_particles:
             self.create_particles(1)
     
     def draw(self, surface: pygame.Surface):
@@ -512,6 +535,11 @@ class GridBackground:
         self.grid_color = (40, 40, 80, 20)  # Semi-transparent
         self.animation_time = 0
         
+        # Connections pulse at high quality, are drawn static at medium and hidden at low
+        self.animate_connections = True
+        self.show_connections = True
+        self.connection_layer = None
+        
         # Create the background surface
         self.background = self._create_background()
         
@@ -538,85 +566,63 @@ class GridBackground:
                         'end': j,
                         'color': (100, 100, 255, 100)  # Semi-transparent blue
                     })
-    
-    def _create_background(self) -> pygame.Surface:
-        """Create the background surface with gradient."""
-        background = pygame.Surface((self.screen_width, self.screen_height))
-        
-        # Fill with gradient
-        for y in range(self.screen_height):
-            # Calculate color for this line
-            progress = y / self.screen_height
-            color_top = (10, 5, 30)  # Dark purple
-            color_bottom = (5, 0, 20)  # Darker purple
-            
-            color = tuple(
-                int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
-                for i in range(3)
-            )
-            
-            # Draw horizontal line with this color
-            pygame.draw.line(
-                background,
-                color,
-                (0, y),
-                (self.screen_width - 1, y)
-            )
         
-        return background
+        get_quality_governor().subscribe(self.set_quality)
     
-    def update(self, delta_time: float):
-        """Update the grid background."""
-        self.animation_time += delta_time
+    def set_quality(self, tier: int):
+        """Choose how connections are drawn for a quality tier."""
+        self.animate_connections = tier >= QUALITY_HIGH
+        self.show_connections = tier >= QUALITY_MEDIUM
     
-    def draw(self, surface: pygame.Surface):
-        """Draw the grid background."""
-        # Draw the background
-        surface.blit(self.background, (0, 0))
-        
-        # Draw grid lines
-        grid_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        
-        # Horizontal grid lines
-        for y in range(0, self.screen_height, self.grid_size):
-            pygame.draw.line(
-                grid_surface,
-                self.grid_color,
-                (0, y),
-                (self.screen_width, y)
-            )
-        
-        # Vertical grid lines
-        for x in range(0, self.screen_width, self.grid_size):
-            pygame.draw.line(
-                grid_surface,
-                self.grid_color,
-                (x, 0),
-                (x, self.screen_height)
-            )
-        
-        # Draw grid
-        surface.blit(grid_surface, (0, 0))
-        
-        # Draw connections between nodes
+    def _draw_connections(self) -> pygame.Surface:
+        """Draw every connection at full alpha onto one transparent surface, faded with set_alpha."""
+        connection_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
         for connection in self.connections:
             start_node = self.nodes[connection['start']]
             end_node = self.nodes[connection['end']]
             
-            # Calculate alpha based on animation
-            alpha = int(100 + 50 * math.sin(self.animation_time * 2))
-            color = (*connection['color'][:3], alpha)
-            
             # Draw line with alpha
-            connection_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
             pygame.draw.line(
                 connection_surface,
-                color,
+                (*connection['color'][:3], 255),
                 (start_node['x'], start_node['y']),
                 (end_node['x'], end_node['y']),
                 1
             )
-            surface.blit(connection_surface, (0, 0))
+        return connection_surface
+    
+    def _create_background(self) -> pygame.Surface:
+        """Create the background surface with gradient and grid (rendered once, then cached)."""
+        return get_background(BackgroundSpec(
+            'grid',
+            (self.screen_width, self.screen_height),
+            (
+                (10, 5, 30),  # Dark purple
+                (5, 0, 20),  # Darker purple
+                self.grid_color
+            ),
+            params=(self.grid_size,)
+        ))
+    
+    def update(self, delta_time: float):
+        """Update the grid background."""
+        self.animation_time += delta_time
+    
+    def draw(self, surface: pygame.Surface):
+        """Draw the grid background."""
+        # Draw the background with the grid baked in
+        audited_blit(surface, self.background, (0, 0), "GridBackground.background")
+        
+        # Draw connections between nodes, rendered once and pulsed through the surface alpha
+        if self.show_connections:
+            if self.connection_layer is None:
+                self.connection_layer = self._draw_connections()
+            if self.animate_connections:
+                alpha = int(100 + 50 * math.sin(self.animation_time * 2))
+            else:
+                alpha = 100
+            self.connection_layer.set_alpha(alpha)
+            audited_blit(surface, self.connection_layer, (0, 0), "GridBackground.connections")
         
         # Draw nodes
         for node in self.nodes:
@@ -658,21 +664,29 @@ class GridBackground:
             )
 
 class GameCard:
-    """Game card UI element for pygame_gui."""
+    """
+    Game card UI element for pygame_gui.
+    
+    Cards are pooled by CardGrid: the widgets are created once and rebound
+    to another game with bind() as the grid scrolls.
+    """
     
-    def __init__(self, ui_manager: pygame_gui.UIManager, game_info: Dict, rect: pygame.Rect, 
+    # Star images shared by all cards, keyed by (filled, size)
+    _star_images = {}
+    
+    def __init__(self, ui_manager: pygame_gui.UIManager, game_info: Optional[Dict], rect: pygame.Rect, 
                  on_click: Callable[[str], None]):
         """
         Initialize a game card.
         
         Args:
             ui_manager: The pygame_gui UIManager
-            game_info: Information about the game
+            game_info: Information about the game, or None to create an unbound card
             rect: The rectangle for the card
             on_click: Function to call when clicked
         """
         self.ui_manager = ui_manager
-        self.game_info = game_info
+        self.game_info = None
         self.rect = rect
         self.on_click = on_click
         
@@ -682,58 +696,40 @@ class GameCard:
             manager=ui_manager,
             starting_height=1,
             margins={'left': 1, 'right': 1, 'top': 1, 'bottom': 1},
-            object_id=f"#game_card_{game_info['id']}"
+            object_id="#game_card"
         )
         
-        # Load thumbnail if available
-        self.thumbnail = None
-        thumbnail_path = game_info.get('thumbnail')
-        if thumbnail_path and os.path.exists(thumbnail_path):
-            try:
-                # Load the thumbnail image
-                self.thumbnail = pygame.image.load(thumbnail_path)
-                
-                # Create thumbnail image element
-                thumbnail_rect = pygame.Rect(10, 10, rect.width - 20, 80)  # Reduced height
-                
-                # Scale the thumbnail to fit
-                scaled_thumbnail = pygame.transform.scale(self.thumbnail, (thumbnail_rect.width, thumbnail_rect.height))
-                
-                # Create the image element
-                self.thumbnail_element = pygame_gui.elements.UIImage(
-                    relative_rect=thumbnail_rect,
-                    image_surface=scaled_thumbnail,
-                    manager=ui_manager,
-                    container=self.panel,
-                    object_id=f"#game_card_{game_info['id']}_thumbnail"
-                )
-                
-                # Adjust layout for thumbnail
-                title_y = 95  # Adjusted position
-            except Exception as e:
-                print(f"Error loading thumbnail for {game_info['id']}: {e}")
-                title_y = 10
-        else:
-            title_y = 10
+        # Create the thumbnail image element; bind() hides it for games without one
+        thumbnail_rect = pygame.Rect(10, 10, rect.width - 20, 80)  # Reduced height
+        self.thumbnail_size = thumbnail_rect.size
+        self.thumbnail_path = None
+        self.thumbnail = get_thumbnail_service().get_placeholder(self.thumbnail_size)
+        self.thumbnail_element = pygame_gui.elements.UIImage(
+            relative_rect=thumbnail_rect,
+            image_surface=self.thumbnail,
+            manager=ui_manager,
+            container=self.panel,
+            object_id="#game_card_thumbnail"
+        )
         
         # Create the title
-        title_rect = pygame.Rect(0, title_y, rect.width - 20, 25)  # Reduced height
+        title_rect = pygame.Rect(0, 95, rect.width - 20, 25)  # Reduced height
         self.title = pygame_gui.elements.UILabel(
             relative_rect=title_rect,
-            text=game_info['name'],
+            text="",
             manager=ui_manager,
             container=self.panel,
-            object_id=f"#game_card_{game_info['id']}_title"
+            object_id="#game_card_title"
         )
         
         # Create the description
-        desc_rect = pygame.Rect(10, title_y + 30, rect.width - 20, 50)  # Reduced height
+        desc_rect = pygame.Rect(10, 125, rect.width - 20, 50)  # Reduced height
         self.description = pygame_gui.elements.UITextBox(
-            html_text=game_info['description'],
+            html_text="",
             relative_rect=desc_rect,
             manager=ui_manager,
             container=self.panel,
-            object_id=f"#game_card_{game_info['id']}_description"
+            object_id="#game_card_description"
         )
         
         # Create the play button
@@ -743,52 +739,133 @@ class GameCard:
             text="PLAY",
             manager=ui_manager,
             container=self.panel,
-            object_id=f"#game_card_{game_info['id']}_button"
+            object_id="#game_card_button"
         )
         
-        # Add badges if needed
-        self.badges = []
-        
         # New release badge
-        if game_info.get('new_release', False):
-            new_badge_rect = pygame.Rect(rect.width - 60, 10, 50, 20)
-            new_badge = pygame_gui.elements.UILabel(
-                relative_rect=new_badge_rect,
-                text="NEW!",
-                manager=ui_manager,
-                container=self.panel,
-                object_id="#new_badge"
-            )
-            self.badges.append(new_badge)
+        self.new_badge = pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(rect.width - 60, 10, 50, 20),
+            text="NEW!",
+            manager=ui_manager,
+            container=self.panel,
+            object_id="#new_badge"
+        )
         
         # Featured badge
-        if game_info.get('featured', False):
-            featured_badge_rect = pygame.Rect(10, 10, 70, 20)
-            featured_badge = pygame_gui.elements.UILabel(
-                relative_rect=featured_badge_rect,
-                text="FEATURED",
-                manager=ui_manager,
-                container=self.panel,
-                object_id="#featured_badge"
-            )
-            self.badges.append(featured_badge)
+        self.featured_badge = pygame_gui.elements.UILabel(
+            relative_rect=pygame.Rect(10, 10, 70, 20),
+            text="FEATURED",
+            manager=ui_manager,
+            container=self.panel,
+            object_id="#featured_badge"
+        )
+        self.badges = [self.new_badge, self.featured_badge]
         
         # Create popularity stars
         self.stars = []
-        popularity = game_info.get('popularity', 0)
-        star_count = min(5, max(0, popularity // 2))  # 0-10 scale to 0-5 stars
-        
+        self.star_count = 0
         for i in range(5):
             star_rect = pygame.Rect(10 + i * 15, rect.height - 60, 10, 10)  # Smaller stars, adjusted position
-            star_filled = i < star_count
             star = pygame_gui.elements.UIImage(
                 relative_rect=star_rect,
-                image_surface=self._create_star_image(filled=star_filled, size=10),  # Smaller stars
+                image_surface=self._create_star_image(filled=False, size=10),  # Smaller stars
                 manager=ui_manager,
                 container=self.panel,
-                object_id="#star_filled" if star_filled else "#star_empty"
+                object_id="#star_empty"
             )
             self.stars.append(star)
+        
+        if game_info is not None:
+            self.bind(game_info)
+    
+    def bind(self, game_info: Dict):
+        """
+        Show a game on this card.
+        
+        Only the widgets whose content differs from the previous game are
+        rebuilt.
+        
+        Args:
+            game_info: Information about the game
+        """
+        if game_info is self.game_info:
+            return
+        
+        self.game_info = game_info
+        game_id = game_info['id']
+        
+        # Per-game theming
+        self.panel.change_object_id(f"#game_card_{game_id}")
+        self.title.change_object_id(f"#game_card_{game_id}_title")
+        self.play_button.change_object_id(f"#game_card_{game_id}_button")
+        
+        # Thumbnail (the service returns a placeholder until it has loaded)
+        self.thumbnail_path = game_info.get('thumbnail')
+        if self.thumbnail_path and os.path.exists(self.thumbnail_path):
+            self.thumbnail = get_thumbnail_service().get(game_id, self.thumbnail_path, self.thumbnail_size)
+            self.thumbnail_element.set_image(self.thumbnail)
+            self.thumbnail_element.show()
+            title_y = 95  # Adjusted position
+        else:
+            self.thumbnail_path = None
+            self.thumbnail_element.hide()
+            title_y = 10
+        
+        # Title and description
+        self.title.set_relative_position((0, title_y))
+        self.title.set_text(game_info['name'])
+        self.description.set_relative_position((10, title_y + 30))
+        self.description.set_text(game_info['description'])
+        
+        # Badges
+        if game_info.get('new_release', False):
+            self.new_badge.show()
+        else:
+            self.new_badge.hide()
+        
+        if game_info.get('featured', False):
+            self.featured_badge.show()
+        else:
+            self.featured_badge.hide()
+        
+        # Popularity stars (0-10 scale to 0-5 stars)
+        star_count = min(5, max(0, game_info.get('popularity', 0) // 2))
+        if star_count != self.star_count:
+            for i, star in enumerate(self.stars):
+                filled = i < star_count
+                if filled != (i < self.star_count):
+                    star.set_image(self._create_star_image(filled=filled, size=10))
+            self.star_count = star_count
+    
+    def set_position(self, position: Tuple[int, int]):
+        """
+        Move the card.
+        
+        Args:
+            position: The new top-left position of the card on screen
+        """
+        if self.rect.topleft != position:
+            self.rect.topleft = position
+            self.panel.set_position(position)
+    
+    def show(self):
+        """Show the card."""
+        if not self.panel.visible:
+            self.panel.show()
+            
+            # Showing the panel shows every child, so restore the bound state
+            game_info = self.game_info or {}
+            if not self.thumbnail_path:
+                self.thumbnail_element.hide()
+            if not game_info.get('new_release', False):
+                self.new_badge.hide()
+            if not game_info.get('featured', False):
+                self.featured_badge.hide()
+    
+    def hide(self):
+        """Hide the card."""
+        if self.panel.visible:
+            self.panel.hide()
     
     def _create_star_image(self, filled: bool = True, size: int = 15) -> pygame.Surface:
         """
@@ -801,6 +878,10 @@ class GameCard:
         Returns:
             Star image surface
         """
+        key = (filled, size)
+        if key in GameCard._star_images:
+            return GameCard._star_images[key]
+        
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         
         if filled:
@@ -828,6 +909,7 @@ class GameCard:
         else:
             pygame.draw.polygon(surface, color, points, 1)
         
+        GameCard._star_images[key] = surface
         return surface
     
     def process_event(self, event: pygame.event.Event) -> bool:
@@ -841,7 +923,7 @@ class GameCard:
             True if the event was handled
         """
         if event.type == pygame_gui.UI_BUTTON_PRESSED:
-            if event.ui_element == self.play_button:
+            if event.ui_element == self.play_button and self.game_info:
                 self.on_click(self.game_info['id'])
                 return True
         
@@ -854,7 +936,12 @@ class GameCard:
         Args:
             delta_time: Time since last update
         """
-        pass
+        # Swap in the thumbnail once the service has finished loading it
+        if self.thumbnail_path:
+            thumbnail = get_thumbnail_service().get(self.game_info['id'], self.thumbnail_path, self.thumbnail_size)
+            if thumbnail is not self.thumbnail:
+                self.thumbnail = thumbnail
+                self.thumbnail_element.set_image(thumbnail)
     
     def kill(self):
         """Destroy the card and all its elements."""
@@ -867,11 +954,243 @@ class GameCard:
         self.play_button.kill()
         self.description.kill()
         self.title.kill()
+        self.thumbnail_element.kill()
+        self.panel.kill()
+
+class CardGrid:
+    """
+    Virtualized grid of game cards.
+    
+    Only the rows inside the viewport plus a small overscan have card
+    widgets. Cards that scroll out of range go back to a pool and are
+    rebound to the games scrolling into view, so the number of widgets
+    stays constant however large the catalog grows.
+    """
+    
+    def __init__(self, ui_manager: pygame_gui.UIManager, games: List[Dict], viewport: pygame.Rect,
+                 on_click: Callable[[str], None], card_size: Tuple[int, int] = (300, 250),
+                 cards_per_row: int = 3, spacing: Tuple[int, int] = (30, 20), overscan_rows: int = 1):
+        """
+        Initialize the card grid.
         
-        if hasattr(self, 'thumbnail_element'):
-            self.thumbnail_element.kill()
+        Args:
+            ui_manager: The pygame_gui UIManager
+            games: The games to show
+            viewport: Screen area the grid scrolls within
+            on_click: Function to call when a card is clicked
+            card_size: Width and height of each card
+            cards_per_row: Number of cards per row
+            spacing: Horizontal and vertical spacing between cards
+            overscan_rows: Rows kept bound above and below the viewport
+        """
+        self.ui_manager = ui_manager
+        self.viewport = viewport
+        self.on_click = on_click
+        self.card_width, self.card_height = card_size
+        self.cards_per_row = cards_per_row
+        self.horizontal_spacing, self.vertical_spacing = spacing
+        self.overscan_rows = overscan_rows
+        self.row_height = self.card_height + self.vertical_spacing
+        
+        # Centre the grid horizontally in the viewport
+        self.start_x = viewport.x + (viewport.width - (cards_per_row * self.card_width + (cards_per_row - 1) * self.horizontal_spacing)) // 2
+        
+        # Cards in use keyed by game index, and released cards ready for reuse
+        self.active = {}
+        self.pool = []
+        
+        self.games = []
+        self.scroll_offset = 0
+        self.set_games(games)
+    
+    @property
+    def cards(self) -> List[GameCard]:
+        """Cards currently bound to a game."""
+        return list(self.active.values())
+    
+    @property
+    def row_count(self) -> int:
+        """Number of rows needed for all games."""
+        return (len(self.games) + self.cards_per_row - 1) // self.cards_per_row
+    
+    @property
+    def content_height(self) -> int:
+        """Total height of the grid content, including bottom padding."""
+        if not self.games:
+            return 0
+        return self.row_count * self.row_height - self.vertical_spacing + 50  # Add some padding
+    
+    @property
+    def max_scroll_offset(self) -> int:
+        """Largest scroll offset that still fills the viewport."""
+        return max(0, self.content_height - self.viewport.height)
+    
+    def set_games(self, games: List[Dict], scroll_offset: Optional[int] = None):
+        """
+        Replace the games shown by the grid.
+        
+        Existing card widgets are recycled rather than rebuilt.
+        
+        Args:
+            games: The games to show
+            scroll_offset: Optional new scroll offset; the current one is kept by default
+        """
+        self.games = games
+        
+        # Indices now refer to different games, so release every card
+        for card in self.active.values():
+            card.hide()
+            self.pool.append(card)
+        self.active = {}
+        
+        if scroll_offset is not None:
+            self.scroll_offset = scroll_offset
+        self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll_offset))
+        self.update_visible()
+    
+    def set_scroll_offset(self, offset: int):
+        """
+        Scroll the grid.
+        
+        Args:
+            offset: Pixels scrolled from the top of the content
+        """
+        offset = max(0, min(self.max_scroll_offset, int(offset)))
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self.update_visible()
+    
+    def update_visible(self):
+        """Bind, position and show the cards for the current scroll offset."""
+        if not self.games:
+            return
+        
+        # Rows intersecting the viewport, plus overscan
+        first_visible_row = self.scroll_offset // self.row_height
+        last_visible_row = (self.scroll_offset + self.viewport.height - 1) // self.row_height
+        first_row = max(0, first_visible_row - self.overscan_rows)
+        last_row = min(self.row_count - 1, last_visible_row + self.overscan_rows)
+        
+        first_index = first_row * self.cards_per_row
+        end_index = min(len(self.games), (last_row + 1) * self.cards_per_row)
+        
+        # Release cards that fell out of range
+        for index in [i for i in self.active if i < first_index or i >= end_index]:
+            card = self.active.pop(index)
+            card.hide()
+            self.pool.append(card)
+        
+        # Bind and position the cards in range
+        for index in range(first_index, end_index):
+            card = self.active.get(index)
+            if card is None:
+                card = self._acquire_card()
+                card.bind(self.games[index])
+                self.active[index] = card
             
-        self.panel.kill()
+            x, y = self._card_position(index)
+            card.set_position((x, y))
+            
+            # Overscan cards stay bound but hidden until they scroll into view
+            if y + self.card_height > self.viewport.top and y < self.viewport.bottom:
+                card.show()
+            else:
+                card.hide()
+    
+    def process_event(self, event: pygame.event.Event) -> bool:
+        """
+        Pass an event to the bound cards.
+        
+        Args:
+            event: The event to process
+            
+        Returns:
+            True if a card handled the event
+        """
+        for card in list(self.active.values()):
+            if card.process_event(event):
+                return True
+        return False
+    
+    def update(self, delta_time: float):
+        """
+        Update the bound cards.
+        
+        Args:
+            delta_time: Time since last update
+        """
+        for card in self.active.values():
+            card.update(delta_time)
+    
+    def kill(self):
+        """Destroy every card widget, bound or pooled."""
+        for card in list(self.active.values()) + self.pool:
+            card.kill()
+        self.active = {}
+        self.pool = []
+    
+    def _acquire_card(self) -> GameCard:
+        """Take a card from the pool, creating one if the pool is empty."""
+        if self.pool:
+            return self.pool.pop()
+        
+        return GameCard(
+            ui_manager=self.ui_manager,
+            game_info=None,
+            rect=pygame.Rect(self.start_x, self.viewport.y, self.card_width, self.card_height),
+            on_click=self.on_click
+        )
+    
+    def _card_position(self, index: int) -> Tuple[int, int]:
+        """
+        Get the on-screen position of the card at an index.
+        
+        Args:
+            index: Index of the game in the grid
+            
+        Returns:
+            Top-left position of the card
+        """
+        row = index // self.cards_per_row
+        col = index % self.cards_per_row
+        x = self.start_x + col * (self.card_width + self.horizontal_spacing)
+        y = self.viewport.y + row * self.row_height - self.scroll_offset
+        return x, y
+
+class ScaledUIManager(pygame_gui.UIManager):
+    """
+    UI manager for a menu drawn at a logical resolution.
+    
+    pygame_gui passes every window mouse position through
+    calculate_scaled_mouse_position, so mapping it through the render
+    scaler keeps hovering and clicking aligned when the menu is scaled in
+    software.
+    """
+    
+    def __init__(self, scaler: RenderScaler, window_resolution: Tuple[int, int], theme):
+        """
+        Initialize the UI manager.
+        
+        Args:
+            scaler: Render scaler presenting the menu
+            window_resolution: Logical resolution of the menu
+            theme: Theme dictionary or path for pygame_gui
+        """
+        # Set before the base class first reads the mouse position
+        self.scaler = scaler
+        super().__init__(window_resolution, theme)
+    
+    def calculate_scaled_mouse_position(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Map a window mouse position to menu coordinates.
+        
+        Args:
+            position: Position in the window
+            
+        Returns:
+            Position in the menu
+        """
+        return self.scaler.map_position(position)
 
 class ProfessionalMenu:
     """Professional menu interface using pygame_gui."""
@@ -889,29 +1208,40 @@ class ProfessionalMenu:
         
         # Initialize pygame
         pygame.init()
-        self.screen = pygame.display.set_mode((screen_width, screen_height))
+        
+        # Draw at the menu resolution and let the scaler fit it to the window
+        self.scaler = RenderScaler((screen_width, screen_height))
+        self.screen = self.scaler.create_display()
         pygame.display.set_caption("SoulCoreLegacy Arcade")
         
         # Create clock
         self.clock = pygame.time.Clock()
         
         # Create UI manager with theme
-        self.ui_manager = pygame_gui.UIManager((screen_width, screen_height), 'pygame_gui_theme.json')
+        self.ui_manager = ScaledUIManager(self.scaler, (screen_width, screen_height), load_gui_theme(THEME_PATH))
         
         # Create background effects
         self.grid_background = GridBackground(screen_width, screen_height)
         self.particle_system = ParticleSystem(screen_width, screen_height)
         
+        # Index the catalog for search and category filtering
+        self.catalog = CatalogIndex(GAME_LIST)
+        self.search_query = ""
+        self.search_category = None
+        
         # Create UI elements
         self._create_ui_elements()
         
         # Game cards
-        self.game_cards = []
+        self.card_grid = None
         self._create_game_cards()
         
         # Add scrollbar for vertical scrolling if needed
         self.scrollbar = None
         self.setup_scrolling()
+        
+        # User activity, used to let the menu go idle
+        self.idle_tracker = IdleTracker()
     
     def _create_ui_elements(self):
         """Create the UI elements."""
@@ -954,44 +1284,45 @@ class ProfessionalMenu:
             manager=self.ui_manager,
             object_id="#quit_button"
         )
+        
+        # Create search box
+        self.search_entry = pygame_gui.elements.UITextEntryLine(
+            relative_rect=pygame.Rect(20, 80, 260, 34),
+            manager=self.ui_manager,
+            object_id="#search_entry",
+            placeholder_text="Search games..."
+        )
+        
+        # Create category filter
+        self.category_dropdown = pygame_gui.elements.UIDropDownMenu(
+            options_list=[ALL_CATEGORIES] + self.catalog.categories,
+            starting_option=ALL_CATEGORIES,
+            relative_rect=pygame.Rect(self.screen_width - 240, 80, 200, 34),
+            manager=self.ui_manager,
+            object_id="#category_dropdown"
+        )
     
     def _create_game_cards(self):
-        """Create game cards for each game."""
+        """Create the virtualized grid of game cards."""
         # Clear existing cards
-        for card in self.game_cards:
-            card.kill()
-        
-        self.game_cards = []
-        
-        # Calculate card layout
-        card_width = 300
-        card_height = 250  # Reduced height to fit screen better
-        cards_per_row = 3
-        horizontal_spacing = 30
-        vertical_spacing = 20  # Reduced vertical spacing
-        
-        # Calculate starting position
-        start_x = (self.screen_width - (cards_per_row * card_width + (cards_per_row - 1) * horizontal_spacing)) // 2
-        start_y = 130  # Moved up slightly
-        
-        # Create a card for each game
-        for i, game in enumerate(GAME_LIST):
-            # Calculate position
-            row = i // cards_per_row
-            col = i % cards_per_row
-            x = start_x + col * (card_width + horizontal_spacing)
-            y = start_y + row * (card_height + vertical_spacing)
-            
-            # Create the card
-            card = GameCard(
-                ui_manager=self.ui_manager,
-                game_info=game,
-                rect=pygame.Rect(x, y, card_width, card_height),
-                on_click=self._on_game_selected
-            )
-            
-            # Add the card to the list
-            self.game_cards.append(card)
+        if self.card_grid:
+            self.card_grid.kill()
+        
+        # Cards are only created for the rows in view; the grid recycles them while scrolling
+        self.card_grid = CardGrid(
+            ui_manager=self.ui_manager,
+            games=GAME_LIST,
+            viewport=pygame.Rect(0, 130, self.screen_width, self.screen_height - 130),  # Moved up slightly
+            on_click=self._on_game_selected,
+            card_size=(300, 250),  # Reduced height to fit screen better
+            cards_per_row=3,
+            spacing=(30, 20)  # Reduced vertical spacing
+        )
+    
+    @property
+    def game_cards(self) -> List[GameCard]:
+        """Cards currently bound to a game."""
+        return self.card_grid.cards if self.card_grid else []
     
     def _on_game_selected(self, game_id: str):
         """
@@ -1002,81 +1333,45 @@ class ProfessionalMenu:
         """
         print(f"Game selected: {game_id}")
     
+    def apply_filter(self):
+        """Show the games matching the search text and category, reusing the card widgets."""
+        games = self.catalog.search(self.search_query, self.search_category)
+        self.card_grid.set_games(games, scroll_offset=0)
+        self.setup_scrolling()
+    
     def setup_scrolling(self):
         """Set up scrolling for the game cards if needed."""
-        # Calculate total height needed
-        if len(self.game_cards) > 0:
-            last_card = self.game_cards[-1]
-            total_content_height = last_card.rect.bottom + 50  # Add some padding
-            
-            # If content exceeds screen height, add scrollbar
-            if total_content_height > self.screen_height:
-                self.scrollbar = pygame_gui.elements.UIVerticalScrollBar(
-                    relative_rect=pygame.Rect(self.screen_width - 20, 120, 20, self.screen_height - 160),
-                    visible_percentage=(self.screen_height - 160) / total_content_height,
-                    manager=self.ui_manager
-                )
+        if self.scrollbar:
+            self.scrollbar.kill()
+            self.scrollbar = None
+        
+        # If content exceeds the grid viewport, add scrollbar
+        total_content_height = self.card_grid.content_height
+        if total_content_height > self.card_grid.viewport.height:
+            self.scrollbar = pygame_gui.elements.UIVerticalScrollBar(
+                relative_rect=pygame.Rect(self.screen_width - 20, 120, 20, self.screen_height - 160),
+                visible_percentage=self.card_grid.viewport.height / total_content_height,
+                manager=self.ui_manager
+            )
     
     def handle_scrolling(self, event):
         """Handle scrolling events."""
-        if hasattr(self, 'scrollbar') and self.scrollbar:
-            # Check for mouse wheel events
+        if self.scrollbar:
+            # Mouse wheel scrolls anywhere over the grid; the scrollbar handles its own buttons and dragging
             if event.type == pygame.MOUSEWHEEL:
-                scroll_amount = event.y * -0.1  # Adjust scroll speed
-                self.scrollbar.scroll_position = max(0.0, min(1.0, self.scrollbar.scroll_position + scroll_amount))
+                scroll_amount = event.y * -100 / self.card_grid.content_height  # 100 pixels per notch
+                self.scrollbar.set_scroll_from_start_percentage(
+                    max(0.0, min(1.0 - self.scrollbar.visible_percentage, self.scrollbar.start_percentage + scroll_amount)))
                 self.update_card_positions()
-            
-            # Check for scrollbar movement using a more generic approach
-            if event.type == pygame.USEREVENT:
-                if hasattr(event, 'ui_element') and event.ui_element == self.scrollbar:
-                    self.update_card_positions()
-            
-            # Check for mouse clicks on scrollbar arrows
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left mouse button
-                mouse_pos = pygame.mouse.get_pos()
-                
-                # Check if clicked on up arrow (top of scrollbar)
-                scrollbar_rect = self.scrollbar.rect
-                up_arrow_rect = pygame.Rect(scrollbar_rect.x, scrollbar_rect.y, scrollbar_rect.width, 20)
-                if up_arrow_rect.collidepoint(mouse_pos):
-                    self.scrollbar.scroll_position = max(0.0, self.scrollbar.scroll_position - 0.1)
-                    self.update_card_positions()
-                
-                # Check if clicked on down arrow (bottom of scrollbar)
-                down_arrow_rect = pygame.Rect(scrollbar_rect.x, scrollbar_rect.bottom - 20, scrollbar_rect.width, 20)
-                if down_arrow_rect.collidepoint(mouse_pos):
-                    self.scrollbar.scroll_position = min(1.0, self.scrollbar.scroll_position + 0.1)
-                    self.update_card_positions()
-                
-                # Check if clicked on scrollbar track
-                track_rect = pygame.Rect(scrollbar_rect.x, scrollbar_rect.y + 20, 
-                                        scrollbar_rect.width, scrollbar_rect.height - 40)
-                if track_rect.collidepoint(mouse_pos):
-                    # Calculate relative position in track
-                    relative_pos = (mouse_pos[1] - track_rect.y) / track_rect.height
-                    self.scrollbar.scroll_position = max(0.0, min(1.0, relative_pos))
-                    self.update_card_positions()
     
     def update_card_positions(self):
         """Update card positions based on scroll position."""
-        if not hasattr(self, 'scrollbar') or not self.scrollbar or not self.game_cards:
+        if not self.scrollbar or not self.card_grid:
             return
-            
-        # Calculate total height needed
-        last_card = self.game_cards[-1]
-        total_content_height = last_card.rect.bottom + 50
-        
-        # Calculate scroll offset
-        scroll_height = total_content_height - (self.screen_height - 160)
-        scroll_offset = int(self.scrollbar.scroll_position * scroll_height)
-        
-        # Apply offset to all cards
-        for card in self.game_cards:
-            # Get the original y position (without scrolling)
-            original_y = card.rect.y
-            
-            # Apply scroll offset
-            card.panel.set_position((card.rect.x, original_y - scroll_offset))
+        
+        # start_percentage is the fraction of the content scrolled past the top
+        scroll_offset = self.scrollbar.start_percentage * self.card_grid.content_height
+        self.card_grid.set_scroll_offset(round(scroll_offset))
     
     def handle_event(self, event):
         """
@@ -1085,6 +1380,8 @@ class ProfessionalMenu:
         Args:
             event: The event to handle
         """
+        self.idle_tracker.notify(event)
+        
         # Handle scrolling
         self.handle_scrolling(event)
         
@@ -1092,8 +1389,7 @@ class ProfessionalMenu:
         self.ui_manager.process_events(event)
         
         # Process game card events
-        for card in self.game_cards:
-            card.process_event(event)
+        self.card_grid.process_event(event)
         
         # Handle button events
         if event.type == pygame_gui.UI_BUTTON_PRESSED:
@@ -1102,6 +1398,14 @@ class ProfessionalMenu:
             elif event.ui_element == self.settings_button:
                 print("Settings button pressed")
         
+        # Filter the grid as the search text or category changes
+        elif event.type == pygame_gui.UI_TEXT_ENTRY_CHANGED and event.ui_element == self.search_entry:
+            self.search_query = event.text
+            self.apply_filter()
+        elif event.type == pygame_gui.UI_DROP_DOWN_MENU_CHANGED and event.ui_element == self.category_dropdown:
+            self.search_category = None if event.text == ALL_CATEGORIES else event.text
+            self.apply_filter()
+        
         return True  # Continue running
     
     def update(self, time_delta: float):
@@ -1117,6 +1421,23 @@ class ProfessionalMenu:
         
         # Update UI
         self.ui_manager.update(time_delta)
+        
+        # Follow the scrollbar when it is dragged or its buttons are used
+        if self.scrollbar and self.scrollbar.check_has_moved_recently():
+            self.update_card_positions()
+        
+        # Update game cards
+        self.card_grid.update(time_delta)
+    
+    def is_animating(self) -> bool:
+        """
+        Check whether the menu needs to redraw at full frame rate.
+        
+        Returns:
+            True while the user is active or thumbnails are loading
+        """
+        # The grid and particles are ambient; they only hold full rate while the user is active
+        return self.idle_tracker.is_active() or get_thumbnail_service().has_pending()
     
     def draw(self, surface: pygame.Surface):
         """
@@ -1135,19 +1456,35 @@ class ProfessionalMenu:
     def run(self):
         """Run the menu loop."""
         running = True
+        idle = False
+        quality_governor = get_quality_governor()
+        latency_monitor = get_latency_monitor()
+        latency_monitor.set_screen("shell")
         
         while running:
-            # Calculate delta time
-            time_delta = self.clock.tick(FPS) / 1000.0
+            if idle:
+                # Nothing is animating: sleep until input arrives or the idle redraw timer fires
+                events = wait_for_events()
+                time_delta = self.clock.tick() / 1000.0
+            else:
+                # Calculate delta time
+                time_delta = self.clock.tick(FPS) / 1000.0
+                
+                # Let the quality governor see how long the last frame took without the cap delay
+                quality_governor.record_frame(self.clock.get_rawtime() / 1000.0)
+                
+                events = pygame.event.get()
+            poll_time = time.perf_counter()
             
             # Process events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 
                 # Handle events
                 if not self.handle_event(event):
                     running = False
+                latency_monitor.record_input(event, poll_time)
             
             # Update
             self.update(time_delta)
@@ -1155,8 +1492,12 @@ class ProfessionalMenu:
             # Draw
             self.draw(self.screen)
             
-            # Update display
-            pygame.display.update()
+            # Scale the frame to the window if needed and update the display
+            self.scaler.present()
+            latency_monitor.frame_presented()
+            
+            # Throttle the next frame if nothing is going on
+            idle = not self.is_animating() and not pygame.event.peek()
         
         # Clean up
         pygame.quit()
@@ -0,0 +1,163 @@
+"""
+SoulCoreLegacy Arcade - Effect Pool
+----------------------------------
+This module draws short-lived circle effects (button ripples, click rings)
+from pre-rendered frames held in a fixed-capacity pool, so spawning and
+drawing effects does not allocate surfaces.
+"""
+
+import pygame
+from typing import Tuple, List
+
+# Frames rendered per effect; radius and alpha are quantized to these steps
+EFFECT_FRAME_STEPS = 12
+
+# Pre-rendered frame sets keyed by (max_radius, color, width, steps)
+_frame_cache = {}
+
+def get_effect_frames(max_radius: int, color: Tuple[int, int, int], width: int = 0,
+                      steps: int = EFFECT_FRAME_STEPS) -> List[pygame.Surface]:
+    """
+    Get the frames of an expanding, fading circle.
+    
+    Frame i has radius max_radius * (i + 1) / steps and alpha
+    255 * (1 - i / steps). Frame sets are shared by every effect with the
+    same parameters.
+    
+    Args:
+        max_radius: Radius of the last frame
+        color: RGB color of the circle
+        width: Outline width, or 0 for a filled circle
+        steps: Number of frames
+    
+    Returns:
+        List of frame surfaces, each square and centered on the circle
+    """
+    key = (max_radius, color, width, steps)
+    frames = _frame_cache.get(key)
+    if frames is not None:
+        return frames
+    
+    frames = []
+    for i in range(steps):
+        radius = max(1, int(max_radius * (i + 1) / steps))
+        alpha = int(255 * (1 - i / steps))
+        
+        frame = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(frame, (*color, alpha), (radius, radius), radius, width)
+        frames.append(frame)
+    
+    _frame_cache[key] = frames
+    return frames
+
+def clear_effect_frames():
+    """Drop all cached effect frames."""
+    _frame_cache.clear()
+
+class EffectPool:
+    """
+    Fixed-capacity pool of running effects.
+    
+    Slots are preallocated; spawning reuses a free slot or, when the pool
+    is full, the oldest running effect.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the effect pool.
+        
+        Args:
+            capacity: Maximum number of effects running at once
+        """
+        self.capacity = capacity
+        self.active = [False] * capacity
+        self.x = [0] * capacity
+        self.y = [0] * capacity
+        self.start_times = [0.0] * capacity
+        self.durations = [0.0] * capacity
+        self.frames = [None] * capacity
+        self.count = 0
+    
+    def __len__(self) -> int:
+        """Number of running effects."""
+        return self.count
+    
+    def spawn(self, position: Tuple[int, int], frames: List[pygame.Surface], duration: float, now: float):
+        """
+        Start an effect.
+        
+        Args:
+            position: Center of the effect
+            frames: Frames from get_effect_frames
+            duration: Effect length in seconds
+            now: Current time in seconds
+        """
+        slot = -1
+        oldest = 0
+        for i in range(self.capacity):
+            if not self.active[i]:
+                slot = i
+                break
+            if self.start_times[i] < self.start_times[oldest]:
+                oldest = i
+        
+        if slot < 0:
+            # Pool is full; recycle the oldest effect
+            slot = oldest
+        else:
+            self.count += 1
+        
+        self.active[slot] = True
+        self.x[slot] = position[0]
+        self.y[slot] = position[1]
+        self.start_times[slot] = now
+        self.durations[slot] = duration
+        self.frames[slot] = frames
+    
+    def update(self, now: float):
+        """
+        Retire finished effects.
+        
+        Args:
+            now: Current time in seconds
+        """
+        if not self.count:
+            return
+        
+        for i in range(self.capacity):
+            if self.active[i] and now - self.start_times[i] >= self.durations[i]:
+                self.active[i] = False
+                self.frames[i] = None
+                self.count -= 1
+    
+    def draw(self, surface: pygame.Surface, now: float):
+        """
+        Draw the running effects.
+        
+        Args:
+            surface: Pygame surface to draw on
+            now: Current time in seconds
+        """
+        if not self.count:
+            return
+        
+        for i in range(self.capacity):
+            if not self.active[i]:
+                continue
+            
+            progress = (now - self.start_times[i]) / self.durations[i]
+            if progress >= 1.0:
+                continue
+            
+            # Pick the frame for this point in the effect
+            frames = self.frames[i]
+            frame = frames[min(len(frames) - 1, int(max(0.0, progress) * len(frames)))]
+            radius = frame.get_width() // 2
+            surface.blit(frame, (self.x[i] - radius, self.y[i] - radius))
+    
+    def clear(self):
+        """Stop every effect."""
+        for i in range(self.capacity):
+            self.active[i] = False
+            self.frames[i] = None
+        self.count = 0
@@ -10,8 +10,20 @@ import math
 import random
 import time
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, GAME_LIST
+from core.idle import IdleTracker
+from core.background_cache import BackgroundSpec, get_background
+from core.thumbnail_service import get_thumbnail_service
+from core.surface_audit import audited_blit
+from core.render_scaler import get_mouse_pos
+from core.quality_governor import get_quality_governor, QUALITY_LOW, QUALITY_MEDIUM, QUALITY_HIGH
 from shell.enhanced_ui_elements import UITheme, EnhancedButton, EnhancedTextLabel, EnhancedGameCard, MouseController
 
+# Floating particles kept alive at each quality tier
+PARTICLE_COUNTS = {QUALITY_LOW: 15, QUALITY_MEDIUM: 30, QUALITY_HIGH: 50}
+
+# Fixed seed so the cached tech background is the same on every run
+TECH_BACKGROUND_SEED = 1
+
 class EnhancedShellMenu:
     """
     Enhanced main menu interface for the SoulCoreLegacy Arcade.
@@ -84,91 +96,44 @@ class EnhancedShellMenu:
         # Animation properties
         self.animation_time = 0
         
-        # Particle effects
+        # Input batching: mouse events are queued by handle_event and
+        # resolved once per frame in update() with the final cursor state
+        self.pending_events = []
+        self.mouse_pos = get_mouse_pos()
+        self.mouse_pressed = bool(pygame.mouse.get_pressed()[0])
+        
+        # User activity, used to let the menu go idle
+        self.idle_tracker = IdleTracker()
+        
+        # Particle effects, sized by the shared quality tier
         self.particles = []
-        for _ in range(50):
-            self._add_particle()
+        get_quality_governor().subscribe(self.set_quality)
     
     def _create_tech_background(self):
         """
         Create a tech-themed background with grid lines and nodes.
         
+        The background is rendered once per theme and resolution and then
+        loaded from the background cache.
+        
         Returns:
             Pygame surface with the background
         """
-        # Create background surface
-        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        
-        # Fill with gradient
-        for y in range(SCREEN_HEIGHT):
-            # Calculate color for this line
-            progress = y / SCREEN_HEIGHT
-            color_top = self.theme.get_color("background")
-            color_bottom = tuple(max(0, c - 15) for c in color_top)  # Slightly darker
-            
-            color = tuple(
-                int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
-                for i in range(3)
-            )
-            
-            # Draw horizontal line with this color
-            pygame.draw.line(
-                background,
-                color,
-                (0, y),
-                (SCREEN_WIDTH - 1, y)
-            )
-        
-        # Draw grid lines
-        grid_color = (*self.theme.get_color("primary"), 20)  # Very transparent
-        
-        # Horizontal grid lines
-        for y in range(0, SCREEN_HEIGHT, 40):
-            pygame.draw.line(
-                background,
-                grid_color,
-                (0, y),
-                (SCREEN_WIDTH, y)
-            )
-        
-        # Vertical grid lines
-        for x in range(0, SCREEN_WIDTH, 40):
-            pygame.draw.line(
-                background,
-                grid_color,
-                (x, 0),
-                (x, SCREEN_HEIGHT)
-            )
-        
-        # Draw some "nodes" in the grid
-        for _ in range(30):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            radius = random.randint(1, 3)
-            
-            pygame.draw.circle(
-                background,
-                self.theme.get_color("accent"),
-                (x, y),
-                radius
-            )
-        
-        # Draw some "connections" between nodes
-        for _ in range(15):
-            x1 = random.randint(0, SCREEN_WIDTH)
-            y1 = random.randint(0, SCREEN_HEIGHT)
-            x2 = random.randint(max(0, x1 - 200), min(SCREEN_WIDTH, x1 + 200))
-            y2 = random.randint(max(0, y1 - 200), min(SCREEN_HEIGHT, y1 + 200))
-            
-            pygame.draw.line(
-                background,
-                (*self.theme.get_color("secondary"), 40),  # Semi-transparent
-                (x1, y1),
-                (x2, y2),
-                1
-            )
-        
-        return background
+        color_top = self.theme.get_color("background")
+        color_bottom = self.theme.get_shade("background", 15)  # Slightly darker
+        
+        return get_background(BackgroundSpec(
+            'tech',
+            (SCREEN_WIDTH, SCREEN_HEIGHT),
+            (
+                color_top,
+                color_bottom,
+                self.theme.get_alpha("primary", 20),  # Very transparent grid
+                self.theme.get_color("accent"),  # Nodes
+                self.theme.get_alpha("secondary", 40)  # Semi-transparent connections
+            ),
+            seed=TECH_BACKGROUND_SEED
+        ))
     
     def _create_game_cards(self):
         """Create enhanced cards for each available game."""
@@ -216,6 +181,18 @@ class EnhancedShellMenu:
                 lambda game_id=game['id']: self.game_manager.start_game(game_id)
             )
     
+    def set_quality(self, tier):
+        """
+        Apply a visual quality tier.
+        
+        Args:
+            tier: Quality tier from the quality governor
+        """
+        count = PARTICLE_COUNTS[tier]
+        del self.particles[count:]
+        while len(self.particles) < count:
+            self._add_particle()
+    
     def _add_particle(self):
         """Add a floating particle effect."""
         x = random.randint(0, SCREEN_WIDTH)
@@ -246,42 +223,85 @@ class EnhancedShellMenu:
     
     def reset(self):
         """Reset the menu state."""
-        # Nothing to reset for now
-        pass
+        # Drop input queued before the shell was left
+        self.pending_events = []
+        
+        # Returning to the menu counts as activity
+        self.idle_tracker.reset()
     
     def handle_event(self, event):
         """
-        Handle pygame events.
+        Queue pygame events for the next frame.
+        
+        Mouse events are not processed here; update() resolves the whole
+        frame's input at once. Consecutive MOUSEMOTION events are coalesced
+        so that high poll rate mice don't grow the queue.
         
         Args:
             event: The event to handle
         """
-        # Pass events to mouse controller
-        self.mouse.update([event])
+        self.idle_tracker.notify(event)
         
-        # Handle button clicks
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            
-            for card in self.game_cards:
-                card.update(mouse_pos, True)
+        if event.type == pygame.MOUSEMOTION:
+            if self.pending_events and self.pending_events[-1].type == pygame.MOUSEMOTION:
+                # Only the latest position matters between button events
+                self.pending_events[-1] = event
+            else:
+                self.pending_events.append(event)
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            self.pending_events.append(event)
+    
+    def is_animating(self):
+        """
+        Check whether the menu needs to redraw at full frame rate.
         
-        # Handle button releases
-        if event.type == pygame.MOUSEBUTTONUP:
-            mouse_pos = pygame.mouse.get_pos()
-            
-            for card in self.game_cards:
-                card.update(mouse_pos, False)
+        Returns:
+            True while the user is active, an element is animating or thumbnails are loading
+        """
+        # Particles and pulses are ambient; they only hold full rate while the user is active
+        if self.idle_tracker.is_active() or self.pending_events or self.mouse.is_animating():
+            return True
         
-        # Update hover states
-        if event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
-            
+        for element in self.buttons + self.game_cards + self.labels:
+            if element.is_animating():
+                return True
+        
+        return get_thumbnail_service().has_pending()
+    
+    def _process_input(self):
+        """Resolve the mouse controller and card states once for this frame."""
+        events = self.pending_events
+        self.pending_events = []
+        
+        # Derive the final cursor state from the queued events
+        press_pos = None
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                self.mouse_pos = event.pos
+                self.mouse_pressed = bool(event.buttons[0])
+            elif event.button == 1:
+                self.mouse_pos = event.pos
+                self.mouse_pressed = event.type == pygame.MOUSEBUTTONDOWN
+                if self.mouse_pressed:
+                    press_pos = event.pos
+        
+        # Update the mouse controller with the whole batch
+        self.mouse.update(events, self.mouse_pos, (self.mouse_pressed, False, False))
+        
+        # A press and release inside one frame would otherwise be invisible
+        # to the cards, so replay the press before applying the final state
+        if press_pos is not None and not self.mouse_pressed:
             for card in self.game_cards:
-                card.update(mouse_pos, pygame.mouse.get_pressed()[0])
+                card.update(press_pos, True)
+        
+        for card in self.game_cards:
+            card.update(self.mouse_pos, self.mouse_pressed)
     
     def update(self):
         """Update the menu state."""
+        # Resolve this frame's input
+        self._process_input()
+        
         # Update animation time
         self.animation_time += 0.01
         
@@ -325,7 +345,7 @@ class EnhancedShellMenu:
             screen: The surface to render on
         """
         # Draw the background
-        screen.blit(self.background, (0, 0))
+        audited_blit(screen, self.background, (0, 0), "EnhancedShellMenu.background")
         
         # Draw particles
         for particle in self.particles:
@@ -366,21 +386,13 @@ class EnhancedShellMenu:
         header_surface = pygame.Surface((SCREEN_WIDTH, 120), pygame.SRCALPHA)
         
         # Draw gradient
-        for y in range(120):
-            # Calculate color for this line
-            progress = y / 120
-            color_top = self.theme.get_color("primary")
-            color_bottom = self.theme.get_color("background")
-            
-            color = tuple(
-                int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
-                for i in range(3)
-            )
-            
-            # Draw horizontal line with this color
+        color_top = self.theme.get_color("primary")
+        color_bottom = self.theme.get_color("background")
+        for y, color in enumerate(self.theme.get_gradient(color_top, color_bottom, 120, 150)):
+            # Draw horizontal line with this color (semi-transparent)
             pygame.draw.line(
                 header_surface,
-                (*color, 150),  # Semi-transparent
+                color,
                 (0, y),
                 (SCREEN_WIDTH - 1, y)
             )
@@ -405,7 +417,7 @@ class EnhancedShellMenu:
             
             pygame.draw.circle(
                 screen,
-                (*self.theme.get_color("accent"), alpha),
+                self.theme.get_alpha("accent", alpha),
                 (50, 50),
                 radius,
                 2
@@ -419,7 +431,7 @@ class EnhancedShellMenu:
             
             pygame.draw.circle(
                 screen,
-                (*self.theme.get_color("secondary"), alpha),
+                self.theme.get_alpha("secondary", alpha),
                 (SCREEN_WIDTH - 50, 50),
                 radius,
                 2
@@ -10,6 +10,96 @@ import time
 import random
 from typing import Tuple, List, Dict, Callable, Optional, Union
 from enum import Enum
+from collections import deque
+from core.thumbnail_service import get_thumbnail_service, get_thumbnail_path
+from core.quality_governor import get_quality_governor, QUALITY_LOW, QUALITY_MEDIUM, QUALITY_HIGH
+from core.animation import get_animation_scheduler
+from core.surface_audit import audited_blit
+from core.render_scaler import get_mouse_pos
+from shell.effect_pool import EffectPool, get_effect_frames
+
+# Glow outline passes drawn at each quality tier
+BUTTON_GLOW_PASSES = {QUALITY_LOW: 0, QUALITY_MEDIUM: 1, QUALITY_HIGH: 3}
+CARD_GLOW_PASSES = {QUALITY_LOW: 0, QUALITY_MEDIUM: 2, QUALITY_HIGH: 4}
+
+# Effect pool sizes and the number of response times kept for metrics
+RIPPLE_CAPACITY = 4
+CLICK_ANIMATION_CAPACITY = 16
+RESPONSE_TIME_SAMPLES = 100
+
+# Color schemes with vibrant tech-inspired gradients, keyed by theme name
+COLOR_SCHEMES = {
+    "cosmic": {
+        "background": (5, 0, 20),   # Deep space black
+        "primary": (100, 0, 255),   # Deep purple
+        "secondary": (0, 200, 255), # Bright blue
+        "accent": (255, 215, 0),    # Gold
+        "text": (255, 255, 255),    # Pure white
+        "text_secondary": (180, 180, 255), # Light purple
+        "hover": (150, 50, 255),    # Brighter purple
+        "active": (180, 80, 255),   # Even brighter purple
+        "disabled": (40, 20, 60),   # Muted purple
+        "success": (0, 255, 150),   # Neon green
+        "warning": (255, 200, 0),   # Gold
+        "error": (255, 0, 100)      # Hot pink
+    },
+    "network": {
+        "background": (0, 10, 25),  # Deep blue-black
+        "primary": (0, 150, 255),   # Bright blue
+        "secondary": (100, 0, 255), # Deep purple
+        "accent": (0, 255, 200),    # Neon teal
+        "text": (220, 240, 255),    # Light blue-white
+        "text_secondary": (150, 200, 255), # Light blue
+        "hover": (50, 180, 255),    # Brighter blue
+        "active": (100, 200, 255),  # Even brighter blue
+        "disabled": (30, 60, 80),   # Muted blue
+        "success": (0, 255, 150),   # Neon green
+        "warning": (255, 200, 0),   # Gold
+        "error": (255, 50, 100)     # Hot pink
+    },
+    "quantum": {
+        "background": (5, 0, 15),   # Near-black
+        "primary": (140, 0, 255),   # Deep purple
+        "secondary": (0, 200, 255), # Bright blue
+        "accent": (255, 0, 150),    # Hot pink
+        "text": (255, 255, 255),    # Pure white
+        "text_secondary": (200, 180, 255), # Light purple
+        "hover": (180, 50, 255),    # Brighter purple
+        "active": (200, 100, 255),  # Even brighter purple
+        "disabled": (50, 30, 70),   # Muted purple
+        "success": (0, 255, 170),   # Neon teal
+        "warning": (255, 215, 0),   # Gold
+        "error": (255, 0, 100)      # Hot pink
+    },
+    "synthwave": {
+        "background": (20, 0, 40),  # Deep purple
+        "primary": (255, 0, 150),   # Hot pink
+        "secondary": (0, 200, 255), # Bright blue
+        "accent": (255, 215, 0),    # Gold
+        "text": (255, 255, 255),    # Pure white
+        "text_secondary": (200, 200, 255), # Light purple
+        "hover": (255, 50, 180),    # Brighter pink
+        "active": (255, 100, 200),  # Even brighter pink
+        "disabled": (80, 30, 80),   # Muted purple-pink
+        "success": (0, 255, 170),   # Neon teal
+        "warning": (255, 215, 0),   # Gold
+        "error": (255, 50, 50)      # Bright red
+    },
+    "default": {
+        "background": (10, 5, 30),  # Deep space black with hint of purple
+        "primary": (80, 70, 220),   # Rich purple
+        "secondary": (0, 180, 255), # Bright cyan
+        "accent": (255, 215, 0),    # Gold
+        "text": (255, 255, 255),    # Pure white
+        "text_secondary": (200, 200, 255), # Light purple
+        "hover": (120, 90, 255),    # Brighter purple
+        "active": (140, 110, 255),  # Even brighter purple
+        "disabled": (50, 50, 80),   # Muted purple
+        "success": (0, 255, 170),   # Neon teal
+        "warning": (255, 215, 0),   # Gold
+        "error": (255, 50, 120)     # Hot pink
+    }
+}
 
 class MouseState(Enum):
     """Enum representing different mouse states for visual feedback."""
@@ -26,6 +116,81 @@ class FeedbackType(Enum):
     HAPTIC = 2
     ANIMATION = 3
 
+# Font sizes shared by every theme, keyed by size name
+THEME_FONT_SIZES = {
+    "small": 18,
+    "medium": 24,
+    "large": 32,
+    "title": 48,
+    "header": 36
+}
+
+# Darkening and lightening amounts precomputed for every theme color
+THEME_SHADE_STEPS = (15, 20, 30, 40, 50)
+THEME_TINT_STEPS = (20, 30)
+
+class ThemePalette:
+    """
+    Compiled colors of one theme: the base colors, their shades and tints,
+    every alpha variant, and gradient tables built on first use.
+    Palettes are compiled once per theme and shared by all UITheme instances.
+    """
+    
+    def __init__(self, colors: Dict[str, Tuple[int, int, int]], fonts: Dict[str, pygame.font.Font]):
+        """
+        Compile a palette.
+        
+        Args:
+            colors: Base colors keyed by color name
+            fonts: Shared font handles keyed by size name
+        """
+        self.colors = colors
+        self.fonts = fonts
+        
+        # Darker and lighter variants keyed by (color name, amount)
+        self.shades = {
+            (name, amount): tuple(max(0, c - amount) for c in color)
+            for name, color in colors.items() for amount in THEME_SHADE_STEPS
+        }
+        self.tints = {
+            (name, amount): tuple(min(255, c + amount) for c in color)
+            for name, color in colors.items() for amount in THEME_TINT_STEPS
+        }
+        
+        # RGBA variants of each color indexed by alpha
+        self.alphas = {
+            name: [(*color, alpha) for alpha in range(256)]
+            for name, color in colors.items()
+        }
+        
+        # Gradient row colors keyed by (top, bottom, rows, alpha)
+        self.gradients = {}
+
+# Compiled palettes keyed by theme name, and the font handles they share
+_theme_palettes = {}
+_theme_fonts = None
+
+def compile_theme(name: str) -> ThemePalette:
+    """
+    Get the compiled palette of a theme, compiling it on first use.
+    
+    Args:
+        name: Theme name; unknown names use the cosmic scheme
+    
+    Returns:
+        The shared palette
+    """
+    global _theme_fonts
+    if name not in COLOR_SCHEMES:
+        name = "cosmic"
+    
+    palette = _theme_palettes.get(name)
+    if palette is None:
+        if _theme_fonts is None:
+            _theme_fonts = {size: pygame.font.SysFont(None, points) for size, points in THEME_FONT_SIZES.items()}
+        palette = _theme_palettes[name] = ThemePalette(COLOR_SCHEMES[name], _theme_fonts)
+    return palette
+
 class UITheme:
     """
     Theme manager for UI elements to ensure consistent styling.
@@ -41,91 +206,10 @@ class UITheme:
         """
         self.name = name
         
-        # Define color schemes with vibrant tech-inspired gradients
-        self.color_schemes = {
-            "cosmic": {
-                "background": (5, 0, 20),   # Deep space black
-                "primary": (100, 0, 255),   # Deep purple
-                "secondary": (0, 200, 255), # Bright blue
-                "accent": (255, 215, 0),    # Gold
-                "text": (255, 255, 255),    # Pure white
-                "text_secondary": (180, 180, 255), # Light purple
-                "hover": (150, 50, 255),    # Brighter purple
-                "active": (180, 80, 255),   # Even brighter purple
-                "disabled": (40, 20, 60),   # Muted purple
-                "success": (0, 255, 150),   # Neon green
-                "warning": (255, 200, 0),   # Gold
-                "error": (255, 0, 100)      # Hot pink
-            },
-            "network": {
-                "background": (0, 10, 25),  # Deep blue-black
-                "primary": (0, 150, 255),   # Bright blue
-                "secondary": (100, 0, 255), # Deep purple
-                "accent": (0, 255, 200),    # Neon teal
-                "text": (220, 240, 255),    # Light blue-white
-                "text_secondary": (150, 200, 255), # Light blue
-                "hover": (50, 180, 255),    # Brighter blue
-                "active": (100, 200, 255),  # Even brighter blue
-                "disabled": (30, 60, 80),   # Muted blue
-                "success": (0, 255, 150),   # Neon green
-                "warning": (255, 200, 0),   # Gold
-                "error": (255, 50, 100)     # Hot pink
-            },
-            "quantum": {
-                "background": (5, 0, 15),   # Near-black
-                "primary": (140, 0, 255),   # Deep purple
-                "secondary": (0, 200, 255), # Bright blue
-                "accent": (255, 0, 150),    # Hot pink
-                "text": (255, 255, 255),    # Pure white
-                "text_secondary": (200, 180, 255), # Light purple
-                "hover": (180, 50, 255),    # Brighter purple
-                "active": (200, 100, 255),  # Even brighter purple
-                "disabled": (50, 30, 70),   # Muted purple
-                "success": (0, 255, 170),   # Neon teal
-                "warning": (255, 215, 0),   # Gold
-                "error": (255, 0, 100)      # Hot pink
-            },
-            "synthwave": {
-                "background": (20, 0, 40),  # Deep purple
-                "primary": (255, 0, 150),   # Hot pink
-                "secondary": (0, 200, 255), # Bright blue
-                "accent": (255, 215, 0),    # Gold
-                "text": (255, 255, 255),    # Pure white
-                "text_secondary": (200, 200, 255), # Light purple
-                "hover": (255, 50, 180),    # Brighter pink
-                "active": (255, 100, 200),  # Even brighter pink
-                "disabled": (80, 30, 80),   # Muted purple-pink
-                "success": (0, 255, 170),   # Neon teal
-                "warning": (255, 215, 0),   # Gold
-                "error": (255, 50, 50)      # Bright red
-            },
-            "default": {
-                "background": (10, 5, 30),  # Deep space black with hint of purple
-                "primary": (80, 70, 220),   # Rich purple
-                "secondary": (0, 180, 255), # Bright cyan
-                "accent": (255, 215, 0),    # Gold
-                "text": (255, 255, 255),    # Pure white
-                "text_secondary": (200, 200, 255), # Light purple
-                "hover": (120, 90, 255),    # Brighter purple
-                "active": (140, 110, 255),  # Even brighter purple
-                "disabled": (50, 50, 80),   # Muted purple
-                "success": (0, 255, 170),   # Neon teal
-                "warning": (255, 215, 0),   # Gold
-                "error": (255, 50, 120)     # Hot pink
-            }
-        }
+        self.color_schemes = COLOR_SCHEMES
         
-        # Set the current color scheme
-        self.colors = self.color_schemes[name] if name in self.color_schemes else self.color_schemes["cosmic"]
-        
-        # Define fonts
-        self.fonts = {
-            "small": pygame.font.SysFont(None, 18),
-            "medium": pygame.font.SysFont(None, 24),
-            "large": pygame.font.SysFont(None, 32),
-            "title": pygame.font.SysFont(None, 48),
-            "header": pygame.font.SysFont(None, 36)
-        }
+        # Use the shared compiled palette and fonts of the scheme
+        self._use_palette(compile_theme(name))
         
         # Define spacing
         self.spacing = {
@@ -158,12 +242,26 @@ class UITheme:
         """
         Change the current theme.
         
+        Palettes are compiled once per theme, so switching back to a theme
+        that has been used before only swaps references.
+        
         Args:
             name: Theme name
         """
         if name in self.color_schemes:
             self.name = name
-            self.colors = self.color_schemes[name]
+            self._use_palette(compile_theme(name))
+    
+    def _use_palette(self, palette: ThemePalette):
+        """
+        Point the theme at a compiled palette.
+        
+        Args:
+            palette: The compiled palette
+        """
+        self.palette = palette
+        self.colors = palette.colors
+        self.fonts = palette.fonts
     
     def get_color(self, name: str) -> Tuple[int, int, int]:
         """
@@ -177,6 +275,83 @@ class UITheme:
         """
         return self.colors.get(name, self.colors["primary"])
     
+    def get_shade(self, name: str, amount: int) -> Tuple[int, int, int]:
+        """
+        Get a color from the current theme darkened by an amount.
+        
+        Args:
+            name: Color name
+            amount: Amount subtracted from each channel
+            
+        Returns:
+            RGB color tuple
+        """
+        shade = self.palette.shades.get((name, amount))
+        if shade is None:
+            shade = tuple(max(0, c - amount) for c in self.get_color(name))
+            self.palette.shades[(name, amount)] = shade
+        return shade
+    
+    def get_tint(self, name: str, amount: int) -> Tuple[int, int, int]:
+        """
+        Get a color from the current theme lightened by an amount.
+        
+        Args:
+            name: Color name
+            amount: Amount added to each channel
+            
+        Returns:
+            RGB color tuple
+        """
+        tint = self.palette.tints.get((name, amount))
+        if tint is None:
+            tint = tuple(min(255, c + amount) for c in self.get_color(name))
+            self.palette.tints[(name, amount)] = tint
+        return tint
+    
+    def get_alpha(self, name: str, alpha: int) -> Tuple[int, int, int, int]:
+        """
+        Get a color from the current theme with an alpha channel.
+        
+        Args:
+            name: Color name
+            alpha: Alpha value between 0 and 255
+            
+        Returns:
+            RGBA color tuple
+        """
+        alphas = self.palette.alphas.get(name, self.palette.alphas["primary"])
+        return alphas[alpha]
+    
+    def get_gradient(self, color_top: Tuple[int, int, int], color_bottom: Tuple[int, int, int],
+                     rows: int, alpha: Optional[int] = None) -> List[Tuple[int, ...]]:
+        """
+        Get the row colors of a vertical gradient.
+        
+        Args:
+            color_top: RGB color of the first row
+            color_bottom: RGB color the gradient runs towards
+            rows: Number of rows
+            alpha: Optional alpha added to every row
+            
+        Returns:
+            List of one color per row
+        """
+        key = (color_top, color_bottom, rows, alpha)
+        gradient = self.palette.gradients.get(key)
+        if gradient is None:
+            gradient = []
+            for y in range(rows):
+                # Calculate color for this line
+                progress = y / rows
+                color = tuple(
+                    int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
+                    for i in range(3)
+                )
+                gradient.append(color if alpha is None else (*color, alpha))
+            self.palette.gradients[key] = gradient
+        return gradient
+    
     def get_font(self, size: str) -> pygame.font.Font:
         """
         Get a font from the current theme.
@@ -256,16 +431,21 @@ class EnhancedButton:
         self.pressed = False
         self.focused = False
         
-        # Animation properties
+        # Animation properties, advanced by the shared animation scheduler
+        self.scheduler = get_animation_scheduler()
         self.animation_progress = 0.0
-        self.animation_start_time = 0
         self.animation_duration = theme.get_animation_duration("medium")
         self.animation_target = 0.0
         
         # Visual effects
         self.glow_effect = importance == "high"  # Apply glow effect to high importance buttons
         self.pulse_effect = False
-        self.ripple_effects = []
+        self.ripple_effects = EffectPool(RIPPLE_CAPACITY)
+        
+        # Effect detail follows the shared quality tier
+        self.glow_passes = BUTTON_GLOW_PASSES[QUALITY_HIGH]
+        self.ripples_enabled = True
+        get_quality_governor().subscribe(self.set_quality)
         
         # Accessibility
         self.keyboard_shortcut = None
@@ -375,59 +555,39 @@ class EnhancedButton:
             # Draw shadow
             surface.blit(shadow_surface, shadow_rect)
         
-        # Draw ripple effects
-        for ripple in self.ripple_effects:
-            # Create ripple surface with alpha
-            ripple_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-            
-            # Calculate ripple properties
-            progress = (time.time() - ripple["start_time"]) / ripple["duration"]
-            radius = int(ripple["max_radius"] * progress)
-            alpha = int(255 * (1 - progress))
-            
-            # Draw ripple circle
-            pygame.draw.circle(
-                ripple_surface,
-                (*self.theme.get_color("text"), alpha),  # RGBA
-                (ripple["pos"][0] - self.rect.x, ripple["pos"][1] - self.rect.y),
-                radius
-            )
-            
-            # Draw ripple
-            surface.blit(ripple_surface, self.rect)
+        # Draw ripple effects, clipped to the button
+        if self.ripple_effects:
+            previous_clip = surface.get_clip()
+            surface.set_clip(self.rect.clip(previous_clip))
+            self.ripple_effects.draw(surface, self.scheduler.now)
+            surface.set_clip(previous_clip)
         
         # Create gradient background
         gradient_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
         
         # Get gradient colors
         if self.disabled:
-            color_top = self.theme.get_color("disabled")
-            color_bottom = tuple(max(0, c - 20) for c in color_top)
+            top_name = "disabled"
+            color_bottom = self.theme.get_shade(top_name, 20)
         else:
             if self.pressed:
-                color_top = self.theme.get_color("active")
-                color_bottom = tuple(max(0, c - 30) for c in color_top)
+                top_name = "active"
+                color_bottom = self.theme.get_shade(top_name, 30)
             elif self.hovered:
-                color_top = self.theme.get_color("hover")
-                color_bottom = tuple(min(255, c + 20) for c in color_top)
+                top_name = "hover"
+                color_bottom = self.theme.get_tint(top_name, 20)
             else:
-                color_top = self.theme.get_color("primary")
-                color_bottom = tuple(max(0, c - 40) for c in color_top)
+                top_name = "primary"
+                color_bottom = self.theme.get_shade(top_name, 40)
             
             # Apply Von Restorff Effect for high importance buttons
             if self.importance == "high" and not self.pressed:
-                color_top = self.theme.get_color("accent")
-                color_bottom = tuple(max(0, c - 40) for c in color_top)
+                top_name = "accent"
+                color_bottom = self.theme.get_shade(top_name, 40)
+        color_top = self.theme.get_color(top_name)
         
         # Draw vertical gradient
-        for y in range(self.rect.height):
-            # Calculate color for this line
-            progress = y / self.rect.height
-            color = tuple(
-                int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
-                for i in range(3)
-            )
-            
+        for y, color in enumerate(self.theme.get_gradient(color_top, color_bottom, self.rect.height)):
             # Draw horizontal line with this color
             pygame.draw.line(
                 gradient_surface,
@@ -450,27 +610,24 @@ class EnhancedButton:
         # Add subtle inner border
         pygame.draw.rect(
             surface,
-            (*color_top, 150),  # Semi-transparent
+            self.theme.get_alpha(top_name, 150),  # Semi-transparent
             self.rect,
             border_radius=self.theme.border_radius,
             width=1
         )
         
         # Draw glow effect for high importance buttons
-        if self.glow_effect and not self.disabled:
+        if self.glow_effect and self.glow_passes and not self.disabled:
             glow_rect = self.rect.inflate(6, 6)
             
             # Create glow surface with alpha
             glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
             
-            # Get glow color
-            glow_color = self.theme.get_color("accent")
-            
             # Draw multiple rects with decreasing alpha for glow effect
-            for i in range(3):
+            for i in range(self.glow_passes):
                 pygame.draw.rect(
                     glow_surface,
-                    (*glow_color, 100 - i * 30),  # Decreasing alpha
+                    self.theme.get_alpha("accent", 100 - i * 30),  # Decreasing alpha
                     pygame.Rect(i, i, glow_rect.width - i * 2, glow_rect.height - i * 2),
                     border_radius=self.theme.border_radius + 3,
                     width=2
@@ -501,6 +658,15 @@ class EnhancedButton:
             
             surface.blit(self.icon, icon_rect)
     
+    def is_animating(self) -> bool:
+        """
+        Check whether the button has animations in progress.
+        
+        Returns:
+            True if the hover/press animation or a ripple is still running
+        """
+        return self.animation_progress != self.animation_target or bool(self.ripple_effects)
+    
     def _start_animation(self, target: float):
         """
         Start a new animation.
@@ -508,30 +674,14 @@ class EnhancedButton:
         Args:
             target: Target animation value
         """
-        self.animation_start_time = time.time()
         self.animation_target = target
+        self.scheduler.tween(self, "animation_progress", target, self.animation_duration)
     
     def _update_animations(self):
         """Update all animations."""
-        current_time = time.time()
-        
-        # Update main animation
-        elapsed = current_time - self.animation_start_time
-        progress = min(1.0, elapsed / self.animation_duration)
-        
-        # Smooth easing function
-        eased_progress = progress * (2 - progress)
-        
-        # Update animation progress
-        start_value = self.animation_progress
-        target_value = self.animation_target
-        self.animation_progress = start_value + (target_value - start_value) * eased_progress
-        
-        # Update ripple effects
-        for i in range(len(self.ripple_effects) - 1, -1, -1):
-            ripple = self.ripple_effects[i]
-            if current_time - ripple["start_time"] >= ripple["duration"]:
-                self.ripple_effects.pop(i)
+        # Retire finished ripple effects
+        if self.ripple_effects:
+            self.ripple_effects.update(self.scheduler.now)
     
     def _add_ripple_effect(self, pos: Tuple[int, int]):
         """
@@ -540,12 +690,23 @@ class EnhancedButton:
         Args:
             pos: Position for the ripple effect
         """
-        self.ripple_effects.append({
-            "pos": pos,
-            "start_time": time.time(),
-            "duration": self.theme.get_animation_duration("slow"),
-            "max_radius": max(self.rect.width, self.rect.height)
-        })
+        if not self.ripples_enabled:
+            return
+        
+        frames = get_effect_frames(max(self.rect.width, self.rect.height), self.theme.get_color("text"))
+        self.ripple_effects.spawn(pos, frames, self.theme.get_animation_duration("slow"), self.scheduler.now)
+    
+    def set_quality(self, tier: int):
+        """
+        Apply a visual quality tier.
+        
+        Args:
+            tier: Quality tier from the quality governor
+        """
+        self.glow_passes = BUTTON_GLOW_PASSES[tier]
+        self.ripples_enabled = tier > QUALITY_LOW
+        if not self.ripples_enabled:
+            self.ripple_effects.clear()
 class EnhancedTextLabel:
     """
     Enhanced text label with animations and effects.
@@ -589,9 +750,16 @@ class EnhancedTextLabel:
         # Animation properties
         self.visible = not animate_in  # Start invisible if animating in
         self.animation_progress = 0.0 if animate_in else 1.0
-        self.animation_start_time = time.time() if animate_in else 0
         self.animation_duration = theme.get_animation_duration("medium")
         
+        # The shared animation scheduler runs the fade-in
+        if animate_in:
+            get_animation_scheduler().tween(self, "animation_progress", 1.0, self.animation_duration)
+        
+        # Word widths measured with the current font, reused when rewrapping
+        self.word_widths = {}
+        self.word_width_font = None
+        
         # Split text into lines if multiline
         self.lines = []
         if multiline:
@@ -600,6 +768,21 @@ class EnhancedTextLabel:
         # Apply Von Restorff Effect for high importance labels
         self.highlight = importance == "high"
         self.glow_effect = importance == "high"
+        
+        # Composed label surface, rebuilt when the text, theme or size changes
+        self.cached_surface = None
+        self.cached_offset = (0, 0)
+        self.cached_alpha = 255
+        self.cache_key = None
+    
+    def is_animating(self) -> bool:
+        """
+        Check whether the label is still fading in.
+        
+        Returns:
+            True if the fade-in has not finished
+        """
+        return self.animation_progress < 1.0
     
     def set_text(self, text: str):
         """
@@ -612,20 +795,12 @@ class EnhancedTextLabel:
             self.text = text
             if self.multiline:
                 self._wrap_text()
+            self.cached_surface = None
     
     def update(self):
         """Update label animations."""
-        if not self.visible and self.animation_progress < 1.0:
-            # Update animation progress
-            elapsed = time.time() - self.animation_start_time
-            progress = min(1.0, elapsed / self.animation_duration)
-            
-            # Smooth easing function
-            eased_progress = progress * (2 - progress)
-            
-            self.animation_progress = eased_progress
-            
-            # Make visible once animation starts
+        # Make visible once animation starts
+        if not self.visible:
             self.visible = True
     
     def draw(self, surface: pygame.Surface):
@@ -638,113 +813,117 @@ class EnhancedTextLabel:
         if not self.visible:
             return
         
+        # Rebuild the composed label only when its inputs change
+        cache_key = (self.text, self.theme.name, self.theme.get_font(self.font_size), self.rect.size, self.max_width)
+        if self.cached_surface is None or cache_key != self.cache_key:
+            self._render()
+            self.cache_key = cache_key
+        
+        # Apply animation
+        alpha = int(255 * self.animation_progress)
+        if alpha != self.cached_alpha:
+            self.cached_surface.set_alpha(alpha if alpha < 255 else None)
+            self.cached_alpha = alpha
+        
+        audited_blit(surface, self.cached_surface, (self.rect.x + self.cached_offset[0], self.rect.y + self.cached_offset[1]), "EnhancedTextLabel")
+    
+    def _render(self):
+        """Compose the highlight, glow and text into one cached surface."""
         # Get font and color
         font = self.theme.get_font(self.font_size)
         color = self.theme.get_color(self.color_name)
         
-        # Apply Von Restorff Effect for high importance labels
+        # Use contrasting text color on the highlight background
         if self.highlight:
-            # Draw highlight background
-            highlight_rect = self.rect.inflate(10, 4)
-            pygame.draw.rect(
-                surface,
-                self.theme.get_color("accent"),
-                highlight_rect,
-                border_radius=self.theme.border_radius
-            )
-            
-            # Use contrasting text color
             color = self.theme.get_color("text")
         
-        # Apply glow effect
-        if self.glow_effect:
-            glow_color = (*self.theme.get_color("accent"), 100)  # Semi-transparent
-            glow_font = self.theme.get_font(self.font_size)
-            
-            # Draw glow (simplified)
-            for offset_x, offset_y in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
-                if self.multiline:
-                    y_offset = 0
-                    for line in self.lines:
-                        text_surf = glow_font.render(line, True, glow_color)
-                        
-                        if self.align == "center":
-                            text_rect = text_surf.get_rect(midtop=(self.rect.centerx + offset_x, self.rect.y + y_offset + offset_y))
-                        elif self.align == "right":
-                            text_rect = text_surf.get_rect(topright=(self.rect.right + offset_x, self.rect.y + y_offset + offset_y))
-                        else:  # left
-                            text_rect = text_surf.get_rect(topleft=(self.rect.x + offset_x, self.rect.y + y_offset + offset_y))
-                        
-                        surface.blit(text_surf, text_rect)
-                        y_offset += font.get_linesize()
-                else:
-                    text_surf = glow_font.render(self.text, True, glow_color)
-                    
-                    if self.align == "center":
-                        text_rect = text_surf.get_rect(center=(self.rect.centerx + offset_x, self.rect.centery + offset_y))
-                    elif self.align == "right":
-                        text_rect = text_surf.get_rect(midright=(self.rect.right + offset_x, self.rect.centery + offset_y))
-                    else:  # left
-                        text_rect = text_surf.get_rect(midleft=(self.rect.x + offset_x, self.rect.centery + offset_y))
-                    
-                    surface.blit(text_surf, text_rect)
-        
-        # Apply animation
-        alpha = int(255 * self.animation_progress)
+        # Theme changes swap the font, so wrap again with the new metrics
+        if font is not self.word_width_font:
+            self.word_widths = {}
+            self.word_width_font = font
+            if self.multiline:
+                self._wrap_text()
         
-        # Draw text
+        # Render each line once and lay it out relative to the label's top-left corner
+        local_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        text_surfs = []
         if self.multiline:
             y_offset = 0
             for line in self.lines:
                 text_surf = font.render(line, True, color)
-                
-                # Apply animation
-                if self.animation_progress < 1.0:
-                    # Create a surface with alpha
-                    alpha_surf = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
-                    alpha_surf.fill((255, 255, 255, alpha))
-                    text_surf.blit(alpha_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                
                 if self.align == "center":
-                    text_rect = text_surf.get_rect(midtop=(self.rect.centerx, self.rect.y + y_offset))
+                    text_rect = text_surf.get_rect(midtop=(local_rect.centerx, y_offset))
                 elif self.align == "right":
-                    text_rect = text_surf.get_rect(topright=(self.rect.right, self.rect.y + y_offset))
+                    text_rect = text_surf.get_rect(topright=(local_rect.right, y_offset))
                 else:  # left
-                    text_rect = text_surf.get_rect(topleft=(self.rect.x, self.rect.y + y_offset))
-                
-                surface.blit(text_surf, text_rect)
+                    text_rect = text_surf.get_rect(topleft=(0, y_offset))
+                text_surfs.append((line, text_surf, text_rect))
                 y_offset += font.get_linesize()
         else:
             text_surf = font.render(self.text, True, color)
-            
-            # Apply animation
-            if self.animation_progress < 1.0:
-                # Create a surface with alpha
-                alpha_surf = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
-                alpha_surf.fill((255, 255, 255, alpha))
-                text_surf.blit(alpha_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            
             if self.align == "center":
-                text_rect = text_surf.get_rect(center=self.rect.center)
+                text_rect = text_surf.get_rect(center=local_rect.center)
             elif self.align == "right":
-                text_rect = text_surf.get_rect(midright=(self.rect.right, self.rect.centery))
+                text_rect = text_surf.get_rect(midright=(local_rect.right, local_rect.centery))
             else:  # left
-                text_rect = text_surf.get_rect(midleft=(self.rect.x, self.rect.centery))
-            
-            surface.blit(text_surf, text_rect)
+                text_rect = text_surf.get_rect(midleft=(0, local_rect.centery))
+            text_surfs.append((self.text, text_surf, text_rect))
+        
+        # Size the cache to cover the highlight, glow offsets and any overflowing text
+        highlight_rect = local_rect.inflate(10, 4)
+        bounds = highlight_rect if self.highlight else local_rect.copy()
+        for _, _, text_rect in text_surfs:
+            bounds.union_ip(text_rect.inflate(2, 2) if self.glow_effect else text_rect)
+        
+        # Transparent pixels carry the text color so antialiased edges keep their tint when composed
+        composed = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        composed.fill((*color, 0))
+        origin_x, origin_y = -bounds.x, -bounds.y
+        
+        # Apply Von Restorff Effect for high importance labels
+        if self.highlight:
+            # Draw highlight background
+            pygame.draw.rect(
+                composed,
+                self.theme.get_color("accent"),
+                highlight_rect.move(origin_x, origin_y),
+                border_radius=self.theme.border_radius
+            )
+        
+        # Apply glow effect
+        if self.glow_effect:
+            glow_color = self.theme.get_alpha("accent", 100)  # Semi-transparent
+            for line, _, text_rect in text_surfs:
+                glow_surf = font.render(line, True, glow_color)
+                for offset_x, offset_y in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
+                    composed.blit(glow_surf, text_rect.move(origin_x + offset_x, origin_y + offset_y))
+        
+        # Draw text
+        for _, text_surf, text_rect in text_surfs:
+            composed.blit(text_surf, text_rect.move(origin_x, origin_y))
+        
+        self.cached_surface = composed
+        self.cached_offset = (bounds.x, bounds.y)
+        self.cached_alpha = 255
     
     def _wrap_text(self):
         """Wrap text to fit within max_width."""
         self.lines = []
         font = self.theme.get_font(self.font_size)
+        if font is not self.word_width_font:
+            self.word_widths = {}
+            self.word_width_font = font
         
         words = self.text.split(' ')
         current_line = []
         current_width = 0
         
         for word in words:
-            word_surface = font.render(word + ' ', True, (0, 0, 0))
-            word_width = word_surface.get_width()
+            # Measure with font.size and remember the width for later wraps
+            word_width = self.word_widths.get(word)
+            if word_width is None:
+                word_width = font.size(word + ' ')[0]
+                self.word_widths[word] = word_width
             
             if current_width + word_width > self.max_width:
                 # Line is full, start a new one
@@ -759,6 +938,7 @@ class EnhancedTextLabel:
         # Add the last line
         if current_line:
             self.lines.append(' '.join(current_line))
+
 class EnhancedGameCard:
     """
     Enhanced game card for game selection screens.
@@ -806,9 +986,9 @@ class EnhancedGameCard:
         self.hovered = False
         self.pressed = False
         
-        # Animation properties
+        # Animation properties, advanced by the shared animation scheduler
+        self.scheduler = get_animation_scheduler()
         self.animation_progress = 0.0
-        self.animation_start_time = 0
         self.animation_duration = theme.get_animation_duration("medium")
         self.animation_target = 0.0
         
@@ -817,15 +997,16 @@ class EnhancedGameCard:
         self.pulse_effect = self.new_release  # Apply pulse effect to new releases
         self.pulse_time = 0
         
+        # Glow detail follows the shared quality tier
+        self.glow_passes = CARD_GLOW_PASSES[QUALITY_HIGH]
+        get_quality_governor().subscribe(self.set_quality)
+        
         # Apply Von Restorff Effect based on importance
         self.importance = "high" if featured else "normal"
         if featured:
             # Make featured games slightly larger
             self.rect.inflate_ip(20, 20)
         
-        # Load the thumbnail
-        self.thumbnail = self._load_thumbnail()
-        
         # Thumbnail properties
         self.thumbnail_rect = pygame.Rect(
             self.rect.x + theme.get_spacing("medium"),
@@ -834,67 +1015,28 @@ class EnhancedGameCard:
             self.rect.height * 0.6
         )
         
-        # Scale thumbnail to fit
-        if self.thumbnail:
-            self.scaled_thumbnail = pygame.transform.scale(
-                self.thumbnail, 
-                (self.thumbnail_rect.width, self.thumbnail_rect.height)
-            )
+        # Load the thumbnail (already scaled to fit by the thumbnail service)
+        self.thumbnail = None
+        self.scaled_thumbnail = None
+        self._load_thumbnail()
     
-    def _load_thumbnail(self) -> pygame.Surface:
+    def _load_thumbnail(self):
         """
-        Load the thumbnail image.
+        Fetch the thumbnail from the shared thumbnail service.
         
-        Returns:
-            Pygame surface with the thumbnail
+        The service hands out a shared placeholder until the image has
+        loaded, so the faded copy drawn by this card is only rebuilt when
+        the service returns a different surface.
         """
-        try:
-            import os
-            
-            # Try to load the thumbnail
-            thumbnail_path = os.path.join("games", self.game_info["id"], "assets", "thumbnail.png")
-            if os.path.exists(thumbnail_path):
-                return pygame.image.load(thumbnail_path)
-            else:
-                # Create a placeholder thumbnail with tech pattern
-                thumbnail = pygame.Surface((160, 120))
-                thumbnail.fill(self.theme.get_color("background"))
-                
-                # Add tech grid pattern
-                grid_color = (*self.theme.get_color("primary"), 50)  # Semi-transparent
-                for y in range(0, 120, 10):
-                    pygame.draw.line(thumbnail, grid_color, (0, y), (160, y), 1)
-                for x in range(0, 160, 10):
-                    pygame.draw.line(thumbnail, grid_color, (x, 0), (x, 120), 1)
-                
-                # Add some "nodes" in the grid
-                for _ in range(8):
-                    x = random.randint(5, 155)
-                    y = random.randint(5, 115)
-                    radius = random.randint(2, 4)
-                    pygame.draw.circle(thumbnail, self.theme.get_color("accent"), (x, y), radius)
-                
-                # Add some "connections" between nodes
-                for _ in range(5):
-                    x1 = random.randint(5, 155)
-                    y1 = random.randint(5, 115)
-                    x2 = random.randint(5, 155)
-                    y2 = random.randint(5, 115)
-                    pygame.draw.line(thumbnail, self.theme.get_color("secondary"), (x1, y1), (x2, y2), 1)
-                
-                # Add the game name
-                font = pygame.font.SysFont("Arial", 18)
-                text = font.render(self.game_info["name"], True, self.theme.get_color("text"))
-                text_rect = text.get_rect(center=(80, 60))
-                thumbnail.blit(text, text_rect)
-                
-                return thumbnail
-        except Exception as e:
-            print(f"Error loading thumbnail for {self.game_info['name']}: {e}")
-            # Create a simple placeholder thumbnail
-            thumbnail = pygame.Surface((160, 120))
-            thumbnail.fill(self.theme.get_color("primary"))
-            return thumbnail
+        game_id = self.game_info["id"]
+        thumbnail = get_thumbnail_service().get(
+            game_id, get_thumbnail_path(game_id), self.thumbnail_rect.size
+        )
+        
+        if thumbnail is not self.thumbnail:
+            self.thumbnail = thumbnail
+            self.scaled_thumbnail = thumbnail.copy()
+            self.scaled_thumbnail.set_alpha(220)  # Slight transparency
     
     def update(self, mouse_pos: Tuple[int, int], mouse_pressed: bool, 
               mouse_controller = None) -> bool:
@@ -992,29 +1134,23 @@ class EnhancedGameCard:
         
         # Get gradient colors
         if self.pressed:
-            color_top = self.theme.get_color("active")
-            color_bottom = tuple(max(0, c - 30) for c in color_top)
+            top_name = "active"
+            color_bottom = self.theme.get_shade(top_name, 30)
         elif self.hovered:
-            color_top = self.theme.get_color("hover")
-            color_bottom = tuple(max(0, c - 40) for c in color_top)
+            top_name = "hover"
+            color_bottom = self.theme.get_shade(top_name, 40)
         else:
-            color_top = self.theme.get_color("primary")
-            color_bottom = tuple(max(0, c - 50) for c in color_top)
+            top_name = "primary"
+            color_bottom = self.theme.get_shade(top_name, 50)
         
         # Apply Von Restorff Effect for featured games
         if self.featured and not self.pressed:
-            color_top = self.theme.get_color("accent")
-            color_bottom = tuple(max(0, c - 50) for c in color_top)
+            top_name = "accent"
+            color_bottom = self.theme.get_shade(top_name, 50)
+        color_top = self.theme.get_color(top_name)
         
         # Draw vertical gradient
-        for y in range(self.rect.height):
-            # Calculate color for this line
-            progress = y / self.rect.height
-            color = tuple(
-                int(color_top[i] * (1 - progress) + color_bottom[i] * progress)
-                for i in range(3)
-            )
-            
+        for y, color in enumerate(self.theme.get_gradient(color_top, color_bottom, self.rect.height)):
             # Draw horizontal line with this color
             pygame.draw.line(
                 gradient_surface,
@@ -1037,14 +1173,14 @@ class EnhancedGameCard:
         # Add subtle inner border
         pygame.draw.rect(
             surface,
-            (*color_top, 150),  # Semi-transparent
+            self.theme.get_alpha(top_name, 150),  # Semi-transparent
             self.rect,
             border_radius=self.theme.border_radius,
             width=1
         )
         
         # Draw glow effect for featured games
-        if self.glow_effect:
+        if self.glow_effect and self.glow_passes:
             glow_rect = self.rect.inflate(10, 10)
             
             # Create glow surface with alpha
@@ -1057,14 +1193,11 @@ class EnhancedGameCard:
             else:
                 glow_alpha = 150
             
-            # Get glow color
-            glow_color = self.theme.get_color("accent")
-            
             # Draw multiple rects with decreasing alpha for glow effect
-            for i in range(4):
+            for i in range(self.glow_passes):
                 pygame.draw.rect(
                     glow_surface,
-                    (*glow_color, glow_alpha - i * 30),  # Decreasing alpha
+                    self.theme.get_alpha("accent", glow_alpha - i * 30),  # Decreasing alpha
                     pygame.Rect(i, i, glow_rect.width - i * 2, glow_rect.height - i * 2),
                     border_radius=self.theme.border_radius + 5,
                     width=2
@@ -1121,14 +1254,9 @@ class EnhancedGameCard:
         surface.blit(thumbnail_bg, self.thumbnail_rect)
         
         # Draw thumbnail with slight transparency
-        if hasattr(self, 'scaled_thumbnail') and self.scaled_thumbnail:
-            thumbnail_alpha = pygame.Surface(self.scaled_thumbnail.get_size(), pygame.SRCALPHA)
-            thumbnail_alpha.fill((255, 255, 255, 220))  # Slight transparency
-            
-            # Apply thumbnail
-            thumbnail_copy = self.scaled_thumbnail.copy()
-            thumbnail_copy.blit(thumbnail_alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            surface.blit(thumbnail_copy, self.thumbnail_rect)
+        self._load_thumbnail()
+        if self.scaled_thumbnail:
+            audited_blit(surface, self.scaled_thumbnail, self.thumbnail_rect, "EnhancedGameCard.thumbnail")
         
         # Draw thumbnail border
         pygame.draw.rect(
@@ -1234,17 +1362,10 @@ class EnhancedGameCard:
             
             # Get gradient colors
             badge_color_top = self.theme.get_color("warning")
-            badge_color_bottom = tuple(max(0, c - 40) for c in badge_color_top)
+            badge_color_bottom = self.theme.get_shade("warning", 40)
             
             # Draw vertical gradient
-            for y in range(badge_bg_rect.height):
-                # Calculate color for this line
-                progress = y / badge_bg_rect.height
-                color = tuple(
-                    int(badge_color_top[i] * (1 - progress) + badge_color_bottom[i] * progress)
-                    for i in range(3)
-                )
-                
+            for y, color in enumerate(self.theme.get_gradient(badge_color_top, badge_color_bottom, badge_bg_rect.height)):
                 # Draw horizontal line with this color
                 pygame.draw.line(
                     badge_gradient,
@@ -1319,17 +1440,10 @@ class EnhancedGameCard:
                     
                     # Get gradient colors
                     star_color_top = self.theme.get_color("warning")
-                    star_color_bottom = tuple(max(0, c - 30) for c in star_color_top)
+                    star_color_bottom = self.theme.get_shade("warning", 30)
                     
                     # Draw vertical gradient
-                    for y in range(star_size):
-                        # Calculate color for this line
-                        progress = y / star_size
-                        color = tuple(
-                            int(star_color_top[i] * (1 - progress) + star_color_bottom[i] * progress)
-                            for i in range(3)
-                        )
-                        
+                    for y, color in enumerate(self.theme.get_gradient(star_color_top, star_color_bottom, star_size)):
                         # Draw horizontal line with this color
                         pygame.draw.line(
                             star_gradient,
@@ -1404,6 +1518,26 @@ class EnhancedGameCard:
                         1
                     )
     
+    def set_quality(self, tier: int):
+        """
+        Apply a visual quality tier.
+        
+        Args:
+            tier: Quality tier from the quality governor
+        """
+        self.glow_passes = CARD_GLOW_PASSES[tier]
+    
+    def is_animating(self) -> bool:
+        """
+        Check whether the card has animations in progress.
+        
+        The new release glow pulse is ambient and not reported here.
+        
+        Returns:
+            True if the hover/press animation is still running
+        """
+        return self.animation_progress != self.animation_target
+    
     def _start_animation(self, target: float):
         """
         Start a new animation.
@@ -1411,27 +1545,14 @@ class EnhancedGameCard:
         Args:
             target: Target animation value
         """
-        self.animation_start_time = time.time()
         self.animation_target = target
+        self.scheduler.tween(self, "animation_progress", target, self.animation_duration)
     
     def _update_animations(self):
         """Update all animations."""
-        current_time = time.time()
-        
-        # Update main animation
-        elapsed = current_time - self.animation_start_time
-        progress = min(1.0, elapsed / self.animation_duration)
-        
-        # Smooth easing function
-        eased_progress = progress * (2 - progress)
-        
-        # Update animation progress
-        start_value = self.animation_progress
-        target_value = self.animation_target
-        self.animation_progress = start_value + (target_value - start_value) * eased_progress
-        
-        # Update pulse effect
-        self.pulse_time = current_time
+        # Update pulse effect from the shared frame clock
+        if self.pulse_effect:
+            self.pulse_time = self.scheduler.now
     
     def _get_star_points(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
         """
@@ -1495,11 +1616,12 @@ class MouseController:
         # Tracking for animations and effects
         self.last_click_time = 0
         self.last_click_position = (0, 0)
-        self.click_animations = []
+        self.click_animations = EffectPool(CLICK_ANIMATION_CAPACITY)
+        self.click_frames = get_effect_frames(30, (255, 255, 255), 2)
         
-        # Performance tracking (for Doherty Threshold)
+        # Performance tracking (for Doherty Threshold), most recent samples only
         self.interaction_start_time = 0
-        self.response_times = []
+        self.response_times = deque(maxlen=RESPONSE_TIME_SAMPLES)
         
         # Load default cursors
         self._load_default_cursors()
@@ -1607,19 +1729,25 @@ class MouseController:
             'drag_offset': (0, 0)
         })
     
-    def update(self, events: List[pygame.event.Event]) -> Dict:
+    def update(self, events: List[pygame.event.Event],
+              mouse_pos: Tuple[int, int] = None,
+              mouse_buttons: Tuple[bool, bool, bool] = None) -> Dict:
         """
         Update the mouse controller state based on pygame events.
         Implements Doherty Threshold by ensuring responsive feedback.
         
         Args:
             events: List of pygame events to process
+            mouse_pos: Final cursor position for this batch (queried if omitted)
+            mouse_buttons: Final button state for this batch (queried if omitted)
             
         Returns:
             Dictionary containing information about mouse interactions
         """
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_buttons = pygame.mouse.get_pressed()
+        if mouse_pos is None:
+            mouse_pos = get_mouse_pos()
+        if mouse_buttons is None:
+            mouse_buttons = pygame.mouse.get_pressed()
         
         # Track interactions for performance metrics
         current_time = time.time()
@@ -1653,12 +1781,15 @@ class MouseController:
         for event in events:
             # Click events
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # Use the position the click happened at, which may differ
+                # from the final cursor position of a batched frame
+                click_pos = getattr(event, 'pos', mouse_pos)
                 self.interaction_start_time = current_time
-                self.last_click_position = mouse_pos
+                self.last_click_position = click_pos
                 
                 # Check for clicks on elements
                 for element in self.clickable_elements:
-                    if element['rect'].collidepoint(mouse_pos):
+                    if element['rect'].collidepoint(click_pos):
                         element['is_clicked'] = True
                         self.set_cursor(MouseState.CLICK)
                         
@@ -1676,7 +1807,7 @@ class MouseController:
                         
                         # Add visual feedback (Aesthetic-Usability Effect)
                         if self.visual_feedback_enabled:
-                            self._add_click_animation(mouse_pos)
+                            self._add_click_animation(click_pos)
                         
                         # Record response time
                         response_time = (time.time() - start_time) * 1000  # ms
@@ -1686,16 +1817,16 @@ class MouseController:
                 
                 # Check for drag starts
                 for element in self.draggable_elements:
-                    if element['rect'].collidepoint(mouse_pos):
+                    if element['rect'].collidepoint(click_pos):
                         element['is_dragging'] = True
                         element['drag_offset'] = (
-                            mouse_pos[0] - element['rect'].x,
-                            mouse_pos[1] - element['rect'].y
+                            click_pos[0] - element['rect'].x,
+                            click_pos[1] - element['rect'].y
                         )
                         self.set_cursor(MouseState.DRAG)
                         
                         if element['drag_start_callback']:
-                            element['drag_start_callback'](mouse_pos)
+                            element['drag_start_callback'](click_pos)
             
             # Release events
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -1754,34 +1885,22 @@ class MouseController:
         Args:
             position: (x, y) position for the animation
         """
-        self.click_animations.append({
-            'position': position,
-            'start_time': time.time(),
-            'duration': 0.3,  # seconds
-            'radius': 0,
-            'max_radius': 30,
-            'color': (255, 255, 255, 255)  # RGBA
-        })
+        self.click_animations.spawn(position, self.click_frames, 0.3, get_animation_scheduler().now)
     
     def _update_animations(self):
         """Update all active animations."""
-        current_time = time.time()
+        # Retire finished click animations
+        if self.click_animations:
+            self.click_animations.update(get_animation_scheduler().now)
+    
+    def is_animating(self) -> bool:
+        """
+        Check whether click animations are still running.
         
-        # Update click animations
-        for i in range(len(self.click_animations) - 1, -1, -1):
-            anim = self.click_animations[i]
-            elapsed = current_time - anim['start_time']
-            
-            if elapsed >= anim['duration']:
-                # Remove completed animations
-                self.click_animations.pop(i)
-            else:
-                # Update animation properties
-                progress = elapsed / anim['duration']
-                anim['radius'] = int(anim['max_radius'] * progress)
-                # Fade out
-                alpha = int(255 * (1 - progress))
-                anim['color'] = (anim['color'][0], anim['color'][1], anim['color'][2], alpha)
+        Returns:
+            True if any click animation is active
+        """
+        return bool(self.click_animations)
     
     def draw_effects(self, surface: pygame.Surface):
         """
@@ -1792,23 +1911,7 @@ class MouseController:
             surface: Pygame surface to draw on
         """
         # Draw click animations
-        for anim in self.click_animations:
-            # Create a surface for the circle with alpha
-            anim_surface = pygame.Surface((anim['radius'] * 2, anim['radius'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                anim_surface,
-                anim['color'],
-                (anim['radius'], anim['radius']),
-                anim['radius'],
-                2  # Line width
-            )
-            
-            # Position the animation centered on the click
-            pos = (
-                anim['position'][0] - anim['radius'],
-                anim['position'][1] - anim['radius']
-            )
-            surface.blit(anim_surface, pos)
+        self.click_animations.draw(surface, get_animation_scheduler().now)
     
     def get_performance_metrics(self) -> Dict:
         """
@@ -1827,5 +1930,5 @@ class MouseController:
         return {
             'average_response_time': avg_response_time,
             'meets_doherty_threshold': meets_threshold,
-            'response_times': self.response_times[-10:]  # Last 10 responses
+            'response_times': list(self.response_times)[-10:]  # Last 10 responses
         }
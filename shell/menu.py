@@ -6,7 +6,12 @@ This module implements the main menu interface for the arcade.
 
 import pygame
 from core.config import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, PRIMARY_COLOR, SECONDARY_COLOR, TEXT_COLOR, GAME_LIST
-from core.asset_loader import load_font, create_gradient_background, create_rounded_rect_image
+from core.asset_loader import load_font, create_rounded_rect_image
+from core.background_cache import BackgroundSpec, get_background
+from core.idle import IdleTracker
+from core.thumbnail_service import get_thumbnail_service
+from core.surface_audit import audited_blit
+from core.render_scaler import get_mouse_pos
 from shell.ui_elements import Button, TextLabel, GameCard
 
 class ShellMenu:
@@ -26,13 +31,15 @@ class ShellMenu:
         self.labels = []
         self.game_cards = []
         
-        # Create background
-        self.background = create_gradient_background(
-            SCREEN_WIDTH, 
-            SCREEN_HEIGHT, 
-            (18, 18, 37),  # Dark blue-purple
-            (30, 30, 60)   # Slightly lighter blue-purple
-        )
+        # Create background (rendered once, then loaded from the background cache)
+        self.background = get_background(BackgroundSpec(
+            'gradient',
+            (SCREEN_WIDTH, SCREEN_HEIGHT),
+            (
+                (18, 18, 37),  # Dark blue-purple
+                (30, 30, 60)   # Slightly lighter blue-purple
+            )
+        ))
         
         # Create title label
         title_font = load_font("Arial", 48)
@@ -69,6 +76,9 @@ class ShellMenu:
             SCREEN_HEIGHT - 30
         )
         self.labels.append(footer_label)
+        
+        # User activity, used to let the menu go idle
+        self.idle_tracker = IdleTracker()
     
     def _create_game_cards(self):
         """Create cards for each available game."""
@@ -106,8 +116,8 @@ class ShellMenu:
     
     def reset(self):
         """Reset the menu state."""
-        # Nothing to reset for now
-        pass
+        # Returning to the menu counts as activity
+        self.idle_tracker.reset()
     
     def handle_event(self, event):
         """
@@ -116,6 +126,8 @@ class ShellMenu:
         Args:
             event (pygame.event.Event): The event to handle
         """
+        self.idle_tracker.notify(event)
+        
         # Handle button clicks
         if event.type == pygame.MOUSEBUTTONDOWN:
             for button in self.buttons:
@@ -123,20 +135,37 @@ class ShellMenu:
             
             for card in self.game_cards:
                 card.check_click(event.pos)
-        
-        # Update button hover states
-        if event.type == pygame.MOUSEMOTION:
-            for button in self.buttons:
-                button.update(event.pos)
-            
-            for card in self.game_cards:
-                card.update(event.pos)
     
     def update(self):
         """Update the menu state."""
         # Update labels
         for label in self.labels:
             label.update()
+        
+        # Update hover states every frame so hover animations run to completion
+        mouse_pos = get_mouse_pos()
+        for button in self.buttons:
+            button.update(mouse_pos)
+        
+        for card in self.game_cards:
+            card.update(mouse_pos)
+    
+    def is_animating(self):
+        """
+        Check whether the menu needs to redraw at full frame rate.
+        
+        Returns:
+            bool: True while the user is active, an element is animating or thumbnails are loading
+        """
+        # The label pulse only holds full rate while the user is active
+        if self.idle_tracker.is_active():
+            return True
+        
+        for element in self.buttons + self.game_cards:
+            if element.is_animating():
+                return True
+        
+        return get_thumbnail_service().has_pending()
     
     def render(self, screen):
         """
@@ -146,7 +175,7 @@ class ShellMenu:
             screen (pygame.Surface): The surface to render on
         """
         # Draw the background
-        screen.blit(self.background, (0, 0))
+        audited_blit(screen, self.background, (0, 0), "ShellMenu.background")
         
         # Draw decorative elements
         self._draw_decorations(screen)
@@ -7,6 +7,42 @@ This module provides UI elements for the shell interface.
 import pygame
 import math
 from core.asset_loader import load_font, create_rounded_rect_image
+from core.thumbnail_service import get_thumbnail_service, get_thumbnail_path
+from core.animation import get_animation_scheduler
+from core.surface_audit import audited_blit
+
+# Hover zoom is drawn from frames precomputed between 1.0 and HOVER_ZOOM_SCALE
+HOVER_ZOOM_SCALE = 1.05
+HOVER_ZOOM_STEPS = 8
+
+# Seconds the hover zoom takes to reach its target
+HOVER_ZOOM_DURATION = 0.25
+
+def get_zoom_step(scale):
+    """
+    Get the precomputed zoom frame nearest to a scale.
+    
+    Args:
+        scale (float): The current scale
+    
+    Returns:
+        int: Frame index between 0 and HOVER_ZOOM_STEPS - 1
+    """
+    progress = (scale - 1.0) / (HOVER_ZOOM_SCALE - 1.0)
+    step = int(round(progress * (HOVER_ZOOM_STEPS - 1)))
+    return max(0, min(HOVER_ZOOM_STEPS - 1, step))
+
+def get_zoom_scale(step):
+    """
+    Get the scale of a precomputed zoom frame.
+    
+    Args:
+        step (int): Frame index
+    
+    Returns:
+        float: The scale the frame is composed at
+    """
+    return 1.0 + (HOVER_ZOOM_SCALE - 1.0) * step / (HOVER_ZOOM_STEPS - 1)
 
 class Button:
     """A clickable button UI element."""
@@ -49,7 +85,10 @@ class Button:
         # Animation properties
         self.scale = 1.0
         self.target_scale = 1.0
-        self.scale_speed = 0.2
+        self.scale_duration = HOVER_ZOOM_DURATION
+        
+        # Composed zoom frames keyed by (hovered, step), built on first use
+        self.zoom_frames = {}
         
         # Create default background if none provided
         if not self.background_image:
@@ -98,62 +137,90 @@ class Button:
         
         # Set target scale based on hover state
         if self.is_hovered:
-            self.target_scale = 1.05
+            target_scale = HOVER_ZOOM_SCALE
         else:
-            self.target_scale = 1.0
+            target_scale = 1.0
         
-        # Animate scale
-        if self.scale != self.target_scale:
-            self.scale += (self.target_scale - self.scale) * self.scale_speed
+        # Animate scale on the shared animation clock when the target changes
+        if target_scale != self.target_scale:
+            self.target_scale = target_scale
+            get_animation_scheduler().tween(self, "scale", target_scale, self.scale_duration)
     
-    def draw(self, screen):
+    def is_animating(self):
         """
-        Draw the button.
+        Check whether the hover animation is still running.
+        
+        Returns:
+            bool: True if the scale has not reached its target
+        """
+        return self.scale != self.target_scale
+    
+    def _get_zoom_frame(self, hovered, step):
+        """
+        Get a composed zoom frame, building it on first use.
         
         Args:
-            screen (pygame.Surface): The surface to draw on
+            hovered (bool): Whether the frame uses the hover background
+            step (int): Zoom frame index
+        
+        Returns:
+            tuple: (surface, (x, y) offset from the button position)
         """
-        # Calculate scaled dimensions
-        scaled_width = int(self.width * self.scale)
-        scaled_height = int(self.height * self.scale)
+        key = (hovered, step)
+        frame = self.zoom_frames.get(key)
+        if frame is None:
+            frame = self.zoom_frames[key] = self._compose_frame(hovered, get_zoom_scale(step))
+        return frame
+    
+    def _compose_frame(self, hovered, scale):
+        """
+        Compose the background and text of the button at one scale.
         
-        # Calculate position to keep button centered during scaling
-        scaled_x = self.x + (self.width - scaled_width) // 2
-        scaled_y = self.y + (self.height - scaled_height) // 2
+        Args:
+            hovered (bool): Whether to use the hover background
+            scale (float): The scale to compose at
         
-        # Create scaled rect
-        scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
+        Returns:
+            tuple: (surface, (x, y) offset from the button position)
+        """
+        # Calculate scaled dimensions, centered on the unscaled button
+        scaled_width = int(self.width * scale)
+        scaled_height = int(self.height * scale)
+        scaled_rect = pygame.Rect(
+            (self.width - scaled_width) // 2,
+            (self.height - scaled_height) // 2,
+            scaled_width,
+            scaled_height
+        )
+        
+        # The text is rendered at its native size and may overflow the button
+        text_surface = self.font.render(self.text, True, self.text_color)
+        text_rect = text_surface.get_rect(center=scaled_rect.center)
+        bounds = scaled_rect.union(text_rect)
+        
+        frame = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        scaled_rect.move_ip(-bounds.x, -bounds.y)
+        text_rect.move_ip(-bounds.x, -bounds.y)
         
         # Draw the button background
-        if self.background_image:
-            # Scale the background image
-            bg_to_use = self.hover_background if self.is_hovered else self.background_image
-            try:
-                scaled_bg = pygame.transform.scale(bg_to_use, (scaled_width, scaled_height))
-                screen.blit(scaled_bg, scaled_rect)
-            except (pygame.error, ValueError):
-                # Fallback if scaling fails
-                if self.is_hovered:
-                    hover_color = tuple(min(c + 30, 255) for c in self.color)
-                    pygame.draw.rect(screen, hover_color, scaled_rect, border_radius=10)
-                else:
-                    pygame.draw.rect(screen, self.color, scaled_rect, border_radius=10)
-        else:
-            # Draw a simple rectangle if no background image
-            if self.is_hovered:
-                # Lighten the color when hovered
-                hover_color = tuple(min(c + 30, 255) for c in self.color)
-                pygame.draw.rect(screen, hover_color, scaled_rect, border_radius=10)
-            else:
-                pygame.draw.rect(screen, self.color, scaled_rect, border_radius=10)
-            
-            # Draw the button border
-            pygame.draw.rect(screen, (255, 255, 255), scaled_rect, 2, border_radius=10)
+        bg_to_use = self.hover_background if hovered else self.background_image
+        frame.blit(pygame.transform.scale(bg_to_use, scaled_rect.size), scaled_rect)
         
         # Draw the text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=scaled_rect.center)
-        screen.blit(text_surface, text_rect)
+        frame.blit(text_surface, text_rect)
+        
+        return frame, bounds.topleft
+    
+    def draw(self, screen):
+        """
+        Draw the button.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+        """
+        # Draw the precomputed frame nearest to the current scale
+        frame, offset = self._get_zoom_frame(self.is_hovered, get_zoom_step(self.scale))
+        audited_blit(screen, frame, (self.x + offset[0], self.y + offset[1]), "Button")
 
 class TextLabel:
     """A text label UI element."""
@@ -271,10 +338,11 @@ class GameCard:
         # Animation properties
         self.scale = 1.0
         self.target_scale = 1.0
-        self.scale_speed = 0.2
+        self.scale_duration = HOVER_ZOOM_DURATION
         
         # Load the thumbnail
         self.thumbnail = None
+        self.thumbnail_size = (160, 120)
         self._load_thumbnail()
         
         # Create fonts
@@ -300,32 +368,22 @@ class GameCard:
             coming_soon_text = coming_soon_font.render("Coming Soon", True, (255, 255, 255))
             coming_soon_rect = coming_soon_text.get_rect(center=(width // 2, height // 2))
             self.overlay.blit(coming_soon_text, coming_soon_rect)
+        
+        # Render the text once; it is composed into every zoom frame
+        self.title_surface = self.title_font.render(game_info["name"], True, (255, 255, 255))
+        self.desc_surface = self.desc_font.render(game_info["description"], True, (200, 200, 200))
+        
+        # Composed zoom frames keyed by (hovered, step), built on first use and
+        # dropped when the thumbnail service swaps in a new thumbnail
+        self.zoom_frames = {}
+        self.frames_thumbnail = self.thumbnail
     
     def _load_thumbnail(self):
-        """Load the thumbnail image."""
-        try:
-            import os
-            from core.asset_loader import load_image
-            
-            # Try to load the thumbnail
-            thumbnail_path = os.path.join("games", self.game_info["id"], "assets", "thumbnail.png")
-            if os.path.exists(thumbnail_path):
-                self.thumbnail = pygame.image.load(thumbnail_path)
-            else:
-                # Create a placeholder thumbnail
-                self.thumbnail = pygame.Surface((160, 120))
-                self.thumbnail.fill((50, 50, 80))
-                
-                # Add the game name
-                font = pygame.font.SysFont("Arial", 18)
-                text = font.render(self.game_info["name"], True, (255, 255, 255))
-                text_rect = text.get_rect(center=(80, 60))
-                self.thumbnail.blit(text, text_rect)
-        except Exception as e:
-            print(f"Error loading thumbnail for {self.game_info['name']}: {e}")
-            # Create a placeholder thumbnail
-            self.thumbnail = pygame.Surface((160, 120))
-            self.thumbnail.fill((50, 50, 80))
+        """Request the thumbnail from the shared thumbnail service."""
+        self.thumbnail_path = get_thumbnail_path(self.game_info["id"])
+        self.thumbnail = get_thumbnail_service().get(
+            self.game_info["id"], self.thumbnail_path, self.thumbnail_size
+        )
     
     def check_click(self, pos):
         """
@@ -355,70 +413,106 @@ class GameCard:
         
         # Set target scale based on hover state
         if self.is_hovered and not self.not_implemented:
-            self.target_scale = 1.05
+            target_scale = HOVER_ZOOM_SCALE
         else:
-            self.target_scale = 1.0
+            target_scale = 1.0
         
-        # Animate scale
-        if self.scale != self.target_scale:
-            self.scale += (self.target_scale - self.scale) * self.scale_speed
+        # Animate scale on the shared animation clock when the target changes
+        if target_scale != self.target_scale:
+            self.target_scale = target_scale
+            get_animation_scheduler().tween(self, "scale", target_scale, self.scale_duration)
     
-    def draw(self, screen):
+    def is_animating(self):
         """
-        Draw the card.
+        Check whether the hover animation is still running.
+        
+        Returns:
+            bool: True if the scale has not reached its target
+        """
+        return self.scale != self.target_scale
+    
+    def _get_zoom_frame(self, hovered, step):
+        """
+        Get a composed zoom frame, building it on first use.
         
         Args:
-            screen (pygame.Surface): The surface to draw on
+            hovered (bool): Whether the frame uses the hover background
+            step (int): Zoom frame index
+        
+        Returns:
+            tuple: (surface, (x, y) offset from the card position)
         """
-        # Calculate scaled dimensions
-        scaled_width = int(self.width * self.scale)
-        scaled_height = int(self.height * self.scale)
+        key = (hovered, step)
+        frame = self.zoom_frames.get(key)
+        if frame is None:
+            frame = self.zoom_frames[key] = self._compose_frame(hovered, get_zoom_scale(step))
+        return frame
+    
+    def _compose_frame(self, hovered, scale):
+        """
+        Compose the background, thumbnail, text and overlay of the card at one scale.
         
-        # Calculate position to keep card centered during scaling
-        scaled_x = self.x + (self.width - scaled_width) // 2
-        scaled_y = self.y + (self.height - scaled_height) // 2
+        Args:
+            hovered (bool): Whether to use the hover background
+            scale (float): The scale to compose at
         
-        # Create scaled rect
+        Returns:
+            tuple: (surface, (x, y) offset from the card position)
+        """
+        # Calculate scaled dimensions, centered on the unscaled card
+        scaled_width = int(self.width * scale)
+        scaled_height = int(self.height * scale)
+        scaled_x = (self.width - scaled_width) // 2
+        scaled_y = (self.height - scaled_height) // 2
         scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
         
+        # The text keeps its native size and may overflow the card
+        title_rect = self.title_surface.get_rect(center=(scaled_x + scaled_width // 2, scaled_y + scaled_height - 40))
+        desc_rect = self.desc_surface.get_rect(center=(scaled_x + scaled_width // 2, scaled_y + scaled_height - 20))
+        bounds = scaled_rect.union(title_rect).union(desc_rect)
+        
+        frame = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        origin_x, origin_y = -bounds.x, -bounds.y
+        scaled_rect.move_ip(origin_x, origin_y)
+        
         # Draw the card background
-        bg_to_use = self.hover_background if self.is_hovered else self.background
-        try:
-            scaled_bg = pygame.transform.scale(bg_to_use, (scaled_width, scaled_height))
-            screen.blit(scaled_bg, scaled_rect)
-        except (pygame.error, ValueError):
-            # Fallback if scaling fails
-            pygame.draw.rect(screen, (30, 30, 60), scaled_rect, border_radius=10)
+        bg_to_use = self.hover_background if hovered else self.background
+        frame.blit(pygame.transform.scale(bg_to_use, scaled_rect.size), scaled_rect)
         
         # Draw the thumbnail
         if self.thumbnail:
-            # Scale the thumbnail
-            thumbnail_width = int(160 * self.scale)
-            thumbnail_height = int(120 * self.scale)
-            try:
-                scaled_thumbnail = pygame.transform.scale(self.thumbnail, (thumbnail_width, thumbnail_height))
-                thumbnail_x = scaled_x + (scaled_width - thumbnail_width) // 2
-                thumbnail_y = scaled_y + 10
-                screen.blit(scaled_thumbnail, (thumbnail_x, thumbnail_y))
-            except (pygame.error, ValueError):
-                # Fallback if scaling fails
-                pass
-        
-        # Draw the title
-        title_text = self.title_font.render(self.game_info["name"], True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(scaled_x + scaled_width // 2, scaled_y + scaled_height - 40))
-        screen.blit(title_text, title_rect)
-        
-        # Draw the description
-        desc_text = self.desc_font.render(self.game_info["description"], True, (200, 200, 200))
-        desc_rect = desc_text.get_rect(center=(scaled_x + scaled_width // 2, scaled_y + scaled_height - 20))
-        screen.blit(desc_text, desc_rect)
+            thumbnail_width = int(self.thumbnail_size[0] * scale)
+            thumbnail_height = int(self.thumbnail_size[1] * scale)
+            scaled_thumbnail = pygame.transform.scale(self.thumbnail, (thumbnail_width, thumbnail_height))
+            thumbnail_x = scaled_rect.x + (scaled_width - thumbnail_width) // 2
+            thumbnail_y = scaled_rect.y + 10
+            frame.blit(scaled_thumbnail, (thumbnail_x, thumbnail_y))
+        
+        # Draw the title and description
+        frame.blit(self.title_surface, title_rect.move(origin_x, origin_y))
+        frame.blit(self.desc_surface, desc_rect.move(origin_x, origin_y))
         
         # Draw the "Not Implemented" overlay if needed
         if self.not_implemented:
-            try:
-                scaled_overlay = pygame.transform.scale(self.overlay, (scaled_width, scaled_height))
-                screen.blit(scaled_overlay, scaled_rect)
-            except (pygame.error, ValueError):
-                # Fallback if scaling fails
-                pass
+            frame.blit(pygame.transform.scale(self.overlay, scaled_rect.size), scaled_rect)
+        
+        return frame, bounds.topleft
+    
+    def draw(self, screen):
+        """
+        Draw the card.
+        
+        Args:
+            screen (pygame.Surface): The surface to draw on
+        """
+        # Rebuild the frames when the service swaps in the real thumbnail
+        self.thumbnail = get_thumbnail_service().get(
+            self.game_info["id"], self.thumbnail_path, self.thumbnail_size
+        )
+        if self.thumbnail is not self.frames_thumbnail:
+            self.zoom_frames.clear()
+            self.frames_thumbnail = self.thumbnail
+        
+        # Draw the precomputed frame nearest to the current scale
+        frame, offset = self._get_zoom_frame(self.is_hovered, get_zoom_step(self.scale))
+        audited_blit(screen, frame, (self.x + offset[0], self.y + offset[1]), "GameCard")
@@ -13,6 +13,7 @@ from typing import List, Dict, Tuple
 
 # Import enhanced UI components
 from shell.enhanced_ui_elements import UITheme, EnhancedButton, EnhancedTextLabel, EnhancedGameCard, MouseController
+from core.animation import get_animation_scheduler
 
 def test_enhanced_ui():
     """Test the enhanced UI components."""
@@ -274,6 +275,9 @@ def test_enhanced_ui():
                 if event.type == pygame.QUIT:
                     running = False
             
+            # Advance the shared UI animations to this frame
+            get_animation_scheduler().tick()
+            
             # Update mouse controller
             mouse_info = mouse.update(events)
             mouse_pos = mouse_info["position"]